@@ -0,0 +1,5 @@
+__all__ = ["get", "getDPI", "get_info", "ImageInfo", "__version__"]
+
+__version__ = "2.0.1"
+
+from .imagesize import ImageInfo, get, getDPI, get_info
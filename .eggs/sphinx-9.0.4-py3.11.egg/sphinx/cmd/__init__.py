@@ -0,0 +1 @@
+"""Modules for command line executables."""
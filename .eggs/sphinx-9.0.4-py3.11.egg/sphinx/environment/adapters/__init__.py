@@ -0,0 +1 @@
+"""Sphinx environment adapters"""
@@ -0,0 +1 @@
+"""Contains Sphinx features not activated by default."""
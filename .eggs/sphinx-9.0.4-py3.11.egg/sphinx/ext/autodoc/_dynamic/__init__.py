@@ -0,0 +1 @@
+"""The dynamic (import-based) backend for autodoc."""
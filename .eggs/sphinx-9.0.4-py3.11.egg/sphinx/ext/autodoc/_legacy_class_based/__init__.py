@@ -0,0 +1 @@
+"""The legacy (class-based) implementation of autodoc."""
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from sphinx.ext.autodoc._dynamic._mock import (
+    MockFinder,  # NoQA: F401
+    MockLoader,  # NoQA: F401
+    _make_subclass,  # NoQA: F401
+    _MockModule,  # NoQA: F401
+    _MockObject,  # NoQA: F401
+    ismock,  # NoQA: F401
+    ismockmodule,  # NoQA: F401
+    mock,  # NoQA: F401
+    undecorate,  # NoQA: F401
+)
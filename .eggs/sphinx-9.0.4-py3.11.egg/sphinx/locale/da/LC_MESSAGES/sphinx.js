@@ -0,0 +1,63 @@
+Documentation.addTranslations({
+    "locale": "da",
+    "messages": {
+        "%(filename)s &#8212; %(docstitle)s": "%(filename)s &#8212; %(docstitle)s",
+        "&#169; %(copyright_prefix)s %(copyright)s.": "",
+        ", in ": ", i",
+        "About these documents": "Om disse dokumenter",
+        "Automatically generated list of changes in version %(version)s": "Automatisk oprettet liste af \u00e6ndringer i version %(version)s",
+        "C API changes": "\u00c6ndringer i C-API",
+        "Changes in Version %(version)s &#8212; %(docstitle)s": "\u00c6ndringer i version %(version)s &#8212; %(docstitle)s",
+        "Collapse sidebar": "Sammenfold sidebj\u00e6lke",
+        "Complete Table of Contents": "Fuldst\u00e6ndig indholdsfortegnelse",
+        "Contents": "Indhold",
+        "Copyright": "Ophavsret",
+        "Created using <a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.": "",
+        "Expand sidebar": "Udfold sidebj\u00e6lke",
+        "Full index on one page": "Fuldt indeks p\u00e5 \u00e9n side",
+        "General Index": "Generelt indeks",
+        "Global Module Index": "Globalt modulindeks",
+        "Go": "S\u00f8g",
+        "Hide Search Matches": "Skjul s\u00f8geresultater",
+        "Index": "Indeks",
+        "Index &#x2013; %(key)s": "",
+        "Index pages by letter": "Indeks\u00e9r sider efter bogstav",
+        "Indices and tables:": "Indeks og tabeller:",
+        "Last updated on %(last_updated)s.": "Sidst opdateret %(last_updated)s.",
+        "Library changes": "Biblioteks\u00e6ndringer",
+        "Navigation": "Navigation",
+        "Next topic": "N\u00e6ste emne",
+        "Other changes": "Andre \u00e6ndringer",
+        "Overview": "Oversigt",
+        "Please activate JavaScript to enable the search\n    functionality.": "Aktiv\u00e9r venligst JavaScript for at aktivere\n    s\u00f8gefunktionalitet.",
+        "Preparing search...": "Forbereder s\u00f8gning...",
+        "Previous topic": "Forrige emne",
+        "Quick search": "Hurtig s\u00f8gning",
+        "Search": "S\u00f8g",
+        "Search Page": "S\u00f8geside",
+        "Search Results": "S\u00f8geresultater",
+        "Search finished, found one page matching the search query.": [
+            "",
+            ""
+        ],
+        "Search within %(docstitle)s": "S\u00f8g i %(docstitle)s",
+        "Searching": "S\u00f8ger",
+        "Searching for multiple words only shows matches that contain\n    all words.": "Bem\u00e6rk: Hvis du s\u00f8ger efter flere ord, vises kun resultater der indeholder alle ordene.",
+        "Show Source": "Vis kilde",
+        "Table of Contents": "",
+        "This Page": "Denne side",
+        "Welcome! This is": "Velkommen! Dette er",
+        "Your search did not match any documents. Please make sure that all words are spelled correctly and that you've selected enough categories.": "Din s\u00f8gning matchede ikke nogen dokumenter. Sikr dig at alle ord er stavet korrekt og at du har valgt nok kategorier.",
+        "all functions, classes, terms": "alle funktioner, klasser, begreber",
+        "can be huge": "kan v\u00e6re enormt",
+        "last updated": "sidst opdateret",
+        "lists all sections and subsections": "viser alle afsnit og underafsnit",
+        "next chapter": "n\u00e6ste kapitel",
+        "previous chapter": "forrige kapitel",
+        "quick access to all modules": "hurtig adgang til alle moduler",
+        "search": "s\u00f8g",
+        "search this documentation": "s\u00f8g i denne dokumentation",
+        "the documentation for": "dokumentationen for"
+    },
+    "plural_expr": "(n != 1)"
+});
\ No newline at end of file
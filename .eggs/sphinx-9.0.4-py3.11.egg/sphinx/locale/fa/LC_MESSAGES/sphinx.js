@@ -0,0 +1,63 @@
+Documentation.addTranslations({
+    "locale": "fa",
+    "messages": {
+        "%(filename)s &#8212; %(docstitle)s": "%(filename)s &#8212; %(docstitle)s",
+        "&#169; %(copyright_prefix)s %(copyright)s.": "",
+        ", in ": "\u060c \u062f\u0631 ",
+        "About these documents": "\u062f\u0631\u0628\u0627\u0631\u0647 \u0627\u06cc\u0646 \u0645\u0633\u062a\u0646\u062f\u0627\u062a",
+        "Automatically generated list of changes in version %(version)s": "\u0644\u06cc\u0633\u062a \u062a\u0648\u0644\u06cc\u062f \u0634\u062f\u0647 \u062e\u0648\u062f\u06a9\u0627\u0631 \u0627\u0632 \u062a\u063a\u06cc\u06cc\u0631\u0627\u062a \u062f\u0631 \u0646\u0633\u062e\u0647 %(version)s",
+        "C API changes": "C API \u062a\u063a\u06cc\u06cc\u0631\u0627\u062a",
+        "Changes in Version %(version)s &#8212; %(docstitle)s": "\u062a\u063a\u06cc\u06cc\u0631\u0627\u062a \u062f\u0631 \u0646\u0633\u062e\u0647 %(version)s &#8212; %(docstitle)s",
+        "Collapse sidebar": "\u062a\u0627 \u06a9\u0631\u062f\u0646 \u0646\u0648\u0627\u0631 \u06a9\u0646\u0627\u0631\u0647",
+        "Complete Table of Contents": "\u0641\u0647\u0631\u0633\u062a \u06a9\u0627\u0645\u0644 \u0645\u0637\u0627\u0644\u0628",
+        "Contents": "\u0645\u062d\u062a\u0648\u0627 \u0647\u0627",
+        "Copyright": "\u06a9\u067e\u06cc \u0631\u0627\u06cc\u062a",
+        "Created using <a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.": "\u0627\u06cc\u062c\u0627\u062f \u0634\u062f\u0647 \u0628\u0627<a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.",
+        "Expand sidebar": "\u06af\u0633\u062a\u0631\u0634 \u0646\u0648\u0627\u0631 \u06a9\u0646\u0627\u0631\u0647",
+        "Full index on one page": "\u0641\u0647\u0631\u0633\u062a \u06a9\u0627\u0645\u0644 \u062f\u0631 \u06cc\u06a9 \u0635\u0641\u062d\u0647",
+        "General Index": "\u0641\u0647\u0631\u0633\u062a \u06a9\u0644\u06cc",
+        "Global Module Index": "\u0641\u0647\u0631\u0633\u062a \u06a9\u0644\u06cc \u0645\u0627\u0698\u0648\u0644 \u0647\u0627",
+        "Go": "\u0628\u0631\u0648",
+        "Hide Search Matches": "\u0639\u062f\u0645 \u0646\u0645\u0627\u06cc\u0634 \u0646\u062a\u0627\u06cc\u062c \u06cc\u0627\u0641\u062a \u0634\u062f\u0647",
+        "Index": "\u0641\u0647\u0631\u0633\u062a",
+        "Index &#x2013; %(key)s": "",
+        "Index pages by letter": "\u0641\u0647\u0631\u0633\u062a \u0635\u0641\u062d\u0627\u062a \u0628\u0631 \u0627\u0633\u0627\u0633 \u062d\u0631\u0648\u0641",
+        "Indices and tables:": "\u0627\u06cc\u0646\u062f\u06a9\u0633 \u0647\u0627 \u0648 \u062c\u062f\u0627\u0648\u0644:",
+        "Last updated on %(last_updated)s.": "\u0622\u062e\u0631\u06cc\u0646 \u0628\u0631\u0648\u0632 \u0631\u0633\u0627\u0646\u06cc \u062f\u0631 %(last_updated)s .",
+        "Library changes": "\u062a\u063a\u06cc\u06cc\u0631\u0627\u062a \u06a9\u062a\u0627\u0628\u062e\u0627\u0646\u0647 \u0627\u06cc\u06cc",
+        "Navigation": "\u0646\u0627\u0648\u0628\u0631\u06cc",
+        "Next topic": "\u0645\u0648\u0636\u0648\u0639  \u0628\u0639\u062f\u06cc",
+        "Other changes": "\u062f\u06af\u0631 \u062a\u063a\u06cc\u06cc\u0631\u0627\u062a",
+        "Overview": "\u0628\u0631\u0631\u0633\u06cc \u0627\u062c\u0645\u0627\u0644\u06cc",
+        "Please activate JavaScript to enable the search\n    functionality.": "\u0644\u0637\u0641\u0627\u064b \u0628\u0631\u0627\u06cc \u0641\u0639\u0651\u0627\u0644 \u06a9\u0631\u062f\u0646 \u06a9\u0627\u0631\u06a9\u0631\u062f \u062c\u0633\u062a\u062c\u0648\n\u062c\u0627\u0648\u0627 \u0627\u0633\u06a9\u0631\u06cc\u067e\u062a \u0631\u0627 \u0641\u0639\u0651\u0627\u0644 \u06a9\u0646\u06cc\u062f.",
+        "Preparing search...": "\u0622\u0645\u0627\u062f\u0647 \u0633\u0627\u0632\u06cc \u062c\u0633\u062a \u0648 \u062c\u0648...",
+        "Previous topic": "\u0645\u0648\u0636\u0648\u0639 \u0642\u0628\u0644\u06cc",
+        "Quick search": "\u062c\u0633\u062a\u062c\u0648 \u0633\u0631\u06cc\u0639",
+        "Search": "\u062c\u0633\u062a\u062c\u0648",
+        "Search Page": "\u0635\u0641\u062d\u0647 \u062c\u0633\u062a\u062c\u0648",
+        "Search Results": "\u0646\u062a\u0627\u06cc\u062c \u062c\u0633\u062a\u062c\u0648",
+        "Search finished, found one page matching the search query.": [
+            "",
+            ""
+        ],
+        "Search within %(docstitle)s": "\u062c\u0633\u062a\u062c\u0648 \u062f\u0631 %(docstitle)s",
+        "Searching": "\u062f\u0631 \u062d\u0627\u0644 \u062c\u0633\u062a \u0648 \u062c\u0648",
+        "Searching for multiple words only shows matches that contain\n    all words.": "\u062f\u0631 \u062d\u0627\u0644 \u062c\u0633\u062a\u062c\u0648 \u0628\u0631\u0627\u06cc \u0686\u0646\u062f\u06cc\u0646 \u0648\u0627\u0698\u0647. \u0641\u0642\u0637 \u0648\u0627\u0698\u06af\u0627\u0646\u06cc \u0631\u0627 \u0646\u0634\u0627\u0646 \u0645\u06cc\u200c\u062f\u0647\u062f \u06a9\u0647 \u0634\u0627\u0645\u0644 \u0627\u06cc\u0646 \u0645\u0648\u0627\u0631\u062f \u0628\u0627\u0634\u062f:\n    \u0647\u0645\u0647\u200c\u06cc \u06a9\u0644\u0645\u0647\u200c\u0647\u0627.",
+        "Show Source": "\u0646\u0645\u0627\u06cc\u0634 \u0633\u0648\u0631\u0633",
+        "Table of Contents": "\u0641\u0647\u0631\u0633\u062a \u0639\u0646\u0627\u0648\u06cc\u0646",
+        "This Page": "\u0635\u0641\u062d\u0647 \u0641\u0639\u0644\u06cc",
+        "Welcome! This is": "\u062e\u0648\u0634 \u0622\u0645\u062f\u06cc\u062f! \u0627\u06cc\u0646",
+        "Your search did not match any documents. Please make sure that all words are spelled correctly and that you've selected enough categories.": "\u062c\u0633\u062a\u062c\u0648\u06cc \u0634\u0645\u0627 \u0628\u0627 \u0647\u06cc\u0686 \u0633\u0646\u062f\u06cc \u0647\u0645 \u062e\u0648\u0627\u0646\u06cc \u0646\u062f\u0627\u0634\u062a. \u0644\u0637\u0641\u0627\u064b \u0627\u0637\u0645\u06cc\u0646\u0627\u0646 \u062d\u0627\u0635\u0644 \u06a9\u0646\u06cc\u062f \u06a9\u0647 \u0647\u0645\u0647 \u06cc \u0648\u0627\u0698\u0647 \u0647\u0627 \u0627\u0645\u0644\u0627\u06cc \u062f\u0631\u0633\u062a\u06cc \u062f\u0627\u0631\u0646\u062f \u0648 \u062f\u0633\u062a\u0647 \u0628\u0646\u062f\u06cc \u0647\u0627\u06cc \u06a9\u0627\u0641\u06cc \u0631\u0627 \u0627\u0646\u062a\u062e\u0627\u0628 \u06a9\u0631\u062f\u0647 \u0627\u06cc\u062f.",
+        "all functions, classes, terms": "\u062a\u0645\u0627\u0645\u06cc \u062a\u0648\u0627\u0628\u0639 \u060c \u06a9\u0644\u0627\u0633 \u0647\u0627 \u060c \u0627\u0635\u0637\u0644\u0627\u062d\u0627\u062a",
+        "can be huge": "\u0645\u0645\u06a9\u0646 \u0627\u0633\u062a \u0633\u062a\u0631\u06af \u0628\u0627\u0634\u062f",
+        "last updated": "\u0622\u062e\u0631\u06cc\u0646 \u0628\u0631\u0648\u0632\u0631\u0633\u0627\u0646\u06cc",
+        "lists all sections and subsections": "\u0641\u0647\u0631\u0633\u062a \u062a\u0645\u0627\u0645\u06cc \u0628\u062e\u0634 \u0647\u0627 \u0648 \u0632\u06cc\u0631 \u0645\u062c\u0645\u0648\u0639\u0647 \u0647\u0627",
+        "next chapter": "\u0641\u0635\u0644 \u0628\u0639\u062f\u06cc",
+        "previous chapter": "\u0641\u0635\u0644 \u0642\u0628\u0644\u06cc",
+        "quick access to all modules": "\u062f\u0633\u062a\u0631\u0633\u06cc \u0633\u0631\u06cc\u0639 \u0628\u0647 \u062a\u0645\u0627\u0645\u06cc \u0645\u062a\u062f\u0647\u0627",
+        "search": "\u062c\u0633\u062a\u062c\u0648",
+        "search this documentation": "\u062c\u0633\u062a\u062c\u0648 \u062f\u0631 \u0627\u06cc\u0646 \u0627\u0633\u0646\u0627\u062f",
+        "the documentation for": "\u0645\u0633\u062a\u0646\u062f\u0627\u062a \u0628\u0631\u0627\u06cc"
+    },
+    "plural_expr": "(n > 1)"
+});
\ No newline at end of file
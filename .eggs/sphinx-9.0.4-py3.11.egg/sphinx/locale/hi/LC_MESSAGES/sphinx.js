@@ -0,0 +1,63 @@
+Documentation.addTranslations({
+    "locale": "hi",
+    "messages": {
+        "%(filename)s &#8212; %(docstitle)s": "%(filename)s &#8212; %(docstitle)s",
+        "&#169; %(copyright_prefix)s %(copyright)s.": "",
+        ", in ": ", \u092e\u0947\u0902 ",
+        "About these documents": "\u0907\u0928 \u0932\u0947\u0916\u092a\u0924\u094d\u0930\u094b\u0902 \u0915\u0947 \u092c\u093e\u0930\u0947 \u092e\u0947\u0902",
+        "Automatically generated list of changes in version %(version)s": "\u0938\u0902\u0938\u094d\u0915\u0930\u0923 %(version)s \u092e\u0947\u0902 \u0938\u094d\u0935\u0924\u0903 \u0930\u091a\u093f\u0924 \u092a\u0930\u093f\u0935\u0930\u094d\u0924\u0928\u094b\u0902 \u0915\u0940 \u0938\u0942\u091a\u0940",
+        "C API changes": "\u0938\u0940 \u0910.\u092a\u0940.\u0906\u0908. \u092a\u0930\u093f\u0935\u0930\u094d\u0924\u0928",
+        "Changes in Version %(version)s &#8212; %(docstitle)s": "\u092a\u0930\u093f\u0935\u0930\u094d\u0924\u093f\u0924 \u0938\u0902\u0938\u094d\u0915\u0930\u0923 %(version)s &#8212; %(docstitle)s",
+        "Collapse sidebar": "\u0915\u093f\u0928\u093e\u0930\u0947 \u0915\u093e \u0938\u094d\u0925\u093e\u0928 \u0918\u091f\u093e\u090f\u0902",
+        "Complete Table of Contents": "\u0935\u093f\u0938\u094d\u0924\u0943\u0924 \u0935\u093f\u0937\u092f-\u0938\u0942\u091a\u0940",
+        "Contents": "\u0935\u093f\u0937\u092f \u0938\u093e\u092e\u093f\u0917\u094d\u0930\u0940",
+        "Copyright": "\u0938\u0930\u094d\u0935\u093e\u0927\u093f\u0915\u093e\u0930",
+        "Created using <a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.": "",
+        "Expand sidebar": "\u0915\u093f\u0928\u093e\u0930\u0947 \u0915\u093e \u0938\u094d\u0925\u093e\u0928 \u092c\u095d\u093e\u090f\u0902",
+        "Full index on one page": "\u090f\u0915 \u092a\u0943\u0937\u094d\u0920 \u092a\u0930 \u092a\u0942\u0930\u0940 \u0905\u0928\u0941\u0915\u094d\u0930\u092e\u0923\u093f\u0915\u093e",
+        "General Index": "\u0938\u093e\u092e\u093e\u0928\u094d\u092f \u0905\u0928\u0941\u0915\u094d\u0930\u092e\u093e\u0923\u093f\u0915\u093e",
+        "Global Module Index": "\u0938\u093e\u0930\u094d\u0935\u092d\u094c\u092e\u093f\u0915 \u092a\u094d\u0930\u092d\u093e\u0917 \u0938\u0942\u091a\u0940",
+        "Go": "\u091a\u0932\u093f\u090f",
+        "Hide Search Matches": "\u0916\u094b\u091c\u0947 \u0917\u090f \u091c\u094b\u095c\u0947 \u091b\u093f\u092a\u093e\u090f\u0902",
+        "Index": "\u0905\u0928\u0941\u0915\u094d\u0930\u092e\u0923\u093f\u0915\u093e",
+        "Index &#x2013; %(key)s": "",
+        "Index pages by letter": "\u0905\u0915\u094d\u0937\u0930 \u0926\u094d\u0935\u093e\u0930\u093e \u0905\u0928\u0941\u0915\u094d\u0930\u092e\u093f\u0924 \u092a\u0943\u0937\u094d\u0920",
+        "Indices and tables:": "\u0938\u0942\u091a\u093f\u092f\u093e\u0901 \u0914\u0930 \u0938\u093e\u0930\u0923\u093f\u092f\u093e\u0901:",
+        "Last updated on %(last_updated)s.": "\u0905\u0902\u0924\u093f\u092e \u092c\u093e\u0930 \u0938\u092e\u094d\u092a\u093e\u0926\u093f\u0924 %(last_updated)s.",
+        "Library changes": "\u092a\u0941\u0938\u094d\u0924\u0915\u093e\u0932\u092f \u092e\u0947\u0902 \u092a\u0930\u093f\u0935\u0930\u094d\u0924\u0928",
+        "Navigation": "\u0938\u0902\u091a\u093e\u0932\u0928",
+        "Next topic": "\u0905\u0917\u0932\u093e \u092a\u094d\u0930\u0915\u0930\u0923",
+        "Other changes": "\u0905\u0928\u094d\u092f \u092a\u0930\u093f\u0935\u0930\u094d\u0924\u0928",
+        "Overview": "\u0938\u093f\u0902\u0939\u093e\u0935\u0932\u094b\u0915\u0928",
+        "Please activate JavaScript to enable the search\n    functionality.": "\u0916\u094b\u091c \u0915\u093e\u0930\u094d\u092f \u0915\u0947 \u0932\u093f\u090f \u091c\u093e\u0935\u093e \u0938\u094d\u0915\u094d\u0930\u093f\u092a\u094d\u091f \u0915\u093e \u0939\u094b\u0928\u093e \u0906\u0935\u0936\u094d\u092f\u0915 \u0939\u0948. \u0915\u0943\u092a\u092f\u093e \u091c\u093e\u0935\u093e \u0938\u094d\u0915\u094d\u0930\u093f\u092a\u094d\u091f \u0915\u094b \u0936\u0941\u0930\u0942 \u0915\u0930\u0947\u0902.",
+        "Preparing search...": "\u0916\u094b\u091c \u0915\u0940 \u0924\u0948\u092f\u093e\u0930\u0940",
+        "Previous topic": "\u092a\u093f\u091b\u0932\u093e \u092a\u094d\u0930\u0915\u0930\u0923",
+        "Quick search": "\u0924\u094d\u0935\u0930\u093f\u0924 \u0916\u094b\u091c",
+        "Search": "\u0916\u094b\u091c",
+        "Search Page": "\u0916\u094b\u091c \u092a\u0943\u0937\u094d\u0920",
+        "Search Results": "\u0916\u094b\u091c \u092a\u0930\u0940\u0923\u093e\u092e ",
+        "Search finished, found one page matching the search query.": [
+            "",
+            ""
+        ],
+        "Search within %(docstitle)s": "%(docstitle)s \u092e\u0947\u0902 \u0916\u094b\u091c\u0947\u0902",
+        "Searching": "\u0916\u094b\u091c \u091c\u093e\u0930\u0940",
+        "Searching for multiple words only shows matches that contain\n    all words.": "",
+        "Show Source": "\u0938\u094d\u0930\u094b\u0924 \u0926\u093f\u0916\u093e\u090f\u0901",
+        "Table of Contents": "\u0935\u093f\u0937\u092f-\u0938\u0942\u091a\u0940",
+        "This Page": "\u092f\u0939 \u092a\u0943\u0937\u094d\u0920 ",
+        "Welcome! This is": "\u0928\u092e\u0938\u094d\u0924\u0947! \u092f\u0939 \u0939\u0948",
+        "Your search did not match any documents. Please make sure that all words are spelled correctly and that you've selected enough categories.": "\u0906\u092a\u0915\u0947 \u0916\u094b\u091c \u092a\u0930\u093f\u0923\u093e\u092e\u094b\u0902 \u092e\u0947\u0902 \u0915\u094b\u0908 \u092a\u094d\u0930\u0932\u0947\u0916 \u0928\u0939\u0940\u0902 \u092e\u093f\u0932\u093e. \u0915\u0943\u092a\u092f\u093e \u0938\u0941\u0928\u093f\u0936\u094d\u091a\u093f\u0924 \u0915\u0930\u0947\u0902 \u0915\u093f \u0938\u092d\u0940 \u0936\u092c\u094d\u0926\u094b\u0902 \u0915\u0940 \u0935\u0930\u094d\u0924\u0928\u0940 \u0936\u0941\u0926\u094d\u0927 \u0939\u0948 \u0914\u0930 \u0906\u092a\u0928\u0947 \u092f\u0925\u0947\u0937\u094d\u091f \u0936\u094d\u0930\u0947\u0923\u093f\u092f\u093e\u0902 \u091a\u0941\u0928\u0940 \u0939\u0948\u0902.",
+        "all functions, classes, terms": "\u0938\u092d\u0940 \u0915\u093e\u0930\u094d\u092f\u092f\u0941\u0915\u094d\u0924\u093f\u092f\u093e\u0902, \u0935\u0930\u094d\u0917, \u0936\u092c\u094d\u0926",
+        "can be huge": "\u092c\u0943\u0939\u0926\u093e\u0915\u093e\u0930 \u0939\u094b \u0938\u0915\u0924\u093e \u0939\u0948",
+        "last updated": "\u0905\u0902\u0924\u093f\u092e \u092a\u0930\u093f\u0935\u0930\u094d\u0927\u0928",
+        "lists all sections and subsections": "\u0938\u092d\u0940 \u0905\u0928\u0941\u092d\u093e\u0917\u094b\u0902 \u090f\u0935\u0902 \u0909\u092a-\u0905\u0928\u0941\u092d\u093e\u0917\u094b\u0902 \u0915\u0940 \u0938\u0942\u091a\u0940",
+        "next chapter": "\u0905\u0917\u0932\u093e \u0905\u0927\u094d\u092f\u093e\u092f",
+        "previous chapter": "\u092a\u093f\u091b\u0932\u093e \u0905\u0927\u094d\u092f\u093e\u092f",
+        "quick access to all modules": "\u0938\u092d\u0940 \u092a\u094d\u0930\u092d\u093e\u0917 \u0924\u0915 \u0924\u0941\u0930\u0902\u0924 \u092a\u0939\u0941\u0901\u091a",
+        "search": "\u0916\u094b\u091c",
+        "search this documentation": "\u0907\u0938 \u0906\u0932\u0947\u0916 \u092e\u0947\u0902 \u0916\u094b\u091c\u0947\u0902",
+        "the documentation for": "\u0906\u0932\u0947\u0916 \u0935\u093f\u0937\u092f"
+    },
+    "plural_expr": "(n != 1)"
+});
\ No newline at end of file
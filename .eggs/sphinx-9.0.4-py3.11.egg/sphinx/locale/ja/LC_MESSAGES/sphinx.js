@@ -0,0 +1,62 @@
+Documentation.addTranslations({
+    "locale": "ja",
+    "messages": {
+        "%(filename)s &#8212; %(docstitle)s": "%(filename)s &#8212; %(docstitle)s",
+        "&#169; %(copyright_prefix)s %(copyright)s.": "",
+        ", in ": ", in ",
+        "About these documents": "\u3053\u306e\u30c9\u30ad\u30e5\u30e1\u30f3\u30c8\u306b\u3064\u3044\u3066",
+        "Automatically generated list of changes in version %(version)s": "\u30d0\u30fc\u30b8\u30e7\u30f3 %(version)s \u306e\u5909\u66f4\u70b9\uff08\u3053\u306e\u30ea\u30b9\u30c8\u306f\u81ea\u52d5\u751f\u6210\u3055\u308c\u3066\u3044\u307e\u3059\uff09",
+        "C API changes": "C API \u306b\u95a2\u3059\u308b\u5909\u66f4",
+        "Changes in Version %(version)s &#8212; %(docstitle)s": "\u30d0\u30fc\u30b8\u30e7\u30f3 %(version)s \u306e\u5909\u66f4\u70b9 &#8212; %(docstitle)s",
+        "Collapse sidebar": "\u30b5\u30a4\u30c9\u30d0\u30fc\u3092\u305f\u305f\u3080",
+        "Complete Table of Contents": "\u7dcf\u5408\u76ee\u6b21",
+        "Contents": "\u30b3\u30f3\u30c6\u30f3\u30c4",
+        "Copyright": "\u8457\u4f5c\u6a29",
+        "Created using <a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.": "",
+        "Expand sidebar": "\u30b5\u30a4\u30c9\u30d0\u30fc\u3092\u5c55\u958b",
+        "Full index on one page": "\u7dcf\u7d22\u5f15",
+        "General Index": "\u7dcf\u5408\u7d22\u5f15",
+        "Global Module Index": "\u30e2\u30b8\u30e5\u30fc\u30eb\u7dcf\u7d22\u5f15",
+        "Go": "\u691c\u7d22",
+        "Hide Search Matches": "\u691c\u7d22\u7d50\u679c\u3092\u96a0\u3059",
+        "Index": "\u7d22\u5f15",
+        "Index &#x2013; %(key)s": "",
+        "Index pages by letter": "\u982d\u6587\u5b57\u5225\u7d22\u5f15",
+        "Indices and tables:": "\u7d22\u5f15\u3068\u8868\u4e00\u89a7:",
+        "Last updated on %(last_updated)s.": "\u6700\u7d42\u66f4\u65b0: %(last_updated)s",
+        "Library changes": "\u30e9\u30a4\u30d6\u30e9\u30ea\u306b\u95a2\u3059\u308b\u5909\u66f4",
+        "Navigation": "\u30ca\u30d3\u30b2\u30fc\u30b7\u30e7\u30f3",
+        "Next topic": "\u6b21\u306e\u30c8\u30d4\u30c3\u30af\u3078",
+        "Other changes": "\u305d\u306e\u4ed6\u306e\u5909\u66f4",
+        "Overview": "\u6982\u8981",
+        "Please activate JavaScript to enable the search\n    functionality.": "\u691c\u7d22\u6a5f\u80fd\u3092\u4f7f\u3046\u306b\u306f JavaScript \u3092\u6709\u52b9\u306b\u3057\u3066\u304f\u3060\u3055\u3044\u3002",
+        "Preparing search...": "\u691c\u7d22\u3092\u6e96\u5099\u3057\u3066\u3044\u307e\u3059...",
+        "Previous topic": "\u524d\u306e\u30c8\u30d4\u30c3\u30af\u3078",
+        "Quick search": "\u30af\u30a4\u30c3\u30af\u691c\u7d22",
+        "Search": "\u691c\u7d22",
+        "Search Page": "\u691c\u7d22\u30da\u30fc\u30b8",
+        "Search Results": "\u691c\u7d22\u7d50\u679c",
+        "Search finished, found one page matching the search query.": [
+            ""
+        ],
+        "Search within %(docstitle)s": "%(docstitle)s \u5185\u3092\u691c\u7d22",
+        "Searching": "\u691c\u7d22\u4e2d",
+        "Searching for multiple words only shows matches that contain\n    all words.": "\u8907\u6570\u306e\u5358\u8a9e\u3092\u691c\u7d22\u3059\u308b\u3068\u3001\u6b21\u3092\u542b\u3080\u4e00\u81f4\u306e\u307f\u304c\u8868\u793a\u3055\u308c\u307e\u3059\n \u00a0\u00a0\u00a0 \u3059\u3079\u3066\u306e\u7528\u8a9e\u3002",
+        "Show Source": "\u30bd\u30fc\u30b9\u30b3\u30fc\u30c9\u3092\u8868\u793a",
+        "Table of Contents": "\u76ee\u6b21",
+        "This Page": "\u3053\u306e\u30da\u30fc\u30b8",
+        "Welcome! This is": "Welcome! This is",
+        "Your search did not match any documents. Please make sure that all words are spelled correctly and that you've selected enough categories.": "\u691c\u7d22\u3057\u305f\u6587\u5b57\u5217\u306f\u3069\u306e\u6587\u66f8\u306b\u3082\u898b\u3064\u304b\u308a\u307e\u305b\u3093\u3067\u3057\u305f\u3002\u3059\u3079\u3066\u306e\u5358\u8a9e\u304c\u6b63\u78ba\u306b\u8a18\u8ff0\u3055\u308c\u3066\u3044\u308b\u304b\u3001\u3042\u308b\u3044\u306f\u3001\u5341\u5206\u306a\u30ab\u30c6\u30b4\u30ea\u30fc\u304c\u9078\u629e\u3055\u308c\u3066\u3044\u308b\u304b\u78ba\u8a8d\u3057\u3066\u304f\u3060\u3055\u3044\u3002",
+        "all functions, classes, terms": "\u95a2\u6570\u3001\u30af\u30e9\u30b9\u304a\u3088\u3073\u7528\u8a9e\u7dcf\u89a7",
+        "can be huge": "\u5927\u304d\u3044\u5834\u5408\u304c\u3042\u308b\u306e\u3067\u6ce8\u610f",
+        "last updated": "\u6700\u7d42\u66f4\u65b0",
+        "lists all sections and subsections": "\u7ae0\uff0f\u7bc0\u4e00\u89a7",
+        "next chapter": "\u6b21\u306e\u7ae0\u3078",
+        "previous chapter": "\u524d\u306e\u7ae0\u3078",
+        "quick access to all modules": "\u5168\u30e2\u30b8\u30e5\u30fc\u30eb\u65e9\u898b\u8868",
+        "search": "\u691c\u7d22",
+        "search this documentation": "\u30c9\u30ad\u30e5\u30e1\u30f3\u30c8\u3092\u691c\u7d22",
+        "the documentation for": "the documentation for"
+    },
+    "plural_expr": "0"
+});
\ No newline at end of file
@@ -0,0 +1,63 @@
+Documentation.addTranslations({
+    "locale": "ka",
+    "messages": {
+        "%(filename)s &#8212; %(docstitle)s": "",
+        "&#169; %(copyright_prefix)s %(copyright)s.": "",
+        ", in ": "",
+        "About these documents": "\u10d0\u10db \u10d3\u10dd\u10d9\u10e3\u10db\u10d4\u10dc\u10e2\u10d4\u10d1\u10d8\u10e1 \u10e8\u10d4\u10e1\u10d0\u10ee\u10d4\u10d1",
+        "Automatically generated list of changes in version %(version)s": "",
+        "C API changes": "C API \u10ea\u10d5\u10da\u10d8\u10da\u10d4\u10d1\u10d4\u10d1\u10d8",
+        "Changes in Version %(version)s &#8212; %(docstitle)s": "",
+        "Collapse sidebar": "\u10d2\u10d5\u10d4\u10e0\u10d3\u10d8\u10d7\u10d8 \u10d6\u10dd\u10da\u10d8\u10e1 \u10e9\u10d0\u10d9\u10d4\u10ea\u10d5\u10d0",
+        "Complete Table of Contents": "\u10e1\u10e0\u10e3\u10da\u10d8 \u10e1\u10d0\u10e0\u10e9\u10d4\u10d5\u10d8",
+        "Contents": "\u10e8\u10d8\u10d2\u10d7\u10d0\u10d5\u10e1\u10d8",
+        "Copyright": "\u10e1\u10d0\u10d0\u10d5\u10e2\u10dd\u10e0\u10dd \u10e3\u10e4\u10da\u10d4\u10d1\u10d4\u10d1\u10d8",
+        "Created using <a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.": "",
+        "Expand sidebar": "\u10d2\u10d5\u10d4\u10e0\u10d3\u10d8\u10d7\u10d8 \u10d6\u10dd\u10da\u10d8\u10e1 \u10d2\u10d0\u10e4\u10d0\u10e0\u10d7\u10dd\u10d4\u10d1\u10d0",
+        "Full index on one page": "\u10e1\u10e0\u10e3\u10da\u10d8 \u10d8\u10dc\u10d3\u10d4\u10e5\u10e1\u10d8 \u10d4\u10e0\u10d7 \u10d2\u10d5\u10d4\u10e0\u10d3\u10d6\u10d4",
+        "General Index": "\u10d6\u10dd\u10d2\u10d0\u10d3\u10d8 \u10d8\u10dc\u10d3\u10d4\u10e5\u10e1\u10d8",
+        "Global Module Index": "\u10d2\u10da\u10dd\u10d1\u10d0\u10da\u10e3\u10e0\u10d8 \u10db\u10dd\u10d3\u10e3\u10da\u10d4\u10d1\u10d8\u10e1 \u10d8\u10dc\u10d3\u10d4\u10e5\u10e1\u10d8",
+        "Go": "\u10d2\u10d0\u10d3\u10d0\u10e1\u10d5\u10da\u10d0",
+        "Hide Search Matches": "\u10eb\u10d4\u10d1\u10dc\u10d8\u10e1 \u10d3\u10d0\u10db\u10d7\u10ee\u10d5\u10d4\u10d5\u10d4\u10d1\u10d8\u10e1 \u10d3\u10d0\u10db\u10d0\u10da\u10d5\u10d0",
+        "Index": "\u10d8\u10dc\u10d3\u10d4\u10e5\u10e1\u10d8",
+        "Index &#x2013; %(key)s": "",
+        "Index pages by letter": "\u10d8\u10dc\u10d3\u10d4\u10e5\u10e1\u10d8\u10e1 \u10d2\u10d5\u10d4\u10e0\u10d3\u10d4\u10d1\u10d8 \u10d0\u10e1\u10dd\u10d4\u10d1\u10d8\u10e1 \u10db\u10d8\u10ee\u10d4\u10d3\u10d5\u10d8\u10d7",
+        "Indices and tables:": "\u10d8\u10dc\u10d3\u10d4\u10e5\u10e1\u10d4\u10d1\u10d8 \u10d3\u10d0 \u10ea\u10ee\u10e0\u10d8\u10da\u10d4\u10d1\u10d8:",
+        "Last updated on %(last_updated)s.": "\u10d1\u10dd\u10da\u10dd \u10d2\u10d0\u10dc\u10d0\u10ee\u10da\u10d4\u10d1\u10d8\u10e1 \u10d3\u10e0\u10dd %(last_updated)s.",
+        "Library changes": "\u10d1\u10d8\u10d1\u10da\u10d8\u10dd\u10d7\u10d4\u10d9\u10d8\u10e1 \u10ea\u10d5\u10da\u10d8\u10da\u10d4\u10d1\u10d4\u10d1\u10d8",
+        "Navigation": "\u10dc\u10d0\u10d5\u10d8\u10d2\u10d0\u10ea\u10d8\u10d0",
+        "Next topic": "\u10e8\u10d4\u10db\u10d3\u10d4\u10d2\u10d8 \u10d7\u10d4\u10db\u10d0",
+        "Other changes": "\u10e1\u10ee\u10d5\u10d0 \u10ea\u10d5\u10da\u10d8\u10da\u10d4\u10d1\u10d4\u10d1\u10d8",
+        "Overview": "\u10db\u10d8\u10db\u10dd\u10ee\u10d8\u10da\u10d5\u10d0",
+        "Please activate JavaScript to enable the search\n    functionality.": "",
+        "Preparing search...": "\u10eb\u10d4\u10d1\u10dc\u10d8\u10e1 \u10db\u10dd\u10db\u10d6\u10d0\u10d3\u10d4\u10d1\u10d0...",
+        "Previous topic": "\u10ec\u10d8\u10dc\u10d0 \u10d7\u10d4\u10db\u10d0",
+        "Quick search": "\u10e1\u10ec\u10e0\u10d0\u10e4\u10d8 \u10eb\u10d4\u10d1\u10dc\u10d0",
+        "Search": "\u10eb\u10d4\u10d1\u10dc\u10d0",
+        "Search Page": "\u10eb\u10d4\u10d1\u10dc\u10d8\u10e1 \u10d2\u10d5\u10d4\u10e0\u10d3\u10d8",
+        "Search Results": "\u10eb\u10d4\u10d1\u10dc\u10e1 \u10e8\u10d4\u10d3\u10d4\u10d2\u10d4\u10d1\u10d8",
+        "Search finished, found one page matching the search query.": [
+            "",
+            ""
+        ],
+        "Search within %(docstitle)s": "%(docstitle)s-\u10e8\u10d8 \u10eb\u10d4\u10d1\u10dc\u10d0",
+        "Searching": "\u10eb\u10d4\u10d1\u10dc\u10d0",
+        "Searching for multiple words only shows matches that contain\n    all words.": "",
+        "Show Source": "\u10ec\u10e7\u10d0\u10e0\u10dd\u10e1 \u10e9\u10d5\u10d4\u10dc\u10d4\u10d1\u10d0",
+        "Table of Contents": "\u10e1\u10d0\u10e0\u10e9\u10d4\u10d5\u10d8",
+        "This Page": "\u10d4\u10e1 \u10d2\u10d5\u10d4\u10e0\u10d3\u10d8",
+        "Welcome! This is": "\u10d9\u10d4\u10d7\u10d8\u10da\u10d8 \u10d8\u10e7\u10dd\u10e1 \u10d7\u10e5\u10d5\u10d4\u10dc\u10d8 \u10db\u10dd\u10d1\u10e0\u10eb\u10d0\u10dc\u10d4\u10d1\u10d0",
+        "Your search did not match any documents. Please make sure that all words are spelled correctly and that you've selected enough categories.": "",
+        "all functions, classes, terms": "\u10e7\u10d5\u10d4\u10da\u10d0 \u10e4\u10e3\u10dc\u10e5\u10ea\u10d8\u10d0, \u10d9\u10da\u10d0\u10e1\u10d8, \u10ec\u10d4\u10e1\u10d8",
+        "can be huge": "\u10e8\u10d4\u10d8\u10eb\u10da\u10d4\u10d1\u10d0 \u10e3\u10d6\u10d0\u10e0\u10db\u10d0\u10d6\u10d0\u10e0\u10d8 \u10d8\u10e7\u10dd\u10e1",
+        "last updated": "",
+        "lists all sections and subsections": "\u10e1\u10d4\u10e5\u10ea\u10d8\u10d4\u10d1\u10d8\u10e1\u10d0 \u10d3\u10d0 \u10e5\u10d5\u10d4\u10e1\u10d4\u10e5\u10ea\u10d8\u10d4\u10d1\u10d8\u10e1 \u10e9\u10d0\u10db\u10dd\u10dc\u10d0\u10d7\u10d5\u10d0\u10da\u10d8",
+        "next chapter": "\u10e8\u10d4\u10db\u10d3\u10d4\u10d2\u10d8 \u10d7\u10d0\u10d5\u10d8",
+        "previous chapter": "\u10ec\u10d8\u10dc\u10d0 \u10d7\u10d0\u10d5\u10d8",
+        "quick access to all modules": "\u10e1\u10ec\u10e0\u10d0\u10e4\u10d8 \u10ec\u10d5\u10d3\u10dd\u10db\u10d0 \u10e7\u10d5\u10d4\u10da\u10d0 \u10db\u10dd\u10d3\u10e3\u10da\u10d7\u10d0\u10dc",
+        "search": "\u10eb\u10d4\u10d1\u10dc\u10d0",
+        "search this documentation": "\u10d0\u10db \u10d3\u10dd\u10d9\u10e3\u10db\u10d4\u10dc\u10e2\u10d0\u10ea\u10d8\u10d0\u10e8\u10d8 \u10eb\u10d4\u10d1\u10dc\u10d0",
+        "the documentation for": ""
+    },
+    "plural_expr": "(n!=1)"
+});
\ No newline at end of file
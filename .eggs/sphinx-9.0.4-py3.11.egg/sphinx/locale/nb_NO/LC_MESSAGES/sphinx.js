@@ -0,0 +1,63 @@
+Documentation.addTranslations({
+    "locale": "nb_NO",
+    "messages": {
+        "%(filename)s &#8212; %(docstitle)s": "%(filename)s &#8212; %(docstitle)s",
+        "&#169; %(copyright_prefix)s %(copyright)s.": "&#169; %(copyright_prefix)s %(copyright)s.",
+        ", in ": ", i ",
+        "About these documents": "Om disse dokumentene",
+        "Automatically generated list of changes in version %(version)s": "Automatisk generert liste over endringer i versjon %(version)s",
+        "C API changes": "Endringer i C-API-et",
+        "Changes in Version %(version)s &#8212; %(docstitle)s": "Endringer i versjon %(version)s &#8212; %(docstitle)s",
+        "Collapse sidebar": "Skjul sidepanelet",
+        "Complete Table of Contents": "Fullstendig innholdsfortegnelse",
+        "Contents": "Innhold",
+        "Copyright": "Opphavsrett",
+        "Created using <a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.": "Laget med <a href=\"https://www.sphinx-doc.org/\">Sphinx</a> %(sphinx_version)s.",
+        "Expand sidebar": "Utvid sidepanelet",
+        "Full index on one page": "Hele registeret p\u00e5 \u00e9n side",
+        "General Index": "Hovedindex",
+        "Global Module Index": "Globalt modulregister",
+        "Go": "G\u00e5",
+        "Hide Search Matches": "Skjul s\u00f8keresultat",
+        "Index": "Index",
+        "Index &#x2013; %(key)s": "Indeks &#x2013; %(key)s",
+        "Index pages by letter": "Registersider per bokstav",
+        "Indices and tables:": "Registre og tabeller",
+        "Last updated on %(last_updated)s.": "Sist oppdatert %(last_updated)s.",
+        "Library changes": "Endringer i biblioteket",
+        "Navigation": "Navigering",
+        "Next topic": "Neste emne",
+        "Other changes": "Andre endringer",
+        "Overview": "Oversikt",
+        "Please activate JavaScript to enable the search\n    functionality.": "Vennligst aktiver JavaScript for \u00e5 skru p\u00e5 s\u00f8kefunksjonaliteten.",
+        "Preparing search...": "Forbereder s\u00f8k \u2026",
+        "Previous topic": "Forrige emne",
+        "Quick search": "Hurtigs\u00f8k",
+        "Search": "S\u00f8k",
+        "Search Page": "S\u00f8keside",
+        "Search Results": "S\u00f8keresultat",
+        "Search finished, found one page matching the search query.": [
+            "",
+            ""
+        ],
+        "Search within %(docstitle)s": "S\u00f8k blant %(docstitle)s",
+        "Searching": "S\u00f8ker",
+        "Searching for multiple words only shows matches that contain\n    all words.": "S\u00f8k etter flere ord viser bare treff som inneholder\n\u00a0 alle ord",
+        "Show Source": "Vis kildekode",
+        "Table of Contents": "Innholdsfortegnelse",
+        "This Page": "Denne siden",
+        "Welcome! This is": "Velkommen! Dette er",
+        "Your search did not match any documents. Please make sure that all words are spelled correctly and that you've selected enough categories.": "",
+        "all functions, classes, terms": "alla funksjoner, klasser, termer",
+        "can be huge": "kan bli stor",
+        "last updated": "sist oppdatert",
+        "lists all sections and subsections": "lister opp alle avsnitt og underavsnitt",
+        "next chapter": "neste kapittel",
+        "previous chapter": "forrige kapittel",
+        "quick access to all modules": "snarvei til alle moduler",
+        "search": "s\u00f8k",
+        "search this documentation": "s\u00f8k i denne dokumentasjonen",
+        "the documentation for": "dokumentasjonen for"
+    },
+    "plural_expr": "(n != 1)"
+});
\ No newline at end of file
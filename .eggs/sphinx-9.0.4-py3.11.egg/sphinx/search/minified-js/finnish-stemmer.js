@@ -0,0 +1 @@
+var FinnishStemmer=function(){var c=new BaseStemmer,s=[["pa",-1,1],["sti",-1,2],["kaan",-1,1],["han",-1,1],["kin",-1,1],["hän",-1,1],["kään",-1,1],["ko",-1,1],["pä",-1,1],["kö",-1,1]],a=[["lla",-1,-1],["na",-1,-1],["ssa",-1,-1],["ta",-1,-1],["lta",3,-1],["sta",3,-1]],e=[["llä",-1,-1],["nä",-1,-1],["ssä",-1,-1],["tä",-1,-1],["ltä",3,-1],["stä",3,-1]],t=[["lle",-1,-1],["ine",-1,-1]],u=[["nsa",-1,3],["mme",-1,3],["nne",-1,3],["ni",-1,2],["si",-1,1],["an",-1,4],["en",-1,6],["än",-1,5],["nsä",-1,3]],r=[["aa",-1,-1],["ee",-1,-1],["ii",-1,-1],["oo",-1,-1],["uu",-1,-1],["ää",-1,-1],["öö",-1,-1]],o=[["a",-1,8],["lla",0,-1],["na",0,-1],["ssa",0,-1],["ta",0,-1],["lta",4,-1],["sta",4,-1],["tta",4,2],["lle",-1,-1],["ine",-1,-1],["ksi",-1,-1],["n",-1,7],["han",11,1],["den",11,-1,h],["seen",11,-1,v],["hen",11,2],["tten",11,-1,h],["hin",11,3],["siin",11,-1,h],["hon",11,4],["hän",11,5],["hön",11,6],["ä",-1,8],["llä",22,-1],["nä",22,-1],["ssä",22,-1],["tä",22,-1],["ltä",26,-1],["stä",26,-1],["ttä",26,2]],_=[["eja",-1,-1],["mma",-1,1],["imma",1,-1],["mpa",-1,1],["impa",3,-1],["mmi",-1,1],["immi",5,-1],["mpi",-1,1],["impi",7,-1],["ejä",-1,-1],["mmä",-1,1],["immä",10,-1],["mpä",-1,1],["impä",12,-1]],l=[["i",-1,-1],["j",-1,-1]],m=[["mma",-1,1],["imma",0,-1]],n=[17,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8],b=[119,223,119,1],k=[17,65,16,1,0,0,0,0,0,0,0,0,0,0,0,0,8,0,32],i=[17,65,16,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,32],d=[17,97,24,1,0,0,0,0,0,0,0,0,0,0,0,0,8,0,32],f=!1,g="",w=0,p=0;function q(){var r;if(!(c.cursor<p)){var i=c.limit_backward;if(c.limit_backward=p,c.ket=c.cursor,0==(r=c.find_among_b(s)))c.limit_backward=i;else{switch(c.bra=c.cursor,c.limit_backward=i,r){case 1:if(c.in_grouping_b(d,97,246))break;return;case 2:if(w<=c.cursor)break;return}c.slice_del()}}}function v(){return 0!=c.find_among_b(r)}function h(){return!!c.eq_s_b("i")&&!!c.in_grouping_b(i,97,246)}this.stem=function(){var r,i=c.cursor,i=(p=c.limit,w=c.limit,c.go_out_grouping(k,97,246)&&(c.cursor++,c.go_in_grouping(k,97,246))&&(c.cursor++,p=c.cursor,c.go_out_grouping(k,97,246))&&(c.cursor++,c.go_in_grouping(k,97,246))&&(c.cursor++,w=c.cursor),c.cursor=i,f=!1,c.limit_backward=c.cursor,c.cursor=c.limit,c.limit-c.cursor),i=(q(),c.cursor=c.limit-i,c.limit-c.cursor),i=((()=>{var r;if(!(c.cursor<p)){var i=c.limit_backward;if(c.limit_backward=p,c.ket=c.cursor,0==(r=c.find_among_b(u)))c.limit_backward=i;else switch(c.bra=c.cursor,c.limit_backward=i,r){case 1:var s=c.limit-c.cursor;if(c.eq_s_b("k"))return;if(c.cursor=c.limit-s,c.slice_del())break;return;case 2:if(!c.slice_del())return;if(c.ket=c.cursor,!c.eq_s_b("kse"))return;if(c.bra=c.cursor,c.slice_from("ksi"))break;return;case 3:if(c.slice_del())break;return;case 4:if(0==c.find_among_b(a))return;if(c.slice_del())break;return;case 5:if(0==c.find_among_b(e))return;if(c.slice_del())break;return;case 6:if(0==c.find_among_b(t))return;if(c.slice_del())break}}})(),c.cursor=c.limit-i,c.limit-c.cursor),i=((()=>{var r;if(!(c.cursor<p)){var i=c.limit_backward;if(c.limit_backward=p,c.ket=c.cursor,0==(r=c.find_among_b(o)))c.limit_backward=i;else{switch(c.bra=c.cursor,c.limit_backward=i,r){case 1:if(c.eq_s_b("a"))break;return;case 2:if(c.eq_s_b("e"))break;return;case 3:if(c.eq_s_b("i"))break;return;case 4:if(c.eq_s_b("o"))break;return;case 5:if(c.eq_s_b("ä"))break;return;case 6:if(c.eq_s_b("ö"))break;return;case 7:var s=c.limit-c.cursor,a=c.limit-c.cursor,e=c.limit-c.cursor;v()||(c.cursor=c.limit-e,c.eq_s_b("ie"))?(c.cursor=c.limit-a,c.cursor<=c.limit_backward?c.cursor=c.limit-s:(c.cursor--,c.bra=c.cursor)):c.cursor=c.limit-s;break;case 8:if(!c.in_grouping_b(k,97,246))return;if(c.in_grouping_b(b,98,122))break;return}c.slice_del()&&(f=!0)}}})(),c.cursor=c.limit-i,c.limit-c.cursor),i=((()=>{var r;if(!(c.cursor<w)){var i=c.limit_backward;if(c.limit_backward=w,c.ket=c.cursor,0==(r=c.find_among_b(_)))c.limit_backward=i;else{if(c.bra=c.cursor,c.limit_backward=i,1===r){i=c.limit-c.cursor;if(c.eq_s_b("po"))return;c.cursor=c.limit-i}c.slice_del()}}})(),c.cursor=c.limit-i,f?(i=c.limit-c.cursor,c.cursor<p||(r=c.limit_backward,c.limit_backward=p,c.ket=c.cursor,0==c.find_among_b(l)?c.limit_backward=r:(c.bra=c.cursor,c.limit_backward=r,c.slice_del())),c.cursor=c.limit-i):(r=c.limit-c.cursor,(()=>{var r;if(!(c.cursor<p)){var i=c.limit_backward;if(c.limit_backward=p,c.ket=c.cursor,c.eq_s_b("t")){c.bra=c.cursor;var s=c.limit-c.cursor;if(c.in_grouping_b(k,97,246)){if(c.cursor=c.limit-s,c.slice_del()&&(c.limit_backward=i,!(c.cursor<w))){s=c.limit_backward;if(c.limit_backward=w,c.ket=c.cursor,0==(r=c.find_among_b(m)))c.limit_backward=s;else{if(c.bra=c.cursor,c.limit_backward=s,1===r){s=c.limit-c.cursor;if(c.eq_s_b("po"))return;c.cursor=c.limit-s}c.slice_del()}}}else c.limit_backward=i}else c.limit_backward=i}})(),c.cursor=c.limit-r),c.limit-c.cursor);return(()=>{if(!(c.cursor<p)){var r=c.limit_backward,i=(c.limit_backward=p,c.limit-c.cursor),s=c.limit-c.cursor;if(!v()||(c.cursor=c.limit-s,c.ket=c.cursor,c.cursor<=c.limit_backward||(c.cursor--,c.bra=c.cursor,c.slice_del()))){c.cursor=c.limit-i;s=c.limit-c.cursor;if(c.ket=c.cursor,!c.in_grouping_b(n,97,228)||(c.bra=c.cursor,!c.in_grouping_b(b,98,122))||c.slice_del()){c.cursor=c.limit-s;i=c.limit-c.cursor;if(c.ket=c.cursor,c.eq_s_b("j")){c.bra=c.cursor;s=c.limit-c.cursor;if((c.eq_s_b("o")||(c.cursor=c.limit-s,c.eq_s_b("u")))&&!c.slice_del())return}c.cursor=c.limit-i;s=c.limit-c.cursor;c.ket=c.cursor,c.eq_s_b("o")&&(c.bra=c.cursor,c.eq_s_b("j"))&&!c.slice_del()||(c.cursor=c.limit-s,c.limit_backward=r,c.go_in_grouping_b(k,97,246)&&(c.ket=c.cursor,c.in_grouping_b(b,98,122))&&(c.bra=c.cursor,""!=(g=c.slice_to()))&&c.eq_s_b(g)&&c.slice_del())}}}})(),c.cursor=c.limit-i,c.cursor=c.limit_backward,!0},this.stemWord=function(r){return c.setCurrent(r),this.stem(),c.getCurrent()}};
\ No newline at end of file
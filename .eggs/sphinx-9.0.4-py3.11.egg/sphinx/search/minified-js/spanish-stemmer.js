@@ -0,0 +1 @@
+var SpanishStemmer=function(){var a=new BaseStemmer,o=[["",-1,6],["á",0,1],["é",0,2],["í",0,3],["ó",0,4],["ú",0,5]],c=[["la",-1,-1],["sela",0,-1],["le",-1,-1],["me",-1,-1],["se",-1,-1],["lo",-1,-1],["selo",5,-1],["las",-1,-1],["selas",7,-1],["les",-1,-1],["los",-1,-1],["selos",10,-1],["nos",-1,-1]],u=[["ando",-1,6],["iendo",-1,6],["yendo",-1,7],["ándo",-1,2],["iéndo",-1,1],["ar",-1,6],["er",-1,6],["ir",-1,6],["ár",-1,3],["ér",-1,4],["ír",-1,5]],s=[["ic",-1,-1],["ad",-1,-1],["os",-1,-1],["iv",-1,1]],t=[["able",-1,1],["ible",-1,1],["ante",-1,1]],n=[["ic",-1,1],["abil",-1,1],["iv",-1,1]],l=[["ica",-1,1],["ancia",-1,2],["encia",-1,5],["adora",-1,2],["osa",-1,1],["ista",-1,1],["iva",-1,9],["anza",-1,1],["logía",-1,3],["idad",-1,8],["able",-1,1],["ible",-1,1],["ante",-1,2],["mente",-1,7],["amente",13,6],["acion",-1,2],["ucion",-1,4],["ación",-1,2],["ución",-1,4],["ico",-1,1],["ismo",-1,1],["oso",-1,1],["amiento",-1,1],["imiento",-1,1],["ivo",-1,9],["ador",-1,2],["icas",-1,1],["ancias",-1,2],["encias",-1,5],["adoras",-1,2],["osas",-1,1],["istas",-1,1],["ivas",-1,9],["anzas",-1,1],["logías",-1,3],["idades",-1,8],["ables",-1,1],["ibles",-1,1],["aciones",-1,2],["uciones",-1,4],["adores",-1,2],["antes",-1,2],["icos",-1,1],["ismos",-1,1],["osos",-1,1],["amientos",-1,1],["imientos",-1,1],["ivos",-1,9]],m=[["ya",-1,1],["ye",-1,1],["yan",-1,1],["yen",-1,1],["yeron",-1,1],["yendo",-1,1],["yo",-1,1],["yas",-1,1],["yes",-1,1],["yais",-1,1],["yamos",-1,1],["yó",-1,1]],f=[["aba",-1,2],["ada",-1,2],["ida",-1,2],["ara",-1,2],["iera",-1,2],["ía",-1,2],["aría",5,2],["ería",5,2],["iría",5,2],["ad",-1,2],["ed",-1,2],["id",-1,2],["ase",-1,2],["iese",-1,2],["aste",-1,2],["iste",-1,2],["an",-1,2],["aban",16,2],["aran",16,2],["ieran",16,2],["ían",16,2],["arían",20,2],["erían",20,2],["irían",20,2],["en",-1,1],["asen",24,2],["iesen",24,2],["aron",-1,2],["ieron",-1,2],["arán",-1,2],["erán",-1,2],["irán",-1,2],["ado",-1,2],["ido",-1,2],["ando",-1,2],["iendo",-1,2],["ar",-1,2],["er",-1,2],["ir",-1,2],["as",-1,2],["abas",39,2],["adas",39,2],["idas",39,2],["aras",39,2],["ieras",39,2],["ías",39,2],["arías",45,2],["erías",45,2],["irías",45,2],["es",-1,1],["ases",49,2],["ieses",49,2],["abais",-1,2],["arais",-1,2],["ierais",-1,2],["íais",-1,2],["aríais",55,2],["eríais",55,2],["iríais",55,2],["aseis",-1,2],["ieseis",-1,2],["asteis",-1,2],["isteis",-1,2],["áis",-1,2],["éis",-1,1],["aréis",64,2],["eréis",64,2],["iréis",64,2],["ados",-1,2],["idos",-1,2],["amos",-1,2],["ábamos",70,2],["áramos",70,2],["iéramos",70,2],["íamos",70,2],["aríamos",74,2],["eríamos",74,2],["iríamos",74,2],["emos",-1,1],["aremos",78,2],["eremos",78,2],["iremos",78,2],["ásemos",78,2],["iésemos",78,2],["imos",-1,2],["arás",-1,2],["erás",-1,2],["irás",-1,2],["ís",-1,2],["ará",-1,2],["erá",-1,2],["irá",-1,2],["aré",-1,2],["eré",-1,2],["iré",-1,2],["ió",-1,2]],_=[["a",-1,1],["e",-1,2],["o",-1,1],["os",-1,1],["á",-1,1],["é",-1,2],["í",-1,1],["ó",-1,1]],b=[17,65,16,0,0,0,0,0,0,0,0,0,0,0,0,0,1,17,4,10],d=0,k=0,g=0;function v(){return g<=a.cursor}function w(){return d<=a.cursor}function p(){var r;if(a.ket=a.cursor,0!=(r=a.find_among_b(l))){switch(a.bra=a.cursor,r){case 1:if(!w())return;if(a.slice_del())break;return;case 2:if(!w())return;if(!a.slice_del())return;var i=a.limit-a.cursor;if(a.ket=a.cursor,a.eq_s_b("ic"))if(a.bra=a.cursor,w()){if(!a.slice_del())return}else a.cursor=a.limit-i;else a.cursor=a.limit-i;break;case 3:if(!w())return;if(a.slice_from("log"))break;return;case 4:if(!w())return;if(a.slice_from("u"))break;return;case 5:if(!w())return;if(a.slice_from("ente"))break;return;case 6:if(!(k<=a.cursor))return;if(!a.slice_del())return;var e=a.limit-a.cursor;r:if(a.ket=a.cursor,0==(r=a.find_among_b(s)))a.cursor=a.limit-e;else if(a.bra=a.cursor,w()){if(!a.slice_del())return;switch(r){case 1:if(a.ket=a.cursor,!a.eq_s_b("at")){a.cursor=a.limit-e;break r}if(a.bra=a.cursor,!w()){a.cursor=a.limit-e;break r}if(a.slice_del())break;return}}else a.cursor=a.limit-e;break;case 7:if(!w())return;if(!a.slice_del())return;i=a.limit-a.cursor;if(a.ket=a.cursor,0==a.find_among_b(t))a.cursor=a.limit-i;else if(a.bra=a.cursor,w()){if(!a.slice_del())return}else a.cursor=a.limit-i;break;case 8:if(!w())return;if(!a.slice_del())return;i=a.limit-a.cursor;if(a.ket=a.cursor,0==a.find_among_b(n))a.cursor=a.limit-i;else if(a.bra=a.cursor,w()){if(!a.slice_del())return}else a.cursor=a.limit-i;break;case 9:if(!w())return;if(!a.slice_del())return;i=a.limit-a.cursor;if(a.ket=a.cursor,a.eq_s_b("at"))if(a.bra=a.cursor,w()){if(!a.slice_del())return}else a.cursor=a.limit-i;else a.cursor=a.limit-i}return 1}}this.stem=function(){g=a.limit,k=a.limit,d=a.limit;var r=a.cursor;r:{i:{var i=a.cursor;e:if(a.in_grouping(b,97,252)){var e=a.cursor;if(!a.out_grouping(b,97,252)||!a.go_out_grouping(b,97,252)){if(a.cursor=e,!a.in_grouping(b,97,252))break e;if(!a.go_in_grouping(b,97,252))break e}a.cursor++;break i}if(a.cursor=i,!a.out_grouping(b,97,252))break r;e=a.cursor;if(a.out_grouping(b,97,252)&&a.go_out_grouping(b,97,252));else{if(a.cursor=e,!a.in_grouping(b,97,252))break r;if(a.cursor>=a.limit)break r}a.cursor++}g=a.cursor}a.cursor=r,r=a.cursor,a.go_out_grouping(b,97,252)&&(a.cursor++,a.go_in_grouping(b,97,252))&&(a.cursor++,k=a.cursor,a.go_out_grouping(b,97,252))&&(a.cursor++,a.go_in_grouping(b,97,252))&&(a.cursor++,d=a.cursor),a.cursor=r,a.limit_backward=a.cursor,a.cursor=a.limit;var r=a.limit-a.cursor,r=((()=>{var r;if(a.ket=a.cursor,0!=a.find_among_b(c)&&(a.bra=a.cursor,0!=(r=a.find_among_b(u)))&&v())switch(r){case 1:if(a.bra=a.cursor,a.slice_from("iendo"))break;return;case 2:if(a.bra=a.cursor,a.slice_from("ando"))break;return;case 3:if(a.bra=a.cursor,a.slice_from("ar"))break;return;case 4:if(a.bra=a.cursor,a.slice_from("er"))break;return;case 5:if(a.bra=a.cursor,a.slice_from("ir"))break;return;case 6:if(a.slice_del())break;return;case 7:if(!a.eq_s_b("u"))return;if(a.slice_del())break}})(),a.cursor=a.limit-r,a.limit-a.cursor),s=a.limit-a.cursor,s=(p()||(a.cursor=a.limit-s,(()=>{if(!(a.cursor<g)){var r=a.limit_backward;if(a.limit_backward=g,a.ket=a.cursor,0!=a.find_among_b(m))return a.bra=a.cursor,a.limit_backward=r,a.eq_s_b("u")&&!!a.slice_del();a.limit_backward=r}})())||(a.cursor=a.limit-s,(()=>{var r;if(!(a.cursor<g)){var i=a.limit_backward;if(a.limit_backward=g,a.ket=a.cursor,0!=(r=a.find_among_b(f))){switch(a.bra=a.cursor,a.limit_backward=i,r){case 1:var e,s=a.limit-a.cursor;if(a.eq_s_b("u")?(e=a.limit-a.cursor,a.eq_s_b("g")?a.cursor=a.limit-e:a.cursor=a.limit-s):a.cursor=a.limit-s,a.bra=a.cursor,a.slice_del())break;return;case 2:if(a.slice_del())break;return}return}a.limit_backward=i}})()),a.cursor=a.limit-r,a.limit-a.cursor),r=((()=>{var r;if(a.ket=a.cursor,0!=(r=a.find_among_b(_)))switch(a.bra=a.cursor,r){case 1:if(!v())return;if(a.slice_del())break;return;case 2:if(!v())return;if(!a.slice_del())return;var i=a.limit-a.cursor;if(a.ket=a.cursor,a.eq_s_b("u")){a.bra=a.cursor;var e=a.limit-a.cursor;if(a.eq_s_b("g"))if(a.cursor=a.limit-e,v()){if(!a.slice_del());}else a.cursor=a.limit-i;else a.cursor=a.limit-i}else a.cursor=a.limit-i}})(),a.cursor=a.limit-s,a.cursor=a.limit_backward,a.cursor);return(()=>{for(var r;;){var i=a.cursor;r:{switch(a.bra=a.cursor,r=a.find_among(o),a.ket=a.cursor,r){case 1:if(a.slice_from("a"))break;return;case 2:if(a.slice_from("e"))break;return;case 3:if(a.slice_from("i"))break;return;case 4:if(a.slice_from("o"))break;return;case 5:if(a.slice_from("u"))break;return;case 6:if(a.cursor>=a.limit)break r;a.cursor++}continue}a.cursor=i;break}})(),a.cursor=r,!0},this.stemWord=function(r){return a.setCurrent(r),this.stem(),a.getCurrent()}};
\ No newline at end of file
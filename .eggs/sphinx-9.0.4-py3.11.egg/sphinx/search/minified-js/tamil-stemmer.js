@@ -0,0 +1 @@
+var TamilStemmer=function(){var l=new BaseStemmer,i=[["வு",-1,3],["வூ",-1,4],["வொ",-1,2],["வோ",-1,1]],e=[["க",-1,-1],["ங",-1,-1],["ச",-1,-1],["ஞ",-1,-1],["த",-1,-1],["ந",-1,-1],["ப",-1,-1],["ம",-1,-1],["ய",-1,-1],["வ",-1,-1]],a=[["ி",-1,-1],["ீ",-1,-1],["ை",-1,-1]],t=[["ா",-1,-1],["ி",-1,-1],["ீ",-1,-1],["ு",-1,-1],["ூ",-1,-1],["ெ",-1,-1],["ே",-1,-1],["ை",-1,-1]],m=[["",-1,2],["ை",0,1],["்",0,1]],f=[["ந்த",-1,1],["ய",-1,1],["வ",-1,1],["னு",-1,8],["ுக்",-1,7],["ுக்க்",-1,7],["ட்க்",-1,3],["ற்க்",-1,4],["ங்",-1,9],["ட்ட்",-1,5],["த்த்",-1,6],["ந்த்",-1,1],["ந்",-1,1],["ட்ப்",-1,3],["ய்",-1,2],["ன்ற்",-1,4],["வ்",-1,1]],_=[["க",-1,-1],["ச",-1,-1],["ட",-1,-1],["த",-1,-1],["ப",-1,-1],["ற",-1,-1]],n=[["க",-1,-1],["ச",-1,-1],["ட",-1,-1],["த",-1,-1],["ப",-1,-1],["ற",-1,-1]],b=[["ஞ",-1,-1],["ண",-1,-1],["ந",-1,-1],["ன",-1,-1],["ம",-1,-1],["ய",-1,-1],["ர",-1,-1],["ல",-1,-1],["ள",-1,-1],["ழ",-1,-1],["வ",-1,-1]],k=[["ா",-1,-1],["ி",-1,-1],["ீ",-1,-1],["ு",-1,-1],["ூ",-1,-1],["ெ",-1,-1],["ே",-1,-1],["ை",-1,-1],["்",-1,-1]],s=[["அ",-1,-1],["இ",-1,-1],["உ",-1,-1]],o=[["க",-1,-1],["ங",-1,-1],["ச",-1,-1],["ஞ",-1,-1],["த",-1,-1],["ந",-1,-1],["ப",-1,-1],["ம",-1,-1],["ய",-1,-1],["வ",-1,-1]],u=[["க",-1,-1],["ச",-1,-1],["ட",-1,-1],["த",-1,-1],["ப",-1,-1],["ற",-1,-1]],d=[["கள்",-1,4],["ுங்கள்",0,1],["ட்கள்",0,3],["ற்கள்",0,2]],v=[["ா",-1,-1],["ே",-1,-1],["ோ",-1,-1]],g=[["பி",-1,-1],["வி",-1,-1]],w=[["ா",-1,-1],["ி",-1,-1],["ீ",-1,-1],["ு",-1,-1],["ூ",-1,-1],["ெ",-1,-1],["ே",-1,-1],["ை",-1,-1]],q=[["பட்ட",-1,3],["பட்டண",-1,3],["தான",-1,3],["படிதான",2,3],["ென",-1,1],["ாகிய",-1,1],["குரிய",-1,3],["ுடைய",-1,1],["ல்ல",-1,2],["ுள்ள",-1,1],["ாகி",-1,1],["படி",-1,3],["ின்றி",-1,1],["பற்றி",-1,3],["படு",-1,3],["விடு",-1,3],["பட்டு",-1,3],["விட்டு",-1,3],["பட்டது",-1,3],["ென்று",-1,1],["ுடை",-1,1],["ில்லை",-1,1],["ுடன்",-1,1],["ிடம்",-1,1],["ெல்லாம்",-1,3],["ெனும்",-1,1]],h=[["ா",-1,-1],["ி",-1,-1],["ீ",-1,-1],["ு",-1,-1],["ூ",-1,-1],["ெ",-1,-1],["ே",-1,-1],["ை",-1,-1]],C=[["ா",-1,-1],["ி",-1,-1],["ீ",-1,-1],["ு",-1,-1],["ூ",-1,-1],["ெ",-1,-1],["ே",-1,-1],["ை",-1,-1]],S=[["விட",-1,2],["ீ",-1,7],["ொடு",-1,2],["ோடு",-1,2],["து",-1,6],["ிருந்து",4,2],["ின்று",-1,2],["ுடை",-1,2],["னை",-1,1],["கண்",-1,1],["ின்",-1,3],["முன்",-1,1],["ிடம்",-1,4],["ிற்",-1,2],["மேற்",-1,1],["ல்",-1,5],["ாமல்",15,2],["ால்",15,2],["ில்",15,2],["மேல்",15,1],["ுள்",-1,2],["கீழ்",-1,1]],B=[["க",-1,-1],["ச",-1,-1],["ட",-1,-1],["த",-1,-1],["ப",-1,-1],["ற",-1,-1]],T=[["க",-1,-1],["ச",-1,-1],["ட",-1,-1],["த",-1,-1],["ப",-1,-1],["ற",-1,-1]],W=[["அ",-1,-1],["ஆ",-1,-1],["இ",-1,-1],["ஈ",-1,-1],["உ",-1,-1],["ஊ",-1,-1],["எ",-1,-1],["ஏ",-1,-1],["ஐ",-1,-1],["ஒ",-1,-1],["ஓ",-1,-1],["ஔ",-1,-1]],j=[["ா",-1,-1],["ி",-1,-1],["ீ",-1,-1],["ு",-1,-1],["ூ",-1,-1],["ெ",-1,-1],["ே",-1,-1],["ை",-1,-1]],p=[["க",-1,1],["த",-1,1],["ன",-1,1],["ப",-1,1],["ய",-1,1],["ா",-1,5],["கு",-1,6],["படு",-1,1],["து",-1,3],["ிற்று",-1,1],["னை",-1,1],["வை",-1,1],["னன்",-1,1],["பன்",-1,1],["வன்",-1,2],["ான்",-1,4],["னான்",15,1],["மின்",-1,1],["னென்",-1,1],["ேன்",-1,5],["னம்",-1,1],["பம்",-1,1],["ாம்",-1,5],["கும்",-1,1],["டும்",-1,5],["தும்",-1,1],["றும்",-1,1],["ெம்",-1,5],["ேம்",-1,5],["ோம்",-1,5],["ாய்",-1,5],["னர்",-1,1],["பர்",-1,1],["ீயர்",-1,5],["வர்",-1,1],["ார்",-1,5],["னார்",35,1],["மார்",35,1],["கொண்டிர்",-1,1],["னிர்",-1,5],["ீர்",-1,5],["னள்",-1,1],["பள்",-1,1],["வள்",-1,1],["ாள்",-1,5],["னாள்",44,1]],x=[["கிற",-1,-1],["கின்ற",-1,-1],["ாநின்ற",-1,-1],["கிற்",-1,-1],["கின்ற்",-1,-1],["ாநின்ற்",-1,-1]],y=!1,z=!1;function A(){return 4<l.current.length}function D(){var r;if(l.bra=l.cursor,0!=(r=l.find_among(i)))switch(l.ket=l.cursor,r){case 1:if(l.slice_from("ஓ"))break;return;case 2:if(l.slice_from("ஒ"))break;return;case 3:if(l.slice_from("உ"))break;return;case 4:if(l.slice_from("ஊ"))break;return}}function E(){for(var r=l.cursor;;){var i=l.cursor;if(!F()){l.cursor=i;break}}l.cursor=r}function F(){var r;if(!(l.current.length<=3)){l.limit_backward=l.cursor,l.cursor=l.limit;r:{var i=l.limit-l.cursor;i:if(l.ket=l.cursor,0!=(r=l.find_among_b(f))){switch(l.bra=l.cursor,r){case 1:if(l.slice_del())break;return;case 2:var c=l.limit-l.cursor;if(0==l.find_among_b(a))break i;if(l.cursor=l.limit-c,l.slice_del())break;return;case 3:if(l.slice_from("ள்"))break;return;case 4:if(l.slice_from("ல்"))break;return;case 5:if(l.slice_from("டு"))break;return;case 6:if(!y)break i;var e=l.limit-l.cursor;if(l.eq_s_b("ை"))break i;if(l.cursor=l.limit-e,l.slice_from("ம்"))break;return;case 7:if(l.slice_from("்"))break;return;case 8:var s=l.limit-l.cursor;if(0!=l.find_among_b(t))break i;if(l.cursor=l.limit-s,l.slice_del())break;return;case 9:switch(l.find_among_b(m)){case 1:if(l.slice_del())break;return;case 2:if(l.slice_from("ம்"))break;return}}break r}if(l.cursor=l.limit-i,l.ket=l.cursor,!l.eq_s_b("்"))return;i:{var o=l.limit-l.cursor;if(0!=l.find_among_b(_)){var u=l.limit-l.cursor;if((!l.eq_s_b("்")||0==l.find_among_b(n))&&(l.cursor=l.limit-u),l.bra=l.cursor,l.slice_del())break i;return}if(l.cursor=l.limit-o,0!=l.find_among_b(b)&&(l.bra=l.cursor,l.eq_s_b("்"))){if(l.slice_del())break i;return}l.cursor=l.limit-o;u=l.limit-l.cursor;if(0==l.find_among_b(k))return;if(l.cursor=l.limit-u,l.bra=l.cursor,!l.slice_del())return}}return l.cursor=l.limit_backward,1}}function G(){for(;;){var r=l.cursor;if(!(()=>{var r;if(z=!1,A()){l.limit_backward=l.cursor,l.cursor=l.limit;var i=l.limit-l.cursor;r:{var c=l.limit-l.cursor;if(l.ket=l.cursor,0!=(r=l.find_among_b(p))){switch(l.bra=l.cursor,r){case 1:if(l.slice_del())break;return;case 2:var e=l.limit-l.cursor;if(0!=l.find_among_b(W))break r;if(l.cursor=l.limit-e,l.slice_del())break;return;case 3:var s=l.limit-l.cursor;if(0!=l.find_among_b(j))break r;if(l.cursor=l.limit-s,l.slice_del())break;return;case 4:var o=l.limit-l.cursor;if(l.eq_s_b("ச"))break r;if(l.cursor=l.limit-o,l.slice_from("்"))break;return;case 5:if(l.slice_from("்"))break;return;case 6:var u=l.limit-l.cursor;if(!l.eq_s_b("்"))break r;if(l.cursor=l.limit-u,l.slice_del())break;return}z=!0,l.cursor=l.limit-c}}if(l.cursor=l.limit-i,i=l.limit-l.cursor,l.ket=l.cursor,0!=l.find_among_b(x)){if(l.bra=l.cursor,!l.slice_del())return;z=!0}return l.cursor=l.limit-i,l.cursor=l.limit_backward,E(),!!z}})()){l.cursor=r;break}}}this.stem=function(){y=!1;var r,i,c=l.cursor;return F(),l.cursor=c,!!A()&&(c=l.cursor,l.bra=l.cursor,l.eq_s("எ")&&0!=l.find_among(e)&&l.eq_s("்")&&(l.ket=l.cursor,l.slice_del())&&(r=l.cursor,D(),l.cursor=r),l.cursor=c,r=l.cursor,l.bra=l.cursor,0!=l.find_among(s)&&0!=l.find_among(o)&&l.eq_s("்")&&(l.ket=l.cursor,l.slice_del())&&(c=l.cursor,D(),l.cursor=c),l.cursor=r,c=l.cursor,A()&&(l.limit_backward=l.cursor,l.cursor=l.limit,i=l.limit-l.cursor,l.ket=l.cursor,0!=l.find_among_b(v)&&(l.bra=l.cursor,!l.slice_from("்"))||(l.cursor=l.limit-i,l.cursor=l.limit_backward,E())),l.cursor=c,i=l.cursor,A()&&(l.limit_backward=l.cursor,l.cursor=l.limit,l.ket=l.cursor,l.eq_s_b("ும்"))&&(l.bra=l.cursor,l.slice_from("்"))&&(l.cursor=l.limit_backward,c=l.cursor,F(),l.cursor=c),l.cursor=i,c=l.cursor,(()=>{var r;if(A()&&(l.limit_backward=l.cursor,l.cursor=l.limit,l.ket=l.cursor,0!=(r=l.find_among_b(q)))){switch(l.bra=l.cursor,r){case 1:if(l.slice_from("்"))break;return;case 2:var i=l.limit-l.cursor;if(0!=l.find_among_b(w))return;if(l.cursor=l.limit-i,l.slice_from("்"))break;return;case 3:if(l.slice_del())break;return}l.cursor=l.limit_backward,E()}})(),l.cursor=c,c=l.cursor,(()=>{var r;if(y=!1,A()){l.limit_backward=l.cursor,l.cursor=l.limit;r:{var i=l.limit-l.cursor;i:{var c=l.limit-l.cursor;if(l.ket=l.cursor,0!=(r=l.find_among_b(S))){switch(l.bra=l.cursor,r){case 1:if(l.slice_del())break;return;case 2:if(l.slice_from("்"))break;return;case 3:var e=l.limit-l.cursor;if(l.eq_s_b("ம"))break i;if(l.cursor=l.limit-e,l.slice_from("்"))break;return;case 4:if(l.current.length<7)break i;if(l.slice_from("்"))break;return;case 5:var s=l.limit-l.cursor;if(0!=l.find_among_b(h))break i;if(l.cursor=l.limit-s,l.slice_from("்"))break;return;case 6:var o=l.limit-l.cursor;if(0!=l.find_among_b(C))break i;if(l.cursor=l.limit-o,l.slice_del())break;return;case 7:if(l.slice_from("ி"))break;return}l.cursor=l.limit-c;break r}}l.cursor=l.limit-i;i=l.limit-l.cursor;if(l.ket=l.cursor,!l.eq_s_b("ை"))return;var u=l.limit-l.cursor,a=l.limit-l.cursor;if(0==l.find_among_b(B))l.cursor=l.limit-a;else{l.cursor=l.limit-u;a=l.limit-l.cursor;if(0==l.find_among_b(T))return;if(!l.eq_s_b("்"))return;l.cursor=l.limit-a}if(l.bra=l.cursor,!l.slice_from("்"))return;l.cursor=l.limit-i}y=!0;var t=l.limit-l.cursor;l.ket=l.cursor,l.eq_s_b("ின்")&&(l.bra=l.cursor,!l.slice_from("்"))||(l.cursor=l.limit-t,l.cursor=l.limit_backward,E())}})(),l.cursor=c,c=l.cursor,(()=>{var r;if(l.limit_backward=l.cursor,l.cursor=l.limit,l.ket=l.cursor,0!=(r=l.find_among_b(d))){switch(l.bra=l.cursor,r){case 1:r:{var i=l.limit-l.cursor;if(0!=l.find_among_b(u)){if(l.slice_from("ுங்"))break r;return}if(l.cursor=l.limit-i,!l.slice_from("்"))return}break;case 2:if(l.slice_from("ல்"))break;return;case 3:if(l.slice_from("ள்"))break;return;case 4:if(l.slice_del())break;return}l.cursor=l.limit_backward}})(),l.cursor=c,c=l.cursor,A()&&(l.limit_backward=l.cursor,l.cursor=l.limit,l.ket=l.cursor,0!=l.find_among_b(g))&&(l.bra=l.cursor,l.slice_del())&&(l.cursor=l.limit_backward),l.cursor=c,c=l.cursor,G(),l.cursor=c,!0)},this.stemWord=function(r){return l.setCurrent(r),this.stem(),l.getCurrent()}};
\ No newline at end of file
@@ -0,0 +1 @@
+var YiddishStemmer=function(){var t=new BaseStemmer,l=[["וו",-1,1],["וי",-1,2],["יי",-1,3],["ך",-1,4],["ם",-1,5],["ן",-1,6],["ף",-1,7],["ץ",-1,8]],a=[["אדורכ",-1,1],["אהינ",-1,1],["אהער",-1,1],["אהײמ",-1,1],["אומ",-1,1],["אונטער",-1,1],["איבער",-1,1],["אנ",-1,1],["אנט",7,1],["אנטקעגנ",8,1],["אנידער",7,1],["אפ",-1,1],["אפיר",11,1],["אקעגנ",-1,1],["אראפ",-1,1],["ארומ",-1,1],["ארונטער",-1,1],["אריבער",-1,1],["ארױס",-1,1],["ארױפ",-1,1],["ארײנ",-1,1],["אװעק",-1,1],["אױס",-1,1],["אױפ",-1,1],["אײנ",-1,1],["בא",-1,1],["בײ",-1,1],["דורכ",-1,1],["דער",-1,1],["מיט",-1,1],["נאכ",-1,1],["פאר",-1,1],["פארבײ",31,1],["פארױס",31,1],["פונאנדער",-1,1],["צו",-1,1],["צוזאמענ",35,1],["צונױפ",35,1],["צוריק",35,1],["צע",-1,1]],f=[["דזש",-1,-1],["שטר",-1,-1],["שטש",-1,-1],["שפר",-1,-1]],n=[["קליב",-1,9],["ריב",-1,10],["טריב",1,7],["שריב",1,15],["הױב",-1,23],["שװיג",-1,12],["גאנג",-1,1],["זונג",-1,18],["שלונג",-1,21],["צװונג",-1,20],["בױג",-1,22],["בונד",-1,16],["װיז",-1,6],["ביט",-1,4],["ליט",-1,8],["מיט",-1,3],["שניט",-1,14],["נומ",-1,2],["שטאנ",-1,25],["ביס",-1,5],["שמיס",-1,13],["ריס",-1,11],["טרונק",-1,19],["פארלױר",-1,24],["שװױר",-1,26],["װוטש",-1,17]],_=[["ונג",-1,1],["סטו",-1,1],["ט",-1,1],["בראכט",2,31],["סט",2,1],["יסט",4,33],["עט",2,1],["שאפט",2,1],["הײט",2,1],["קײט",2,1],["יקײט",9,1],["לעכ",-1,1],["עלעכ",11,1],["יזמ",-1,1],["ימ",-1,1],["עמ",-1,1],["ענעמ",15,3],["טענעמ",16,4],["נ",-1,1],["קליבנ",18,14],["ריבנ",18,15],["טריבנ",20,12],["שריבנ",20,7],["הױבנ",18,27],["שװיגנ",18,17],["זונגנ",18,22],["שלונגנ",18,25],["צװונגנ",18,24],["בױגנ",18,26],["בונדנ",18,20],["װיזנ",18,11],["טנ",18,4],["GEביטנ",31,9],["GEליטנ",31,13],["GEמיטנ",31,8],["שניטנ",31,19],["סטנ",31,1],["יסטנ",36,1],["עטנ",31,1],["GEביסנ",18,10],["שמיסנ",18,18],["GEריסנ",18,16],["ענ",18,1],["גאנגענ",42,5],["עלענ",42,1],["נומענ",42,6],["יזמענ",42,1],["שטאנענ",42,29],["טרונקנ",18,23],["פארלױרנ",18,28],["שװױרנ",18,30],["װוטשנ",18,21],["גײנ",18,5],["ס",-1,1],["טס",53,4],["עטס",54,1],["נס",53,1],["טנס",56,4],["ענס",56,3],["עס",53,1],["יעס",59,2],["עלעס",59,1],["ערס",53,1],["ענערס",62,1],["ע",-1,1],["טע",64,4],["סטע",65,1],["עטע",65,1],["יע",64,-1],["עלע",64,1],["ענע",64,3],["טענע",70,4],["ער",-1,1],["טער",72,4],["סטער",73,1],["עטער",73,1],["ענער",72,3],["טענער",76,4],["ות",-1,32]],b=[["ונג",-1,1],["שאפט",-1,1],["הײט",-1,1],["קײט",-1,1],["יקײט",3,1],["ל",-1,2]],m=[["יג",-1,1],["יק",-1,1],["דיק",1,1],["נדיק",2,1],["ענדיק",3,1],["בליק",1,-1],["גליק",1,-1],["ניק",1,1],["יש",-1,1]],k=[255,155,6],g=[33,2,4,0,6],d=[239,254,253,131],v=0,q=0;function h(){return q<=t.cursor}function e(){var r,e=t.limit-t.cursor;r:if(t.ket=t.cursor,0!=(r=t.find_among_b(_)))switch(t.bra=t.cursor,r){case 1:if(!h())break r;if(t.slice_del())break;return;case 2:if(!h())break r;if(t.slice_from("יע"))break;return;case 3:if(h()){if(!t.slice_del())return;if(t.ket=t.cursor,0!=(r=t.find_among_b(n)))switch(t.bra=t.cursor,r){case 1:if(t.slice_from("גײ"))break;return;case 2:if(t.slice_from("נעמ"))break;return;case 3:if(t.slice_from("מײד"))break;return;case 4:if(t.slice_from("בײט"))break;return;case 5:if(t.slice_from("בײס"))break;return;case 6:if(t.slice_from("װײז"))break;return;case 7:if(t.slice_from("טרײב"))break;return;case 8:if(t.slice_from("לײט"))break;return;case 9:if(t.slice_from("קלײב"))break;return;case 10:if(t.slice_from("רײב"))break;return;case 11:if(t.slice_from("רײס"))break;return;case 12:if(t.slice_from("שװײג"))break;return;case 13:if(t.slice_from("שמײס"))break;return;case 14:if(t.slice_from("שנײד"))break;return;case 15:if(t.slice_from("שרײב"))break;return;case 16:if(t.slice_from("בינד"))break;return;case 17:if(t.slice_from("װיטש"))break;return;case 18:if(t.slice_from("זינג"))break;return;case 19:if(t.slice_from("טרינק"))break;return;case 20:if(t.slice_from("צװינג"))break;return;case 21:if(t.slice_from("שלינג"))break;return;case 22:if(t.slice_from("בײג"))break;return;case 23:if(t.slice_from("הײב"))break;return;case 24:if(t.slice_from("פארליר"))break;return;case 25:if(t.slice_from("שטײ"))break;return;case 26:if(t.slice_from("שװער"))break;return}}break;case 4:e:{var s=t.limit-t.cursor;if(h()){if(t.slice_del())break e;return}if(t.cursor=t.limit-s,!t.slice_from("ט"))return}if(t.ket=t.cursor,!t.eq_s_b("בראכ"))break r;var i=t.limit-t.cursor;if(t.eq_s_b("גע")||(t.cursor=t.limit-i),t.bra=t.cursor,t.slice_from("ברענג"))break;return;case 5:if(t.slice_from("גײ"))break;return;case 6:if(t.slice_from("נעמ"))break;return;case 7:if(t.slice_from("שרײב"))break;return;case 8:if(t.slice_from("מײד"))break;return;case 9:if(t.slice_from("בײט"))break;return;case 10:if(t.slice_from("בײס"))break;return;case 11:if(t.slice_from("װײז"))break;return;case 12:if(t.slice_from("טרײב"))break;return;case 13:if(t.slice_from("לײט"))break;return;case 14:if(t.slice_from("קלײב"))break;return;case 15:if(t.slice_from("רײב"))break;return;case 16:if(t.slice_from("רײס"))break;return;case 17:if(t.slice_from("שװײג"))break;return;case 18:if(t.slice_from("שמײס"))break;return;case 19:if(t.slice_from("שנײד"))break;return;case 20:if(t.slice_from("בינד"))break;return;case 21:if(t.slice_from("װיטש"))break;return;case 22:if(t.slice_from("זינג"))break;return;case 23:if(t.slice_from("טרינק"))break;return;case 24:if(t.slice_from("צװינג"))break;return;case 25:if(t.slice_from("שלינג"))break;return;case 26:if(t.slice_from("בײג"))break;return;case 27:if(t.slice_from("הײב"))break;return;case 28:if(t.slice_from("פארליר"))break;return;case 29:if(t.slice_from("שטײ"))break;return;case 30:if(t.slice_from("שװער"))break;return;case 31:if(t.slice_from("ברענג"))break;return;case 32:if(!h())break r;if(t.slice_from("ה"))break;return;case 33:var i=t.limit-t.cursor,c=t.limit-t.cursor;if(t.eq_s_b("ג")||(t.cursor=t.limit-c,t.eq_s_b("ש"))){c=t.limit-t.cursor;if(q<=t.cursor+3){if(!t.slice_from("יס"))return}else t.cursor=t.limit-c}else{if(t.cursor=t.limit-i,!h())break r;if(!t.slice_del())return}}t.cursor=t.limit-e;e=t.limit-t.cursor;r:if(t.ket=t.cursor,0!=(r=t.find_among_b(b)))switch(t.bra=t.cursor,r){case 1:if(!h())break r;if(t.slice_del())break;return;case 2:if(!h())break r;if(!t.in_grouping_b(d,1489,1520))break r;if(t.slice_del())break;return}t.cursor=t.limit-e;e=t.limit-t.cursor;r:if(t.ket=t.cursor,0!=(r=t.find_among_b(m)))switch(t.bra=t.cursor,r){case 1:if(!h())break r;if(t.slice_del())break;return}t.cursor=t.limit-e;for(e=t.limit-t.cursor;;){var o=t.limit-t.cursor;r:{for(;;){var u=t.limit-t.cursor,a=(t.ket=t.cursor,t.limit-t.cursor);if(t.eq_s_b("GE")||(t.cursor=t.limit-a,t.eq_s_b("TSU"))){if(t.bra=t.cursor,!t.slice_del())return;t.cursor=t.limit-u;break}if(t.cursor=t.limit-u,t.cursor<=t.limit_backward)break r;t.cursor--}continue}t.cursor=t.limit-o;break}t.cursor=t.limit-e}this.stem=function(){(()=>{for(var r,e=t.cursor;;){var s=t.cursor;r:{for(;;){var i=t.cursor;e:if(t.bra=t.cursor,0!=(r=t.find_among(l))){switch(t.ket=t.cursor,r){case 1:var c=t.cursor;if(t.eq_s("ּ"))break e;if(t.cursor=c,t.slice_from("װ"))break;return;case 2:var o=t.cursor;if(t.eq_s("ִ"))break e;if(t.cursor=o,t.slice_from("ױ"))break;return;case 3:var u=t.cursor;if(t.eq_s("ִ"))break e;if(t.cursor=u,t.slice_from("ײ"))break;return;case 4:if(t.slice_from("כ"))break;return;case 5:if(t.slice_from("מ"))break;return;case 6:if(t.slice_from("נ"))break;return;case 7:if(t.slice_from("פ"))break;return;case 8:if(t.slice_from("צ"))break;return}t.cursor=i;break}if(t.cursor=i,t.cursor>=t.limit)break r;t.cursor++}continue}t.cursor=s;break}for(t.cursor=e,e=t.cursor;;){var a=t.cursor;r:{for(;;){var f=t.cursor;if(t.bra=t.cursor,t.in_grouping(k,1456,1474)){if(t.ket=t.cursor,!t.slice_del())return;t.cursor=f;break}if(t.cursor=f,t.cursor>=t.limit)break r;t.cursor++}continue}t.cursor=a;break}t.cursor=e})();var r=t.cursor;return(()=>{q=t.limit;var r=t.cursor;if(t.bra=t.cursor,t.eq_s("גע")){t.ket=t.cursor;var e=t.cursor,s=t.cursor;if(!t.eq_s("לט")&&(t.cursor=s,!t.eq_s("בנ"))&&(t.cursor=s,t.cursor<t.limit)){if(t.cursor=e,!t.slice_from("GE"))return}else t.cursor=r}else t.cursor=r;var i=t.cursor;r:if(0==t.find_among(a))t.cursor=i;else e:{var c=t.cursor,o=t.cursor,u=t.cursor;if(!(t.eq_s("צוגנ")||(t.cursor=u,t.eq_s("צוקט"))||(t.cursor=u,t.eq_s("צוקנ")))||t.cursor<t.limit){t.cursor=c;u=t.cursor;if(t.eq_s("געבנ"))t.cursor=u;else{if(t.cursor=c,t.bra=t.cursor,t.eq_s("גע")){if(t.ket=t.cursor,t.slice_from("GE"))break e;return}if(t.cursor=c,t.bra=t.cursor,!t.eq_s("צו")){t.cursor=i;break r}if(t.ket=t.cursor,!t.slice_from("TSU"))return}}else t.cursor=o}s=t.cursor,(e=t.cursor+3)>t.limit||(t.cursor=e,v=t.cursor,t.cursor=s,r=t.cursor,0==t.find_among(f)&&(t.cursor=r),e=t.cursor,t.in_grouping(d,1489,1520)&&t.in_grouping(d,1489,1520)&&t.in_grouping(d,1489,1520)?q=t.cursor:(t.cursor=e,t.go_out_grouping(g,1488,1522)&&(t.cursor++,t.go_in_grouping(g,1488,1522))&&(q=t.cursor,v<=q||(q=v))))})(),t.cursor=r,t.limit_backward=t.cursor,t.cursor=t.limit,e(),t.cursor=t.limit_backward,!0},this.stemWord=function(r){return t.setCurrent(r),this.stem(),t.getCurrent()}};
\ No newline at end of file
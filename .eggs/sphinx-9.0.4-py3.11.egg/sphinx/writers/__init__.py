@@ -0,0 +1 @@
+"""Custom docutils writers."""
@@ -0,0 +1,196 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import itertools
+import os
+import tempfile
+import time
+from optparse import OptionParser
+from os import urandom
+from pathlib import Path
+from types import SimpleNamespace
+
+from core import engine, fs
+from hscommon.util import rem_file_ext
+
+
+def parse_args():
+    usage = "usage: %prog [options]"
+    parser = OptionParser(usage=usage)
+    parser.add_option(
+        "--hashers",
+        action="store_true",
+        dest="hashers",
+        help="Measure the throughput of every available hash algorithm.",
+    )
+    parser.add_option(
+        "--digest",
+        action="store_true",
+        dest="digest",
+        help="Measure the throughput of File digests with a range of values for fs.CHUNK_SIZE.",
+    )
+    parser.add_option(
+        "--size",
+        type="int",
+        dest="size",
+        default=256,
+        help="Amount of data to hash, in MiB (default: %default).",
+    )
+    parser.add_option(
+        "--compare",
+        dest="compare_path",
+        metavar="PATH",
+        help="Measure the speed of word comparisons (as done by filename scans) on the file names found under PATH.",
+    )
+    parser.add_option(
+        "--pairs",
+        type="int",
+        dest="pairs",
+        default=1000000,
+        help="Maximum number of pairs of file names to compare (default: %default).",
+    )
+    parser.add_option(
+        "--lsh",
+        dest="lsh_path",
+        metavar="PATH",
+        help="Measure the speed and recall of MinHash LSH filename matching on the file names found under PATH.",
+    )
+    parser.add_option(
+        "--bands",
+        type="int",
+        dest="bands",
+        default=16,
+        help="Number of LSH bands (default: %default).",
+    )
+    parser.add_option(
+        "--rows",
+        type="int",
+        dest="rows",
+        default=2,
+        help="Number of rows in each LSH band (default: %default).",
+    )
+    parser.add_option(
+        "--min-match",
+        type="int",
+        dest="min_match",
+        default=80,
+        help="Minimum match percentage of filename scans (default: %default).",
+    )
+    (options, args) = parser.parse_args()
+    return options
+
+
+def bench_hashers(size):
+    # Data is hashed from memory in CHUNK_SIZE pieces, like _calc_digest() does, so that the disk
+    # doesn't get in the way.
+    chunk = urandom(fs.CHUNK_SIZE)
+    chunk_count = max(size * 1024 * 1024 // fs.CHUNK_SIZE, 1)
+    total = chunk_count * len(chunk) / (1024 * 1024)
+    print(f"Hashing {total:.0f} MiB with each algorithm (default: {fs.DEFAULT_HASHER})")
+    for name, hasher in sorted(fs.HASHERS.items()):
+        start = time.perf_counter()
+        h = hasher()
+        for _ in range(chunk_count):
+            h.update(chunk)
+        h.digest()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10}: {total / elapsed:10.1f} MiB/s")
+
+
+def bench_digest(size):
+    # The file is likely to be in the OS cache after the first pass, which is what we want: this
+    # measures the CPU cost of reading and hashing, not the disk.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir, "bench")
+        with path.open("wb") as fp:
+            for _ in range(size):
+                fp.write(urandom(1024 * 1024))
+        fs.File(path)._calc_digest()
+        print(f"Hashing a {size} MiB file with {fs.hasher_name}")
+        for chunk_size in [64 * 1024, 256 * 1024, 1024 * 1024, 4 * 1024 * 1024]:
+            fs.CHUNK_SIZE = chunk_size
+            start = time.perf_counter()
+            fs.File(path)._calc_digest()
+            elapsed = time.perf_counter() - start
+            actual = fs.chunk_size(size * 1024 * 1024) // 1024
+            print(f"CHUNK_SIZE={chunk_size // 1024:>5} KiB (reads of {actual} KiB): {size / elapsed:10.1f} MiB/s")
+
+
+def get_word_lists(path):
+    vocabulary = engine.Vocabulary()
+    word_lists = []
+    for _, _, filenames in os.walk(path):
+        word_lists += (vocabulary.encode(engine.getwords(name)) for name in filenames)
+    return vocabulary, word_lists
+
+
+def get_pairs(word_lists, limit):
+    # The pairs getmatches() would compare: files sharing a word.
+    word_dict = engine.build_word_dict(word_lists)
+    pairs = []
+    for indexes in word_dict.values():
+        pairs += itertools.islice(itertools.combinations(indexes, 2), limit - len(pairs))
+        if len(pairs) >= limit:
+            break
+    return pairs
+
+
+def bench_compare(path, limit):
+    vocabulary, word_lists = get_word_lists(path)
+    pairs = get_pairs(word_lists, limit)
+    print(f"Comparing {len(pairs)} pairs of the {len(word_lists)} file names under {path}")
+    for flags in [(), (engine.WEIGHT_WORDS,)]:
+        start = time.perf_counter()
+        expected = [engine.compare(word_lists[i], word_lists[j], flags, vocabulary) for i, j in pairs]
+        list_elapsed = time.perf_counter() - start
+        lengths = vocabulary.lengths if flags else None
+        start = time.perf_counter()
+        multisets = [engine.WordMultiset(words, lengths) for words in word_lists]
+        prepare_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        results = [multisets[i].compare(multisets[j], lengths) for i, j in pairs]
+        multiset_elapsed = time.perf_counter() - start
+        assert results == expected
+        print(
+            f"flags={flags}: compare() {list_elapsed:.2f}s, WordMultiset {multiset_elapsed:.2f}s "
+            f"(+{prepare_elapsed:.2f}s to prepare), {list_elapsed / multiset_elapsed:.1f}x"
+        )
+
+
+def get_named_objects(path):
+    # Words are read like Scanner does for filename scans.
+    names = (name for _, _, filenames in os.walk(path) for name in filenames)
+    return [SimpleNamespace(words=engine.getwords(rem_file_ext(name))) for name in names]
+
+
+def bench_lsh(path, bands, rows, min_match):
+    objects = get_named_objects(path)
+    print(f"Matching the {len(objects)} file names under {path} at {min_match}%")
+    start = time.perf_counter()
+    exact = {frozenset((id(m.first), id(m.second))) for m in engine.getmatches(objects, min_match)}
+    print(f"Exact: {time.perf_counter() - start:.2f}s, {len(exact)} matches")
+    start = time.perf_counter()
+    matches = engine.getmatches(objects, min_match, lsh_bands=bands, lsh_rows=rows)
+    elapsed = time.perf_counter() - start
+    found = sum(1 for m in matches if frozenset((id(m.first), id(m.second))) in exact)
+    recall = found / len(exact) if exact else 1
+    print(f"LSH ({bands} bands of {rows} rows): {elapsed:.2f}s, {len(matches)} matches, recall: {recall:.1%}")
+
+
+def main():
+    options = parse_args()
+    if options.hashers:
+        bench_hashers(options.size)
+    if options.digest:
+        bench_digest(options.size)
+    if options.compare_path:
+        bench_compare(options.compare_path, options.pairs)
+    if options.lsh_path:
+        bench_lsh(options.lsh_path, options.bands, options.rows, options.min_match)
+    if not (options.hashers or options.digest or options.compare_path or options.lsh_path):
+        print("Nothing to benchmark, see --help.")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,9 +26,11 @@ from hscommon import desktop
 from core import se, me, pe
 from core.pe.photo import get_delta_dimensions
 from core.util import cmp_value, fix_surrogate_encoding
-from core import directories, results, export, fs, prioritize
+from core import directories, results, export, fs, hashing, prioritize, watch
 from core.ignore import IgnoreList
 from core.exclude import ExcludeDict as ExcludeList
+from core.filetable import FileTable
+from core.snapshot import DirectorySnapshot
 from core.scanner import ScanType
 from core.gui.deletion_options import DeletionOptions
 from core.gui.details_panel import DetailsPanel
@@ -141,6 +143,8 @@ class DupeGuru(Broadcaster):
         hash_cache_file = op.join(self.appdata, "hash_cache.db")
         fs.filesdb.connect(hash_cache_file)
         self.directories = directories.Directories(self.exclude_list)
+        self.directories.snapshot = DirectorySnapshot()
+        self.directories.snapshot.connect(op.join(self.appdata, "directory_snapshot.db"))
         self.results = results.Results(self)
         self.ignore_list = IgnoreList()
         # In addition to "app-level" options, this dictionary also holds options that will be
@@ -153,7 +157,14 @@ class DupeGuru(Broadcaster):
             "copymove_dest_type": DestType.RELATIVE,
             "include_exists_check": True,
             "rehash_ignore_mtime": False,
+            "hash_algorithm": fs.DEFAULT_HASHER,
+            "hash_workers": 0,
+            "device_hash_workers": {},
+            "watch_folders": False,
         }
+        # Keeps results up to date between scans when the "watch_folders" option is set.
+        self.watcher = None
+        self._watcher_keys = None
         self.selected_dupes = []
         self.details_panel = DetailsPanel(self)
         self.directory_tree = DirectoryTree(self)
@@ -181,6 +192,48 @@ class DupeGuru(Broadcaster):
         self.result_table.connect()
         self.view.create_results_window()
 
+    def _watches_folders(self, scanner):
+        # Folders scans, and removing hardlinks from the files to scan, aren't supported by the watcher.
+        return (
+            self.options["watch_folders"]
+            and watch.is_available()
+            and scanner.scan_type != ScanType.FOLDERS
+            and not self.options["ignore_hardlink_matches"]
+        )
+
+    def _get_watched_dupe_groups(self, scanner, j):
+        # Rescans only walk and match what changed since the previous one. The watcher walks the folders
+        # again when their selection changes, and matches everything again when anything else that
+        # results depend on does.
+        folders_key = (
+            self.app_mode,
+            tuple(self.fileclasses),
+            tuple(self.directories),
+            sorted(self.directories.states.items()),
+            list(self.exclude_list),
+        )
+        results_key = (sorted(self.options.items()), frozenset(self.ignore_list))
+        if self.watcher is None or self._watcher_keys[0] != folders_key:
+            self._stop_watching()
+            self.watcher = watch.DirectoryWatcher(
+                self.directories,
+                self.fileclasses,
+                picture_cache_path=getattr(scanner, "cache_path", None),
+            )
+            self.watcher.start(j)
+        elif self._watcher_keys[1] != results_key:
+            self.watcher.invalidate()
+        self._watcher_keys = (folders_key, results_key)
+        self.watcher.hash_workers = scanner.hash_workers or None
+        self.watcher.device_hash_workers = scanner.device_hash_workers
+        return self.watcher.get_dupe_groups(scanner, self.ignore_list, j)
+
+    def _stop_watching(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+            self._watcher_keys = None
+
     def _get_picture_cache_path(self):
         cache_name = "cached_pictures.db"
         return op.join(self.appdata, cache_name)
@@ -331,16 +384,19 @@ class DupeGuru(Broadcaster):
 
     @staticmethod
     def _remove_hardlink_dupes(files):
+        # dev and inode come from the directory listing, no need to stat files again.
+        if isinstance(files, FileTable):
+            return files.remove_hardlink_dupes()
         seen_inodes = set()
         result = []
         for file in files:
-            try:
-                inode = file.path.stat().st_ino
-            except OSError:
-                # The file was probably deleted or something
+            if not file.inode:
+                # Either the file was deleted or something, or its filesystem doesn't have inodes.
+                result.append(file)
                 continue
-            if inode not in seen_inodes:
-                seen_inodes.add(inode)
+            key = (file.dev, file.inode)
+            if key not in seen_inodes:
+                seen_inodes.add(key)
                 result.append(file)
         return result
 
@@ -425,6 +481,7 @@ class DupeGuru(Broadcaster):
 
     def clear_hash_cache(self):
         fs.filesdb.clear()
+        self.directories.snapshot.clear()
 
     def copy_or_move(self, dupe, copy: bool, destination: str, dest_type: DestType):
         source_path = dupe.path
@@ -764,7 +821,9 @@ class DupeGuru(Broadcaster):
         self.notify("save_session")
 
     def close(self):
+        self._stop_watching()
         fs.filesdb.close()
+        self.directories.snapshot.close()
 
     def save_as(self, filename):
         """Save results in ``filename``.
@@ -793,6 +852,11 @@ class DupeGuru(Broadcaster):
         """
         scanner = self.SCANNER_CLASS()
         fs.filesdb.ignore_mtime = self.options["rehash_ignore_mtime"] is True
+        try:
+            fs.set_hasher(self.options["hash_algorithm"])
+        except ValueError:
+            logging.warning("Hash algorithm %r isn't available, using the default one", self.options["hash_algorithm"])
+            fs.set_hasher(fs.DEFAULT_HASHER)
         if not self.directories.has_any_file():
             self.view.show_message(tr("The selected directories contain no scannable file."))
             return
@@ -802,6 +866,8 @@ class DupeGuru(Broadcaster):
                 setattr(scanner, k, v)
         if self.app_mode == AppMode.PICTURE:
             scanner.cache_path = self._get_picture_cache_path()
+        if not self._watches_folders(scanner):
+            self._stop_watching()
         self.results.groups = []
         self._recreate_result_table()
         self._results_changed()
@@ -811,14 +877,28 @@ class DupeGuru(Broadcaster):
                 pr = cProfile.Profile()
                 pr.enable()
             j.set_progress(0, tr("Collecting files to scan"))
-            if scanner.scan_type == ScanType.FOLDERS:
-                files = list(self.directories.get_folders(folderclass=se.fs.Folder, j=j))
+            if self._watches_folders(scanner):
+                self.results.groups = self._get_watched_dupe_groups(scanner, j)
             else:
-                files = list(self.directories.get_files(fileclasses=self.fileclasses, j=j))
-            if self.options["ignore_hardlink_matches"]:
-                files = self._remove_hardlink_dupes(files)
-            logging.info("Scanning %d files" % len(files))
-            self.results.groups = scanner.get_dupe_groups(files, self.ignore_list, j)
+                if scanner.scan_type == ScanType.FOLDERS:
+                    files = list(self.directories.get_folders(folderclass=se.fs.Folder, j=j))
+                elif scanner.scan_type == ScanType.CONTENTS:
+                    # Only files that might have a duplicate become File instances, see FileTable. They
+                    # start being hashed during the walk, the scan then finds their digests in the cache.
+                    with hashing.DigestPool(scanner.hash_workers or None, scanner.device_hash_workers) as pool:
+                        table = FileTable(
+                            self.fileclasses,
+                            pool=pool,
+                            min_size=scanner.size_threshold,
+                            max_size=scanner.large_size_threshold,
+                        )
+                        files = self.directories.get_file_table(table=table, j=j)
+                else:
+                    files = list(self.directories.get_files(fileclasses=self.fileclasses, j=j))
+                if self.options["ignore_hardlink_matches"]:
+                    files = self._remove_hardlink_dupes(files)
+                logging.info("Scanning %d files" % len(files))
+                self.results.groups = scanner.get_dupe_groups(files, self.ignore_list, j)
             self.discarded_file_count = scanner.discarded_file_count
             if profile_scan:
                 pr.disable()
@@ -7,6 +7,7 @@
 import os
 from xml.etree import ElementTree as ET
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from hscommon.jobprogress import job
@@ -14,6 +15,7 @@ from hscommon.util import FileOrPath
 from hscommon.trans import tr
 
 from core import fs
+from core.filetable import FileTable
 
 __all__ = [
     "Directories",
@@ -23,6 +25,23 @@ __all__ = [
 ]
 
 
+def _scandir(path, snapshot=None):
+    # Runs in a walker thread. Lists ``path`` and stats its files, os.DirEntry keeps the result of
+    # both calls so that they aren't repeated in the job thread.
+    if snapshot is not None:
+        entries = snapshot.scandir(path)
+    else:
+        with os.scandir(path) as iter:
+            entries = list(iter)
+    for entry in entries:
+        try:
+            if not entry.is_dir():
+                entry.stat()
+        except OSError:
+            pass
+    return entries
+
+
 class DirectoryState:
     """Enum describing how a folder should be considered.
 
@@ -54,6 +73,11 @@ class Directories:
     in :mod:`core.fs`) that have to be scanned according to the chosen folders/states.
     """
 
+    # Number of threads listing folders ahead of time in get_files()
+    walker_threads = 8
+    # If set, a DirectorySnapshot from which get_files() reuses the listings of unchanged folders
+    snapshot = None
+
     # ---Override
     def __init__(self, exclude_list=None):
         self._dirs = []
@@ -90,52 +114,90 @@ class Directories:
             return DirectoryState.EXCLUDED
         return DirectoryState.NORMAL
 
-    def _get_files(self, from_path, fileclasses, j):
+    def _skip_subfolders(self, path, state):
+        # if we have no un-excluded dirs under this directory skip going deeper
+        return state == DirectoryState.EXCLUDED and not any(
+            p.parts[: len(path.parts)] == path.parts for p in self.states
+        )
+
+    def _get_entries(self, from_path, fileclasses, j):
+        # Yields (entry, fileclass, is_ref) for each file to scan under ``from_path``, ``fileclass``
+        # being the first of ``fileclasses`` able to handle ``entry``, an os.DirEntry.
+        # Folders are listed (and their files stat'ed) ahead of time in walker threads, which hides
+        # the latency of each call on network filesystems. Entries are still yielded from this
+        # thread, in the same order as a plain recursive walk.
+        with ThreadPoolExecutor(max_workers=self.walker_threads, thread_name_prefix="DirectoryWalker") as executor:
+            listing = executor.submit(_scandir, from_path, self.snapshot)
+            yield from self._walk_entries(from_path, listing, fileclasses, executor, j)
+
+    def _walk_entries(self, from_path, listing, fileclasses, executor, j):
         try:
-            with os.scandir(from_path) as iter:
-                root_path = Path(from_path)
-                state = self.get_state(root_path)
-                # if we have no un-excluded dirs under this directory skip going deeper
-                skip_dirs = state == DirectoryState.EXCLUDED and not any(
-                    p.parts[: len(root_path.parts)] == root_path.parts for p in self.states
-                )
-                count = 0
-                for item in iter:
-                    j.check_if_cancelled()
+            entries = listing.result()
+        except OSError:
+            return
+        root_path = Path(from_path)
+        state = self.get_state(root_path)
+        skip_dirs = self._skip_subfolders(root_path, state)
+        # {path: future listing}, subfolders are listed while we go through this folder's files.
+        listings = {}
+        try:
+            if not skip_dirs:
+                for item in entries:
                     try:
                         if item.is_dir():
-                            if skip_dirs:
-                                continue
-                            yield from self._get_files(item.path, fileclasses, j)
-                            continue
-                        elif state == DirectoryState.EXCLUDED:
-                            continue
-                        # File excluding or not
-                        if (
-                            self._exclude_list is None
-                            or not self._exclude_list.mark_count
-                            or not self._exclude_list.is_excluded(str(from_path), item.name)
-                        ):
-                            file = fs.get_file(item, fileclasses=fileclasses)
-                            if file:
-                                file.is_ref = state == DirectoryState.REFERENCE
-                                count += 1
-                                yield file
-                    except (OSError, fs.InvalidPath):
+                            listings[item.path] = executor.submit(_scandir, item.path, self.snapshot)
+                    except OSError:
                         pass
-                logging.debug(
-                    "Collected %d files in folder %s",
-                    count,
-                    str(root_path),
-                )
-        except OSError:
-            pass
+            count = 0
+            for item in entries:
+                j.check_if_cancelled()
+                try:
+                    if item.is_dir():
+                        if skip_dirs:
+                            continue
+                        listing = listings.pop(item.path, None)
+                        if listing is None:
+                            # is_dir() failed above but not this time, list the folder right away.
+                            listing = Future()
+                            try:
+                                listing.set_result(_scandir(item.path, self.snapshot))
+                            except OSError as e:
+                                listing.set_exception(e)
+                        yield from self._walk_entries(item.path, listing, fileclasses, executor, j)
+                        continue
+                    elif state == DirectoryState.EXCLUDED:
+                        continue
+                    # File excluding or not
+                    if (
+                        self._exclude_list is None
+                        or not self._exclude_list.mark_count
+                        or not self._exclude_list.is_excluded(str(from_path), item.name)
+                    ):
+                        fileclass = fs.get_fileclass(item, fileclasses=fileclasses)
+                        if fileclass is not None:
+                            count += 1
+                            yield item, fileclass, state == DirectoryState.REFERENCE
+                except OSError:
+                    pass
+            logging.debug(
+                "Collected %d files in folder %s",
+                count,
+                str(root_path),
+            )
+        finally:
+            # When cancelled, don't wait for listings nobody will look at.
+            for future in listings.values():
+                future.cancel()
 
     def _get_folders(self, from_folder, j):
         j.check_if_cancelled()
         try:
             for subfolder in from_folder.subfolders:
                 yield from self._get_folders(subfolder, j)
+            # Subfolders are done, which makes this a post-order traversal: the size of every
+            # subfolder is already known, computing (and caching) the folder's size now only sums
+            # its children's instead of walking the whole tree again when it's first needed.
+            from_folder._read_all_info(attrnames=["size"])
             state = self.get_state(from_folder.path)
             if state != DirectoryState.EXCLUDED:
                 from_folder.is_ref = state == DirectoryState.REFERENCE
@@ -176,6 +238,24 @@ class Directories:
         except OSError:
             return []
 
+    def _iter_entries(self, fileclasses, j):
+        if self.snapshot is not None:
+            self.snapshot.reset_counts()
+        file_count = 0
+        for path in self._dirs:
+            for entry in self._get_entries(path, fileclasses=fileclasses, j=j):
+                file_count += 1
+                if type(j) != job.NullJob:
+                    j.set_progress(-1, tr("Collected {} files to scan").format(file_count))
+                yield entry
+        if self.snapshot is not None:
+            self.snapshot.flush()
+            logging.info(
+                "Listed %d folders, reused the listing of %d folders from the snapshot",
+                self.snapshot.listed_count,
+                self.snapshot.reused_count,
+            )
+
     def get_files(self, fileclasses=None, j=job.nulljob):
         """Returns a list of all files that are not excluded.
 
@@ -183,13 +263,29 @@ class Directories:
         """
         if fileclasses is None:
             fileclasses = [fs.File]
-        file_count = 0
-        for path in self._dirs:
-            for file in self._get_files(path, fileclasses=fileclasses, j=j):
-                file_count += 1
-                if type(j) != job.NullJob:
-                    j.set_progress(-1, tr("Collected {} files to scan").format(file_count))
-                yield file
+        for entry, fileclass, is_ref in self._iter_entries(fileclasses, j):
+            try:
+                file = fileclass(entry)
+            except (OSError, fs.InvalidPath):
+                continue
+            file.is_ref = is_ref
+            yield file
+
+    def get_file_table(self, fileclasses=None, table=None, j=job.nulljob):
+        """Returns a :class:`~core.filetable.FileTable` of all files that are not excluded.
+
+        Same as :meth:`get_files`, but without creating a :class:`~core.fs.File` for each file.
+        Files are added to ``table`` if it's given, in which case its ``fileclasses`` are used.
+        """
+        if table is None:
+            table = FileTable(fileclasses if fileclasses is not None else [fs.File])
+        fileclasses = table.fileclasses
+        for entry, fileclass, is_ref in self._iter_entries(fileclasses, j):
+            try:
+                table.append(entry, fileclass, is_ref)
+            except OSError:
+                continue
+        return table
 
     def get_folders(self, folderclass=None, j=job.nulljob):
         """Returns a list of all folders that are not excluded.
@@ -216,7 +312,7 @@ class Directories:
         if path in self.states:
             return self.states[path]
         state = self._default_state_for_path(path)
-        # Save non-default states in cache, necessary for _get_files()
+        # Save non-default states in cache, necessary for _get_entries()
         if state != DirectoryState.NORMAL:
             self.states[path] = state
             return state
@@ -227,6 +323,23 @@ class Directories:
                 return self.states[parent_path]
         return state
 
+    def get_file_state(self, path):
+        """Returns the state of file ``path``.
+
+        It's the state of its folder, unless the exclude list excludes the file itself.
+
+        :rtype: :class:`DirectoryState`
+        """
+        state = self.get_state(path.parent)
+        if (
+            state != DirectoryState.EXCLUDED
+            and self._exclude_list is not None
+            and self._exclude_list.mark_count
+            and self._exclude_list.is_excluded(str(path.parent), path.name)
+        ):
+            return DirectoryState.EXCLUDED
+        return state
+
     def has_any_file(self):
         """Returns whether selected folders contain any file.
 
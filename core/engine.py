@@ -9,14 +9,18 @@
 import difflib
 import itertools
 import logging
+import random
 import string
-from collections import defaultdict, namedtuple
+from array import array
+from collections import defaultdict, deque, namedtuple
 from unicodedata import normalize
 
-from hscommon.util import flatten, multi_replace
+from hscommon.util import extract, flatten, multi_replace
 from hscommon.trans import tr
 from hscommon.jobprogress import job
 
+from core import hashing
+
 (
     WEIGHT_WORDS,
     MATCH_SIMILAR_WORDS,
@@ -24,7 +28,11 @@ from hscommon.jobprogress import job
 ) = range(3)
 
 JOB_REFRESH_RATE = 100
+# Minimum number of files hashed together during a contents scan (see getmatches_by_contents()).
+HASH_BATCH_SIZE = 1000
 PROGRESS_MESSAGE = tr("%d matches found from %d groups")
+# Modulus of the MinHash functions, see minhash_candidates().
+MINHASH_PRIME = (1 << 61) - 1
 
 
 def getwords(s):
@@ -54,51 +62,265 @@ def getfields(s):
 def unpack_fields(fields):
     result = []
     for field in fields:
-        if isinstance(field, list):
+        if isinstance(field, (list, array)):
             result += field
         else:
             result.append(field)
     return result
 
 
-def compare(first, second, flags=()):
+class Vocabulary:
+    """Gives each distinct word an integer id.
+
+    A list of words is then encoded as an ``array("I")`` of ids, which takes a fraction of the
+    memory of a list of strings and is much faster to compare.
+
+    .. attribute:: similar_words
+
+        :class:`SimilarWords` of the vocabulary, if they have been looked for. They're then used
+        instead of ``difflib`` to find similar words.
+    """
+
+    def __init__(self):
+        # Words and their length, by id
+        self.words = []
+        self.lengths = array("I")
+        self._ids = {}
+        self.similar_words = None
+
+    def __len__(self):
+        return len(self.words)
+
+    def get_id(self, word):
+        result = self._ids.get(word)
+        if result is None:
+            result = self._ids[word] = len(self.words)
+            self.words.append(word)
+            self.lengths.append(len(word))
+        return result
+
+    def encode(self, words):
+        """Returns ``words`` as an array of ids, or as a list of arrays if they're :ref:`fields`."""
+        if any(isinstance(word, list) for word in words):
+            return [self.encode(field if isinstance(field, list) else [field]) for field in words]
+        return array("I", map(self.get_id, words))
+
+    def decode(self, ids):
+        """Returns the words (or :ref:`fields`) ``ids`` were encoded from."""
+        if any(isinstance(field, array) for field in ids):
+            return [self.decode(field) for field in ids]
+        return [self.words[id] for id in ids]
+
+
+def _multiset(items):
+    # Returns a frozenset in which the n-th occurrence (from 0) of an item is (item, n), the first
+    # one being the item itself. The intersection of two of those is their multiset intersection.
+    counts = {}
+    result = []
+    for item in items:
+        count = counts.get(item, 0)
+        counts[item] = count + 1
+        result.append((item, count) if count else item)
+    return frozenset(result)
+
+
+def _min_common_bigrams(total_length):
+    # Two words whose lengths add up to total_length and that difflib finds similar have at least
+    # this many bigrams in common (counting repeated bigrams). Their ratio is 2 * M / total_length,
+    # M being the size of their B matching blocks, so M >= 2/5 of total_length. Blocks are
+    # separated by at least one unmatched character, so B - 1 <= total_length - 2 * M, and each
+    # block holds all but one of its characters' bigrams: M - B bigrams are common to both words.
+    min_matching = -(-2 * total_length // 5)
+    return 3 * min_matching - total_length - 1
+
+
+class SimilarWords:
+    """Finds, for each word of ``vocabulary``, the words that are similar to it.
+
+    Words are similar if ``difflib.get_close_matches()`` would match them, with a cutoff of 0.8.
+    Comparing each word with all others takes hours with large vocabularies, so candidates are
+    looked up in an index of character bigrams instead: similar words have a minimum number of
+    bigrams in common, which depends on their length (see ``_min_common_bigrams()``). Those
+    candidates are then filtered like ``get_close_matches()`` does, and the result is the same.
+
+    The index is only kept while similar words are looked for, in the constructor.
+    """
+
+    CUTOFF = 0.8
+
+    def __init__(self, vocabulary, j=job.nulljob):
+        self.vocabulary = vocabulary
+        # {word id: ids of similar words, most similar first}. Words without similar words aren't there.
+        self._similar = {}
+        words = vocabulary.words
+        chars = [_multiset(word) for word in words]
+        bigrams = [_multiset(word[i : i + 2] for i in range(len(word) - 1)) for word in words]
+        # {length: ids of words of that length}
+        by_length = defaultdict(lambda: array("I"))
+        # {(bigram, length): ids of words of that length having that bigram}
+        postings = defaultdict(lambda: array("I"))
+        frequencies = defaultdict(int)
+        for id, word in enumerate(words):
+            by_length[len(word)].append(id)
+            for bigram in bigrams[id]:
+                postings[bigram, len(word)].append(id)
+                frequencies[bigram] += 1
+        matcher = difflib.SequenceMatcher()
+        for id in j.iter_with_progress(range(len(words)), "Looked for similar words of %d/%d words", JOB_REFRESH_RATE):
+            word = words[id]
+            length = len(word)
+            # Probing the rarest bigrams of the word is enough to find the words sharing enough of them.
+            word_bigrams = sorted(bigrams[id], key=frequencies.__getitem__)
+            word_chars = chars[id]
+            matcher.set_seq2(word)
+            result = []
+            # The length of similar words is within what real_quick_ratio() accepts.
+            for other_length in range(-(-2 * length // 3), length * 3 // 2 + 1):
+                total_length = length + other_length
+                min_common = _min_common_bigrams(total_length)
+                if min_common > 0:
+                    candidates = set()
+                    for bigram in word_bigrams[: len(word_bigrams) - min_common + 1]:
+                        candidates.update(postings.get((bigram, other_length), ()))
+                    if min_common > 1:
+                        candidates = [c for c in candidates if len(bigrams[id] & bigrams[c]) >= min_common]
+                else:
+                    candidates = by_length.get(other_length, ())
+                for candidate in candidates:
+                    # Same as quick_ratio() >= CUTOFF
+                    if candidate == id or 5 * len(word_chars & chars[candidate]) < 2 * total_length:
+                        continue
+                    other = words[candidate]
+                    matcher.set_seq1(other)
+                    ratio = matcher.ratio()
+                    if ratio >= self.CUTOFF:
+                        result.append((ratio, other, candidate))
+            if result:
+                # Same order as get_close_matches(): by score, then by word, descending.
+                result.sort(reverse=True)
+                self._similar[id] = array("I", (candidate for _, _, candidate in result))
+
+    def get_similar(self, id):
+        """Returns the ids of the words similar to word ``id``, from the most to the least similar."""
+        return self._similar.get(id, ())
+
+    def get_close_match(self, id, ids):
+        """Returns the id among ``ids`` of the word that is the most similar to word ``id``.
+
+        Returns ``None`` if none of them is similar, like ``difflib.get_close_matches(word, words, 1)``.
+        """
+        for similar in self.get_similar(id):
+            if similar in ids:
+                return similar
+        return None
+
+
+def compare(first, second, flags=(), vocabulary=None):
     """Returns the % of words that match between ``first`` and ``second``
 
     The result is a ``int`` in the range 0..100.
-    ``first`` and ``second`` can be either a string or a list (of words).
+    ``first`` and ``second`` can be either a string or a list (of words). If ``vocabulary`` is
+    given, they're sequences of word ids from that :class:`Vocabulary` instead.
     """
     if not (first and second):
         return 0
-    if any(isinstance(element, list) for element in first):
-        return compare_fields(first, second, flags)
+    if any(isinstance(element, (list, array)) for element in first):
+        return compare_fields(first, second, flags, vocabulary)
     second = second[:]  # We must use a copy of second because we remove items from it
     match_similar = MATCH_SIMILAR_WORDS in flags
     weight_words = WEIGHT_WORDS in flags
+    if vocabulary is None:
+        word_len = len
+    else:
+        word_len = vocabulary.lengths.__getitem__
     joined = first + second
-    total_count = sum(len(word) for word in joined) if weight_words else len(joined)
+    total_count = sum(word_len(word) for word in joined) if weight_words else len(joined)
     match_count = 0
     in_order = True
     for word in first:
         if match_similar and (word not in second):
-            similar = difflib.get_close_matches(word, second, 1, 0.8)
+            if vocabulary is None:
+                similar = difflib.get_close_matches(word, second, 1, 0.8)
+            elif vocabulary.similar_words is not None:
+                similar = vocabulary.similar_words.get_close_match(word, second)
+                similar = [] if similar is None else [similar]
+            else:
+                similar = difflib.get_close_matches(
+                    vocabulary.words[word], [vocabulary.words[w] for w in second], 1, 0.8
+                )
+                similar = [vocabulary.get_id(w) for w in similar]
             if similar:
                 word = similar[0]
         if word in second:
             if second[0] != word:
                 in_order = False
             second.remove(word)
-            match_count += len(word) if weight_words else 1
+            match_count += word_len(word) if weight_words else 1
     result = round(((match_count * 2) / total_count) * 100)
     if (result == 100) and (not in_order):
         result = 99  # We cannot consider a match exact unless the ordering is the same
     return result
 
 
-def compare_fields(first, second, flags=()):
+def _is_in_order(first, second):
+    # Whether compare() finds the words of first that are in second in the same order.
+    second = list(second)
+    for word in first:
+        if word in second:
+            if second[0] != word:
+                return False
+            second.remove(word)
+    return True
+
+
+class WordMultiset:
+    """The words of an object (as ids from a :class:`Vocabulary`), prepared for quick comparisons.
+
+    The n-th occurrence (from 0) of word id ``w`` is stored as ``w | n << 32`` in a frozenset, so
+    that the intersection of two such sets holds the words that :func:`compare` would match
+    between their word lists. :meth:`compare` gives the same result as :func:`compare` without
+    copying or searching lists. Fields and similar words aren't supported.
+
+    :param words: Array of word ids.
+    :param lengths: Length of each word id if words are weighted (see ``WEIGHT_WORDS``).
+    """
+
+    __slots__ = ("words", "items", "total")
+
+    def __init__(self, words, lengths=None):
+        self.words = words
+        counts = {}
+        items = []
+        for word in words:
+            count = counts.get(word, 0)
+            counts[word] = count + 1
+            items.append(word | count << 32)
+        self.items = frozenset(items)
+        self.total = len(words) if lengths is None else sum(lengths[word] for word in words)
+
+    def compare(self, other, lengths=None):
+        """Returns the % of words that match between ``self`` and ``other``, like :func:`compare`.
+
+        ``lengths`` must be the same as the one both multisets were created with.
+        """
+        if not (self.words and other.words):
+            return 0
+        common = self.items & other.items
+        if lengths is None:
+            match_count = len(common)
+        else:
+            match_count = sum(lengths[item & 0xFFFFFFFF] for item in common)
+        result = round(((match_count * 2) / (self.total + other.total)) * 100)
+        if (result == 100) and not _is_in_order(self.words, other.words):
+            result = 99  # We cannot consider a match exact unless the ordering is the same
+        return result
+
+
+def compare_fields(first, second, flags=(), vocabulary=None):
     """Returns the score for the lowest matching :ref:`fields`.
 
-    ``first`` and ``second`` must be lists of lists of string. Each sub-list is then compared with
-    :func:`compare`.
+    ``first`` and ``second`` must be lists of lists of string (or of arrays of word ids from
+    ``vocabulary``). Each sub-list is then compared with :func:`compare`.
     """
     if len(first) != len(second):
         return 0
@@ -110,7 +332,7 @@ def compare_fields(first, second, flags=()):
             max_score = 0
             matched_field = None
             for field2 in second:
-                r = compare(field1, field2, flags)
+                r = compare(field1, field2, flags, vocabulary)
                 if r > max_score:
                     max_score = r
                     matched_field = field2
@@ -118,62 +340,70 @@ def compare_fields(first, second, flags=()):
             if matched_field:
                 second.remove(matched_field)
     else:
-        results = [compare(field1, field2, flags) for field1, field2 in zip(first, second)]
+        results = [compare(field1, field2, flags, vocabulary) for field1, field2 in zip(first, second)]
     return min(results) if results else 0
 
 
-def build_word_dict(objects, j=job.nulljob):
-    """Returns a dict of objects mapped by their words.
+def build_word_dict(word_lists, j=job.nulljob):
+    """Returns the indexes of ``word_lists`` mapped by the words they contain.
 
-    objects must have a ``words`` attribute being a list of strings or a list of lists of strings
-    (:ref:`fields`).
+    ``word_lists`` is a list of arrays of word ids, or of lists of such arrays (:ref:`fields`), as
+    returned by :meth:`Vocabulary.encode`.
 
-    The result will be a dict with words as keys, lists of objects as values.
+    The result will be a dict with word ids as keys, ``array("I")`` of indexes in ``word_lists``
+    (in increasing order) as values.
     """
-    result = defaultdict(set)
-    for object in j.iter_with_progress(objects, "Prepared %d/%d files", JOB_REFRESH_RATE):
-        for word in unpack_fields(object.words):
-            result[word].add(object)
+    result = defaultdict(lambda: array("I"))
+    for index, words in enumerate(j.iter_with_progress(word_lists, "Prepared %d/%d files", JOB_REFRESH_RATE)):
+        for word in set(unpack_fields(words)):
+            result[word].append(index)
     return result
 
 
-def merge_similar_words(word_dict):
+def merge_similar_words(word_dict, vocabulary):
     """Take all keys in ``word_dict`` that are similar, and merge them together.
 
-    ``word_dict`` has been built with :func:`build_word_dict`. Similarity is computed with Python's
-    ``difflib.get_close_matches()``, which computes the number of edits that are necessary to make
-    a word equal to the other.
+    ``word_dict`` has been built with :func:`build_word_dict` from ids of ``vocabulary``.
+    Similarity is the one of Python's ``difflib.get_close_matches()``, which computes the number
+    of edits that are necessary to make a word equal to the other. Similar words are found with
+    the :class:`SimilarWords` of ``vocabulary``, which are looked for first if needed.
     """
-    keys = list(word_dict.keys())
-    keys.sort(key=len)  # we want the shortest word to stay
-    while keys:
-        key = keys.pop(0)
-        similars = difflib.get_close_matches(key, keys, 100, 0.8)
+    if vocabulary.similar_words is None:
+        vocabulary.similar_words = SimilarWords(vocabulary)
+    similar_words = vocabulary.similar_words
+    words = vocabulary.words
+    keys = sorted(word_dict, key=lambda id: len(words[id]))  # we want the shortest word to stay
+    remaining = set(keys)
+    for key in keys:
+        if key not in remaining:
+            continue
+        remaining.remove(key)
+        similars = list(itertools.islice((id for id in similar_words.get_similar(key) if id in remaining), 100))
         if not similars:
             continue
-        objects = word_dict[key]
+        indexes = set(word_dict[key])
         for similar in similars:
-            objects |= word_dict[similar]
-            del word_dict[similar]
-            keys.remove(similar)
+            indexes.update(word_dict.pop(similar))
+            remaining.remove(similar)
+        word_dict[key] = array("I", sorted(indexes))
 
 
-def reduce_common_words(word_dict, threshold):
-    """Remove all objects from ``word_dict`` values where the object count >= ``threshold``
+def reduce_common_words(word_dict, word_lists, threshold):
+    """Remove all indexes from ``word_dict`` values where the index count >= ``threshold``
 
-    ``word_dict`` has been built with :func:`build_word_dict`.
+    ``word_dict`` has been built with :func:`build_word_dict` from ``word_lists``.
 
-    The exception to this removal are the objects where all the words of the object are common.
+    The exception to this removal are the indexes of word lists where all the words are common.
     Because if we remove them, we will miss some duplicates!
     """
-    uncommon_words = {word for word, objects in word_dict.items() if len(objects) < threshold}
-    for word, objects in list(word_dict.items()):
-        if len(objects) < threshold:
+    uncommon_words = {word for word, indexes in word_dict.items() if len(indexes) < threshold}
+    for word, indexes in list(word_dict.items()):
+        if len(indexes) < threshold:
             continue
-        reduced = set()
-        for o in objects:
-            if not any(w in uncommon_words for w in unpack_fields(o.words)):
-                reduced.add(o)
+        reduced = array("I")
+        for index in indexes:
+            if not any(w in uncommon_words for w in unpack_fields(word_lists[index])):
+                reduced.append(index)
         if reduced:
             word_dict[word] = reduced
         else:
@@ -214,12 +444,151 @@ def get_match(first, second, flags=()):
     return Match(first, second, percentage)
 
 
+def similarity_join(multisets, min_match_percentage=0, lengths=None, j=job.nulljob):
+    """Yields ``(first, second, percentage)`` for each pair of ``multisets`` that match.
+
+    ``multisets`` are :class:`WordMultiset` created with ``lengths``, and ``first`` and
+    ``second`` are indexes in it. The pairs are those sharing at least a word for which
+    :meth:`WordMultiset.compare` gives at least ``min_match_percentage``, but pairs that can't
+    reach it are never compared.
+
+    This is a PPJoin set similarity join. Words are ordered from the rarest to the most common,
+    and only the first words of each multiset are indexed, enough for two multisets with
+    the required number of words in common to share one of them. Candidates are then pruned by
+    their size and by the number of words they can still have in common.
+    """
+    # A pair scoring at least p once rounded has 400 * overlap >= (2p - 1) * total, overlap
+    # being the number (or length) of words in common and total the sum of both sizes.
+    factor = 2 * min_match_percentage - 1
+
+    def min_overlap(total):
+        return max(-(-factor * total // 400), 1)
+
+    frequencies = defaultdict(int)
+    for multiset in multisets:
+        for item in multiset.items:
+            frequencies[item] += 1
+    items = sorted(frequencies, key=frequencies.__getitem__)
+    del frequencies
+    ranks = {item: rank for rank, item in enumerate(items)}
+    if lengths is None:
+        weights = [1] * len(items)
+    else:
+        weights = [lengths[item & 0xFFFFFFFF] for item in items]
+    del items
+    sizes = [multiset.total for multiset in multisets]
+    # Smaller multisets first, all the multisets another one can match are then in the index.
+    order = sorted(range(len(multisets)), key=sizes.__getitem__)
+    # {rank: deque of (index, weight of the words after this one)}, by increasing size.
+    postings = defaultdict(deque)
+    match_count = 0
+    j.start_job(len(order), PROGRESS_MESSAGE % (0, 0))
+    for count, index in enumerate(order, start=1):
+        if count % JOB_REFRESH_RATE == 0:
+            j.add_progress(JOB_REFRESH_RATE, desc=PROGRESS_MESSAGE % (match_count, count))
+        size = sizes[index]
+        if not size:
+            continue
+        multiset = multisets[index]
+        tokens = sorted(ranks[item] for item in multiset.items)
+        # Smaller multisets can't have enough words in common with this one.
+        min_size = max(-(-factor * size // (400 - factor)), 1)
+        probe_overlap = min_overlap(size + min_size)
+        # {index: number of words in common so far, or -1 if it can't be a match}
+        overlaps = {}
+        rest = size
+        for rank in tokens:
+            if rest < probe_overlap:
+                break
+            weight = weights[rank]
+            rest -= weight
+            posting = postings.get(rank)
+            if not posting:
+                continue
+            while posting and sizes[posting[0][0]] < min_size:
+                posting.popleft()
+            for other, other_rest in posting:
+                overlap = overlaps.get(other, 0)
+                if overlap < 0:
+                    continue
+                overlap += weight
+                if overlap + min(rest, other_rest) < min_overlap(size + sizes[other]):
+                    overlap = -1
+                overlaps[other] = overlap
+        for other, overlap in overlaps.items():
+            if overlap > 0:
+                percentage = multiset.compare(multisets[other], lengths)
+                if percentage >= min_match_percentage:
+                    match_count += 1
+                    yield other, index, percentage
+        # Only the first words of a multiset are indexed, as the multisets probing the index are
+        # at least as big as this one.
+        index_overlap = min_overlap(2 * size)
+        rest = size
+        for rank in tokens:
+            if rest < index_overlap:
+                break
+            rest -= weights[rank]
+            postings[rank].append((index, rest))
+    j.set_progress(100, PROGRESS_MESSAGE % (match_count, len(order)))
+
+
+def minhash_candidates(word_sets, bands, rows, j=job.nulljob):
+    """Yields pairs of indexes of ``word_sets`` that are likely to have many words in common.
+
+    ``word_sets`` are sequences of word ids. This is MinHash with banded LSH: for each of the
+    ``bands`` bands, sets are hashed with ``rows`` MinHash functions, and sets with the same
+    hashes are candidates. Two sets with a Jaccard similarity of ``s`` end up as candidates with
+    a probability of ``1 - (1 - s ** rows) ** bands``. Sets with the same words always do, sets
+    without any word in common never do.
+
+    Each pair is yielded once, in no particular order.
+    """
+    # Sets with the same words have the same hashes, only one of them goes through LSH.
+    groups = defaultdict(list)
+    for index, words in enumerate(word_sets):
+        if len(words):
+            groups[frozenset(words)].append(index)
+    sets = list(groups)
+    members = list(groups.values())
+    del groups
+    for group in members:
+        yield from itertools.combinations(group, 2)
+    # Always the same hash functions, so that scans give the same results.
+    r = random.Random(0)
+    word_count = max((max(words) + 1 for words in sets), default=0)
+    # Key of each set in previous bands, a pair colliding in one of them has already been yielded.
+    previous_keys = []
+    j.start_job(bands)
+    for _ in range(bands):
+        hashes = []
+        for _ in range(rows):
+            a, b = r.randrange(1, MINHASH_PRIME), r.randrange(MINHASH_PRIME)
+            hashes.append(array("Q", ((a * id + b) % MINHASH_PRIME for id in range(word_count))))
+        keys = array("q")
+        buckets = defaultdict(list)
+        for index, words in enumerate(sets):
+            key = hash(tuple(min(map(h.__getitem__, words)) for h in hashes))
+            keys.append(key)
+            buckets[key].append(index)
+        del hashes
+        for bucket in buckets.values():
+            for i, first in enumerate(bucket):
+                for second in bucket[i + 1 :]:
+                    if not any(k[first] == k[second] for k in previous_keys):
+                        yield from itertools.product(members[first], members[second])
+        previous_keys.append(keys)
+        j.add_progress()
+
+
 def getmatches(
     objects,
     min_match_percentage=0,
     match_similar_words=False,
     weight_words=False,
     no_field_order=False,
+    lsh_bands=0,
+    lsh_rows=4,
     j=job.nulljob,
 ):
     """Returns a list of :class:`Match` within ``objects`` after fuzzily matching their words.
@@ -229,19 +598,23 @@ def getmatches(
     :param bool match_similar_words: make similar words (see :func:`merge_similar_words`) match.
     :param bool weight_words: longer words are worth more in match % computations.
     :param bool no_field_order: match :ref:`fields` regardless of their order.
+    :param int lsh_bands: If not 0, only compare the pairs found by :func:`minhash_candidates`
+                          with that many bands of ``lsh_rows`` rows. This is much faster with
+                          lots of files, but some matches are missed.
+    :param int lsh_rows: See ``lsh_bands``.
     :param j: A :ref:`job progress instance <jobs>`.
     """
-    COMMON_WORD_THRESHOLD = 50
     LIMIT = 5000000
     j = j.start_subjob(2)
     sj = j.start_subjob(2)
+    # Words are matched as integer ids: each object's words are an array of ids, at the same index
+    # as the object.
+    vocabulary = Vocabulary()
+    word_lists = []
     for o in objects:
         if not hasattr(o, "words"):
             o.words = getwords(o.name)
-    word_dict = build_word_dict(objects, sj)
-    reduce_common_words(word_dict, COMMON_WORD_THRESHOLD)
-    if match_similar_words:
-        merge_similar_words(word_dict)
+        word_lists.append(vocabulary.encode(o.words))
     match_flags = []
     if weight_words:
         match_flags.append(WEIGHT_WORDS)
@@ -249,6 +622,74 @@ def getmatches(
         match_flags.append(MATCH_SIMILAR_WORDS)
     if no_field_order:
         match_flags.append(NO_FIELD_ORDER)
+    if lsh_bands:
+        return _getmatches_by_minhash(
+            objects, word_lists, vocabulary, min_match_percentage, match_flags, lsh_bands, lsh_rows, LIMIT, j, sj
+        )
+    if match_similar_words or any(isinstance(words, list) for words in word_lists):
+        return _getmatches_by_word_dict(
+            objects, word_lists, vocabulary, min_match_percentage, match_flags, LIMIT, j, sj
+        )
+    lengths = vocabulary.lengths if weight_words else None
+    multisets = [
+        WordMultiset(words, lengths)
+        for words in sj.iter_with_progress(word_lists, "Prepared %d/%d files", JOB_REFRESH_RATE)
+    ]
+    result = []
+    try:
+        for first, second, percentage in similarity_join(multisets, min_match_percentage, lengths, j):
+            result.append(Match(objects[first], objects[second], percentage))
+            if len(result) >= LIMIT:
+                break
+    except MemoryError:
+        # This is the place where the memory usage is at its peak during the scan.
+        # Just continue the process with an incomplete list of matches.
+        del multisets  # This should give us enough room to call logging.
+        logging.warning("Memory Overflow. Matches: %d" % len(result))
+    return result
+
+
+def _getmatches_by_minhash(
+    objects, word_lists, vocabulary, min_match_percentage, match_flags, bands, rows, limit, j, sj
+):
+    # Compares the pairs of objects found by minhash_candidates(). See getmatches() for arguments.
+    if MATCH_SIMILAR_WORDS in match_flags:
+        vocabulary.similar_words = SimilarWords(vocabulary, sj)
+    if MATCH_SIMILAR_WORDS in match_flags or any(isinstance(words, list) for words in word_lists):
+        multisets = None
+    else:
+        # Same results as compare(), but faster.
+        lengths = vocabulary.lengths if WEIGHT_WORDS in match_flags else None
+        multisets = [WordMultiset(words, lengths) for words in word_lists]
+    word_sets = [words if isinstance(words, array) else unpack_fields(words) for words in word_lists]
+    result = []
+    try:
+        for first, second in minhash_candidates(word_sets, bands, rows, j):
+            if multisets is None:
+                percentage = compare(word_lists[first], word_lists[second], match_flags, vocabulary)
+            else:
+                percentage = multisets[first].compare(multisets[second], lengths)
+            if percentage >= min_match_percentage:
+                result.append(Match(objects[first], objects[second], percentage))
+                if len(result) >= limit:
+                    break
+    except MemoryError:
+        # This is the place where the memory usage is at its peak during the scan.
+        # Just continue the process with an incomplete list of matches.
+        del word_sets, multisets  # This should give us enough room to call logging.
+        logging.warning("Memory Overflow. Matches: %d" % len(result))
+    return result
+
+
+def _getmatches_by_word_dict(objects, word_lists, vocabulary, min_match_percentage, match_flags, limit, j, sj):
+    # Compares all pairs of objects sharing an uncommon word. Used with fields and similar words,
+    # which similarity_join() doesn't support. See getmatches() for arguments.
+    COMMON_WORD_THRESHOLD = 50
+    word_dict = build_word_dict(word_lists, sj)
+    reduce_common_words(word_dict, word_lists, COMMON_WORD_THRESHOLD)
+    if MATCH_SIMILAR_WORDS in match_flags:
+        vocabulary.similar_words = SimilarWords(vocabulary, sj)
+        merge_similar_words(word_dict, vocabulary)
     j.start_job(len(word_dict), PROGRESS_MESSAGE % (0, 0))
     compared = defaultdict(set)
     result = []
@@ -256,17 +697,17 @@ def getmatches(
         word_count = 0
         # This whole 'popping' thing is there to avoid taking too much memory at the same time.
         while word_dict:
-            items = word_dict.popitem()[1]
+            items = set(word_dict.popitem()[1])
             while items:
                 ref = items.pop()
                 compared_already = compared[ref]
                 to_compare = items - compared_already
                 compared_already |= to_compare
                 for other in to_compare:
-                    m = get_match(ref, other, match_flags)
-                    if m.percentage >= min_match_percentage:
-                        result.append(m)
-                        if len(result) >= LIMIT:
+                    percentage = compare(word_lists[ref], word_lists[other], match_flags, vocabulary)
+                    if percentage >= min_match_percentage:
+                        result.append(Match(objects[ref], objects[other], percentage))
+                        if len(result) >= limit:
                             return result
             word_count += 1
             j.add_progress(desc=PROGRESS_MESSAGE % (len(result), word_count))
@@ -279,43 +720,151 @@ def getmatches(
     return result
 
 
-def getmatches_by_contents(files, bigsize=0, j=job.nulljob):
-    """Returns a list of :class:`Match` within ``files`` if their contents is the same.
+def _partition(files, field):
+    # Splits ``files`` in buckets of files having the same ``field`` value. Lonely files, as well as
+    # buckets containing only ref files, can't possibly end up in a match and are dropped.
+    value2files = defaultdict(list)
+    for f in files:
+        value = getattr(f, field)
+        if value is not None:
+            value2files[value].append(f)
+    return [bucket for bucket in value2files.values() if len(bucket) > 1 and not all(f.is_ref for f in bucket)]
 
-    :param bigsize: The size in bytes over which we consider files big enough to
-                    justify taking samples of the file for hashing. If 0, compute digest as usual.
-    :param j: A :ref:`job progress instance <jobs>`.
-    """
-    size2files = defaultdict(set)
+
+def _batch_groups(groups):
+    # Yields lists of size groups totalling at least HASH_BATCH_SIZE files (except for the last
+    # one). Hashing many small groups together is what keeps the hashing pool busy.
+    batch = []
+    file_count = 0
+    for group in groups:
+        batch.append(group)
+        file_count += len(group)
+        if file_count >= HASH_BATCH_SIZE:
+            yield batch
+            batch = []
+            file_count = 0
+    if batch:
+        yield batch
+
+
+def _refine_by_contents(groups, bigsize, pool, j):
+    # Progressively partitions ``groups`` (lists of files of the same size) by digests, from the
+    # cheapest to the most expensive one. Returns the final buckets, in which all files have the
+    # same contents. A file that ends up alone in its bucket is never hashed further.
+    result = []
+    partial_buckets = []
+    pool.compute([f for group in groups if group[0].size > 0 for f in group], "digest_partial", j)
+    for group in groups:
+        if group[0].size == 0:
+            # skip hashing for zero length files
+            if not all(f.is_ref for f in group):
+                result.append(group)
+        else:
+            partial_buckets += _partition(group, "digest_partial")
+    samples_buckets, full_buckets = extract(lambda b: bigsize > 0 and b[0].size > bigsize, partial_buckets)
+    # Small buckets are verified by reading their files side by side, stopping as soon as they differ.
+    split_buckets, full_buckets = extract(hashing.can_split_by_contents, full_buckets)
+    result += [b for b in pool.split_by_contents(split_buckets, j) if not all(f.is_ref for f in b)]
+    for field, buckets in (("digest_samples", samples_buckets), ("digest", full_buckets)):
+        pool.compute([f for bucket in buckets for f in bucket], field, j)
+        for bucket in buckets:
+            result += _partition(bucket, field)
+    return result
+
+
+def _has_matched_ancestor(file, matched_paths):
+    return any(p in matched_paths for p in file.path.parents)
+
+
+def _match_count(bucket):
+    # Number of matches a bucket makes, ref files aren't matched with each other.
+    count = len(bucket)
+    ref_count = sum(1 for f in bucket if f.is_ref)
+    return (count * (count - 1) - ref_count * (ref_count - 1)) // 2
+
+
+def _iter_buckets_by_contents(files, bigsize, hash_workers, device_hash_workers, prune_nested, j):
+    # Yields lists of files having the same contents. See getmatches_by_contents() for arguments.
+    size2files = defaultdict(list)
     for f in files:
-        size2files[f.size].add(f)
+        size2files[f.size].append(f)
     del files
     possible_matches = [files for files in size2files.values() if len(files) > 1]
     del size2files
-    result = []
+    if prune_nested:
+        # A folder is at least as big as any of its subfolders, bigger folders are matched first.
+        possible_matches.sort(key=lambda group: group[0].size, reverse=True)
+        # Folder digests are computed in this thread anyway, batching them doesn't buy anything.
+        # Processing size groups one by one lets each of them benefit from all previous matches.
+        batches = ([group] for group in possible_matches)
+        matched_paths = set()
+    else:
+        batches = _batch_groups(possible_matches)
+    match_count = 0
     j.start_job(len(possible_matches), PROGRESS_MESSAGE % (0, 0))
     group_count = 0
-    for group in possible_matches:
-        for first, second in itertools.combinations(group, 2):
+    with hashing.DigestPool(hash_workers, device_hash_workers) as pool:
+        pool.prefetch([f for group in possible_matches if group[0].size > 0 for f in group])
+        for batch in batches:
+            batch_size = len(batch)
+            if prune_nested:
+                batch = [g for g in batch if not all(_has_matched_ancestor(f, matched_paths) for f in g)]
+            for bucket in _refine_by_contents(batch, bigsize, pool, j):
+                if prune_nested:
+                    matched_paths.update(f.path for f in bucket)
+                match_count += _match_count(bucket)
+                yield bucket
+            group_count += batch_size
+            j.add_progress(batch_size, desc=PROGRESS_MESSAGE % (match_count, group_count))
+
+
+def getmatches_by_contents(
+    files, bigsize=0, hash_workers=None, device_hash_workers=None, prune_nested=False, j=job.nulljob
+):
+    """Returns a list of :class:`Match` within ``files`` if their contents is the same.
+
+    Files are first grouped by size, then each size group is partitioned by
+    :attr:`~core.fs.File.digest_partial`, and each resulting bucket by
+    :attr:`~core.fs.File.digest_samples` or :attr:`~core.fs.File.digest`. All files in a final
+    bucket match each other.
+
+    :param bigsize: The size in bytes over which we consider files big enough to
+                    justify taking samples of the file for hashing. If 0, compute digest as usual.
+    :param hash_workers: Number of threads used to hash files on each device. If ``None``,
+                         :data:`~core.hashing.DEFAULT_WORKERS`. See :class:`~core.hashing.DigestPool`.
+    :param device_hash_workers: ``{st_dev: hash_workers}`` for devices needing a different number of
+                                threads than ``hash_workers``.
+    :param prune_nested: If true, ``files`` are folders and matches between two folders that are
+                         both inside matched folders are not wanted (see
+                         :meth:`~core.scanner.Scanner.get_dupe_groups`). Size groups are then
+                         processed from the biggest to the smallest and those in which every
+                         folder is inside a matched folder are skipped altogether. Some unwanted
+                         matches can still be returned.
+    :param j: A :ref:`job progress instance <jobs>`.
+    """
+    result = []
+    buckets = _iter_buckets_by_contents(files, bigsize, hash_workers, device_hash_workers, prune_nested, j)
+    for bucket in buckets:
+        for first, second in itertools.combinations(bucket, 2):
             if first.is_ref and second.is_ref:
                 continue  # Don't spend time comparing two ref pics together.
-            if first.size == 0 and second.size == 0:
-                # skip hashing for zero length files
-                result.append(Match(first, second, 100))
-                continue
-            # if digests are the same (and not None) then files match
-            if first.digest_partial == second.digest_partial and first.digest_partial is not None:
-                if bigsize > 0 and first.size > bigsize:
-                    if first.digest_samples == second.digest_samples and first.digest_samples is not None:
-                        result.append(Match(first, second, 100))
-                else:
-                    if first.digest == second.digest and first.digest is not None:
-                        result.append(Match(first, second, 100))
-        group_count += 1
-        j.add_progress(desc=PROGRESS_MESSAGE % (len(result), group_count))
+            result.append(Match(first, second, 100))
     return result
 
 
+def getgroups_by_contents(
+    files, bigsize=0, hash_workers=None, device_hash_workers=None, prune_nested=False, j=job.nulljob
+):
+    """Returns a list of :class:`ExactGroup` within ``files`` having the same contents.
+
+    Same as :func:`getmatches_by_contents`, but each bucket of identical files is returned as a
+    group instead of as every match pair it contains, which takes O(n) memory instead of O(n²).
+    Buckets are returned whole: unlike :func:`get_groups`, this doesn't drop extra ref files.
+    """
+    buckets = _iter_buckets_by_contents(files, bigsize, hash_workers, device_hash_workers, prune_nested, j)
+    return [ExactGroup(bucket) for bucket in buckets]
+
+
 class Group:
     """A group of :class:`~core.fs.File` that match together.
 
@@ -494,6 +1043,39 @@ class Group:
             return self[0]
 
 
+class ExactGroup(Group):
+    """A :class:`Group` of files known to have the same contents.
+
+    Every file matches every other one with a 100% match, so there's no need to record match pairs:
+    :meth:`get_match_of` builds them on demand and :attr:`matches` stays empty.
+
+    :param files: Initial duplicates of the group, in order.
+    """
+
+    def __init__(self, files=()):
+        Group.__init__(self)
+        self.ordered = list(files)
+        self.unordered = set(self.ordered)
+
+    def add_match(self, match):
+        for item in match[:2]:
+            if item not in self.unordered:
+                self.ordered.append(item)
+                self.unordered.add(item)
+
+    def discard_matches(self):
+        return set()
+
+    def get_match_of(self, item):
+        if item is self.ref or item not in self.unordered:
+            return
+        return Match(self.ref, item, 100)
+
+    @property
+    def percentage(self):
+        return 100 if self.dupes else 0
+
+
 def get_groups(matches):
     """Returns a list of :class:`Group` from ``matches``.
 
@@ -0,0 +1,203 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import os
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from hscommon.util import nonone
+
+
+class PathStore:
+    """Interns the folders of many paths, each path then being stored as ``(folder_id, name)``.
+
+    The files of a folder are usually collected together, and all but the first of them share
+    its path string instead of carrying a copy of it. Paths are only turned back into strings or
+    :class:`~pathlib.Path` on demand.
+    """
+
+    def __init__(self):
+        # Folder path strings, by id
+        self.folders = []
+        self._folder_ids = {}
+
+    def __len__(self):
+        return len(self.folders)
+
+    def add(self, path):
+        """Returns ``(folder_id, name)`` for ``path``, interning its folder if it's a new one."""
+        folder, name = os.path.split(os.fspath(path))
+        folder_id = self._folder_ids.get(folder)
+        if folder_id is None:
+            folder_id = self._folder_ids[folder] = len(self.folders)
+            self.folders.append(folder)
+        return folder_id, name
+
+    def get_str(self, folder_id, name):
+        return os.path.join(self.folders[folder_id], name)
+
+    def get_path(self, folder_id, name):
+        return Path(self.folders[folder_id], name)
+
+
+class FileTable:
+    """Holds what the directory listing told us about each file of a scan, one row per file.
+
+    A :class:`~core.fs.File` (and its :class:`~pathlib.Path`) costs hundreds of bytes, which adds
+    up to gigabytes when scanning millions of files, most of which can't possibly have a
+    duplicate in a Contents scan because no other file has their size. A table keeps each piece
+    of info in its own column, a compact :class:`~array.array`, and :class:`~core.fs.File`
+    instances are only created (see :meth:`get_file`) for the files that are actually compared.
+
+    Paths are kept in a :class:`PathStore`, as a folder id and a name.
+
+    If a :class:`~core.hashing.DigestPool` is given, files start being partially hashed as soon as
+    they're known to share their size with another file (not only with ref files), while the
+    table is still being filled. Their digests are written to the hash cache, where the scan will
+    find them.
+
+    :param fileclasses: List of :class:`~core.fs.File` classes files can be created with.
+    :param store: :class:`PathStore` to use, a new one if ``None``.
+    :param pool: :class:`~core.hashing.DigestPool` in which to hash files, if any.
+    :param min_size: Files smaller than this aren't hashed in ``pool``.
+    :param max_size: If not 0, files bigger than this aren't hashed in ``pool``.
+    """
+
+    def __init__(self, fileclasses, store=None, pool=None, min_size=0, max_size=0):
+        self.fileclasses = list(fileclasses)
+        self.store = store if store is not None else PathStore()
+        self.pool = pool
+        self.min_size = min_size
+        self.max_size = max_size
+        # {size: index of the only file of that size, or list of indexes if they're all ref files}.
+        # Files of a size that isn't in there anymore are already hashed. Only used with a pool.
+        self._unhashed = {}
+        self.folder_ids = array("I")
+        self.names = []
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.devs = array("Q")
+        self.inodes = array("Q")
+        # Index of each file's class in self.fileclasses
+        self.classes = array("B")
+        self.is_ref = bytearray()
+
+    def __len__(self):
+        return len(self.sizes)
+
+    # ---Public
+    def append(self, entry, fileclass, is_ref=False):
+        """Adds a row for ``entry``, an :class:`os.DirEntry` to be wrapped in ``fileclass``.
+
+        Raises :class:`OSError` if ``entry`` can't be stat'ed, in which case the table is left alone.
+        """
+        stats = entry.stat()
+        # On Windows, the stat result of a DirEntry doesn't have the inode, but inode() does.
+        inode = entry.inode()
+        self.sizes.append(nonone(stats.st_size, 0))
+        self.mtimes.append(nonone(stats.st_mtime, 0))
+        self.devs.append(stats.st_dev)
+        self.inodes.append(inode)
+        self.classes.append(self.fileclasses.index(fileclass))
+        folder_id, name = self.store.add(entry.path)
+        self.folder_ids.append(folder_id)
+        self.names.append(name)
+        self.is_ref.append(is_ref)
+        if self.pool is not None:
+            self._add_to_bucket(len(self) - 1)
+
+    def _add_to_bucket(self, index):
+        size = self.sizes[index]
+        if not size or size < self.min_size or (self.max_size and size > self.max_size):
+            return
+        unhashed = self._unhashed.get(size, ())
+        if unhashed is None:
+            self._hash([index])  # The bucket is already being hashed
+            return
+        if isinstance(unhashed, int):
+            unhashed = [unhashed]
+        indexes = list(unhashed) + [index]
+        if len(indexes) > 1 and not all(self.is_ref[i] for i in indexes):
+            self._hash(indexes)
+            self._unhashed[size] = None
+        else:
+            self._unhashed[size] = indexes[0] if len(indexes) == 1 else indexes
+
+    def _hash(self, indexes):
+        self.pool.warm([self.get_file(index) for index in indexes], "digest_partial")
+
+    def take(self, indexes):
+        """Returns a new table with the rows at ``indexes``, in that order."""
+        result = FileTable(self.fileclasses, self.store)
+        for index in indexes:
+            result.folder_ids.append(self.folder_ids[index])
+            result.names.append(self.names[index])
+            result.sizes.append(self.sizes[index])
+            result.mtimes.append(self.mtimes[index])
+            result.devs.append(self.devs[index])
+            result.inodes.append(self.inodes[index])
+            result.classes.append(self.classes[index])
+            result.is_ref.append(self.is_ref[index])
+        return result
+
+    def remove_hardlink_dupes(self):
+        """Returns a new table in which only the first link to each inode is kept.
+
+        Files without an inode number are all kept.
+        """
+        seen_inodes = set()
+        indexes = []
+        for index, key in enumerate(zip(self.devs, self.inodes)):
+            if not key[1]:
+                indexes.append(index)
+            elif key not in seen_inodes:
+                seen_inodes.add(key)
+                indexes.append(index)
+        return self.take(indexes)
+
+    def get_path(self, index):
+        return self.store.get_path(self.folder_ids[index], self.names[index])
+
+    def get_str(self, index):
+        return self.store.get_str(self.folder_ids[index], self.names[index])
+
+    def get_file(self, index):
+        """Returns a :class:`~core.fs.File` for the row at ``index``.
+
+        The file's size, mtime, dev, inode and ``is_ref`` are set from the table.
+        """
+        fileclass = self.fileclasses[self.classes[index]]
+        file = fileclass(self.get_path(index))
+        file.size = self.sizes[index]
+        file.mtime = self.mtimes[index]
+        file.dev = self.devs[index]
+        file.inode = self.inodes[index]
+        file.is_ref = bool(self.is_ref[index])
+        return file
+
+    def get_files(self):
+        """Returns a :class:`~core.fs.File` for each row of the table."""
+        return [self.get_file(index) for index in range(len(self))]
+
+    def get_candidates(self, min_size=0, max_size=0):
+        """Returns a :class:`~core.fs.File` for each file that might have a duplicate.
+
+        That is, files having the same size as at least another file, and not only as ref files.
+        Files that would be filtered out by the ``size_threshold`` and ``large_size_threshold``
+        scan options can be left out with ``min_size`` and ``max_size``.
+        """
+        # Counting sizes first means that only candidates make it in the dict below.
+        size_counts = Counter(self.sizes)
+        size2indexes = defaultdict(list)
+        for index, size in enumerate(self.sizes):
+            if size_counts[size] < 2 or size < min_size or (max_size and size > max_size):
+                continue
+            size2indexes[size].append(index)
+        del size_counts
+        result = []
+        for indexes in size2indexes.values():
+            if len(indexes) > 1 and not all(self.is_ref[index] for index in indexes):
+                result += (self.get_file(index) for index in indexes)
+        return result
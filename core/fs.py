@@ -14,23 +14,39 @@
 import os
 
 from math import floor
+import hashlib
 import logging
 import sqlite3
-from threading import Lock
-from typing import Any, AnyStr, Union, Callable
+import struct
+from collections import defaultdict
+from functools import partial
+from threading import Lock, Timer, local
+from typing import Any, AnyStr, Dict, Union, Callable, Iterable, Sequence, Tuple
 
 from pathlib import Path
 from hscommon.util import nonone, get_file_ext
 
-hasher: Callable
+from core.snapshot import SnapshotEntry
+
+# {name: hash constructor}. Constructors take optional initial data and return an object with
+# ``update()`` and ``digest()`` methods, like hashlib's.
+HASHERS: Dict[str, Callable] = {
+    "md5": hashlib.md5,
+    "blake2b": partial(hashlib.blake2b, digest_size=16),
+}
 try:
     import xxhash
 
-    hasher = xxhash.xxh128
+    HASHERS["xxh128"] = xxhash.xxh128
+    if hasattr(xxhash, "xxh3_64"):  # xxhash >= 2.0
+        HASHERS["xxh3_64"] = xxhash.xxh3_64
 except ImportError:
-    import hashlib
+    pass
+
+DEFAULT_HASHER = "xxh128" if "xxh128" in HASHERS else "md5"
 
-    hasher = hashlib.md5
+hasher_name: str = DEFAULT_HASHER
+hasher: Callable = HASHERS[hasher_name]
 
 __all__ = [
     "File",
@@ -42,21 +58,98 @@ __all__ = [
     "InvalidPath",
     "InvalidDestinationError",
     "OperationError",
+    "HASHERS",
+    "set_hasher",
 ]
 
 NOT_SET = object()
 
 # The goal here is to not run out of memory on really big files. However, the chunk
 # size has to be large enough so that the python loop isn't too costly in terms of
-# CPU.
+# CPU. This is the smallest chunk size used to read files, bigger files are read in
+# bigger chunks (see chunk_size()), up to MAX_CHUNK_SIZE. Both are read at call time
+# and can be changed.
 CHUNK_SIZE = 1024 * 1024  # 1 MiB
+MAX_CHUNK_SIZE = 4 * CHUNK_SIZE
+
+# Size of each of the 3 samples hashed into digest_samples. Unlike CHUNK_SIZE, this one
+# can't change without invalidating cached digests.
+SAMPLE_SIZE = 1024 * 1024  # 1 MiB
 
 # Minimum size below which partial hashing is not used
-MIN_FILE_SIZE = 3 * CHUNK_SIZE  # 3MiB, because we take 3 samples
+MIN_FILE_SIZE = 3 * SAMPLE_SIZE  # 3MiB, because we take 3 samples
 
 # Partial hashing offset and size
 PARTIAL_OFFSET_SIZE = (0x4000, 0x4000)
 
+# File attributes holding a digest of the file's contents, from cheapest to most expensive
+DIGEST_FIELDS = ("digest_partial", "digest_samples", "digest")
+
+
+def timestamp_from_ns(mtime_ns: int) -> float:
+    """Returns the float timestamp ``os.stat()`` gives as ``st_mtime`` when ``st_mtime_ns`` is
+    ``mtime_ns``.
+
+    The conversion is done exactly like CPython does it, so that timestamps can be compared for
+    equality.
+    """
+    sec, nsec = divmod(mtime_ns, 10**9)
+    return sec + nsec * 1e-9
+
+
+def chunk_size(file_size: int) -> int:
+    """Returns the size of the chunks in which a file of ``file_size`` bytes is read.
+
+    Files smaller than :data:`CHUNK_SIZE` are read in one go. Bigger files are read in
+    chunks of about 1/256th of their size, between :data:`CHUNK_SIZE` and :data:`MAX_CHUNK_SIZE`.
+    """
+    if file_size < CHUNK_SIZE:
+        return max(file_size, 1)
+    return min(max(CHUNK_SIZE, file_size // 256), MAX_CHUNK_SIZE)
+
+
+_buffers = local()
+
+
+def get_buffer(size: int) -> memoryview:
+    """Returns a writable view of ``size`` bytes over a buffer owned by the calling thread.
+
+    The buffer is reused by subsequent calls from the same thread, so its contents are only
+    valid until then.
+    """
+    buffer = getattr(_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = _buffers.buffer = bytearray(size)
+    return memoryview(buffer)[:size]
+
+
+def readinto(fp, view: memoryview) -> int:
+    """Reads from ``fp`` until ``view`` is full or the end of the file is reached.
+
+    Returns the number of bytes read. Unlike a single ``fp.readinto()`` call on an unbuffered
+    file, short reads only happen at the end of the file.
+    """
+    total = 0
+    while total < len(view):
+        count = fp.readinto(view[total:])
+        if not count:
+            break
+        total += count
+    return total
+
+
+def set_hasher(name: str) -> None:
+    """Makes ``name``, a key of :data:`HASHERS`, the algorithm used to compute digests.
+
+    Digests cached in :data:`filesdb` are kept per algorithm, so switching back and forth doesn't
+    invalidate them. Raises ``ValueError`` if the algorithm isn't available.
+    """
+    global hasher, hasher_name
+    if name not in HASHERS:
+        raise ValueError(f"Unknown hash algorithm: {name}")
+    hasher = HASHERS[name]
+    hasher_name = name
+
 
 class FSError(Exception):
     cls_message = "An error has occured on '{name}' in '{parent}'"
@@ -97,29 +190,102 @@ class OperationError(FSError):
 
 
 class FilesDB:
-    schema_version = 1
-    schema_version_description = "Changed from md5 to xxhash if available."
-
-    create_table_query = """CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,
-        entry_dt DATETIME, digest BLOB, digest_partial BLOB, digest_samples BLOB)"""
+    schema_version = 4
+    schema_version_description = "Added folders table."
+    # {version: queries upgrading the schema from that version to the next one}. Queries are executed
+    # with the default algorithm as the ``algorithm`` parameter.
+    upgrade_queries = {
+        1: [
+            "ALTER TABLE files ADD COLUMN dev INTEGER",
+            "ALTER TABLE files ADD COLUMN ino INTEGER",
+        ],
+        # The primary key changes, which requires rebuilding the table. Existing digests were computed
+        # with the default algorithm.
+        2: [
+            "ALTER TABLE files RENAME TO files_v2",
+            "DROP INDEX IF EXISTS idx_files_inode",
+            """CREATE TABLE files (path TEXT, algorithm TEXT, size INTEGER, mtime_ns INTEGER, entry_dt DATETIME,
+                digest BLOB, digest_partial BLOB, digest_samples BLOB, dev INTEGER, ino INTEGER,
+                PRIMARY KEY (path, algorithm))""",
+            """INSERT INTO files (path, algorithm, size, mtime_ns, entry_dt, digest, digest_partial, digest_samples,
+                dev, ino)
+                SELECT path, :algorithm, size, mtime_ns, entry_dt, digest, digest_partial, digest_samples, dev, ino
+                FROM files_v2""",
+            "DROP TABLE files_v2",
+        ],
+        3: [],  # The folders table is created along with the files table
+    }
+
+    create_table_query = """CREATE TABLE IF NOT EXISTS files (path TEXT, algorithm TEXT, size INTEGER,
+        mtime_ns INTEGER, entry_dt DATETIME, digest BLOB, digest_partial BLOB, digest_samples BLOB, dev INTEGER,
+        ino INTEGER, PRIMARY KEY (path, algorithm))"""
+    create_index_query = "CREATE INDEX IF NOT EXISTS idx_files_inode ON files (dev, ino)"
     drop_table_query = "DROP TABLE IF EXISTS files;"
-    select_query = "SELECT {key} FROM files WHERE path=:path AND size=:size and mtime_ns=:mtime_ns"
-    select_query_ignore_mtime = "SELECT {key} FROM files WHERE path=:path AND size=:size"
+    # Folder digests, valid as long as the fingerprint of the folder's contents (see Folder.fingerprint)
+    # is the same.
+    create_folders_table_query = """CREATE TABLE IF NOT EXISTS folders (path TEXT, algorithm TEXT, fingerprint BLOB,
+        entry_dt DATETIME, digest BLOB, digest_partial BLOB, digest_samples BLOB, PRIMARY KEY (path, algorithm))"""
+    drop_folders_table_query = "DROP TABLE IF EXISTS folders;"
+    select_folder_query = """SELECT {key} FROM folders
+        WHERE path=:path AND algorithm=:algorithm AND fingerprint=:fingerprint"""
+    insert_folder_query = """
+        INSERT INTO folders (path, algorithm, fingerprint, entry_dt, {key})
+        VALUES (:path, :algorithm, :fingerprint, datetime('now'), :value)
+        ON CONFLICT(path, algorithm) DO UPDATE SET {reset}, fingerprint=:fingerprint, entry_dt=datetime('now'),
+            {key}=:value;
+    """
+    reset_folder_query = "{key}=CASE WHEN fingerprint=:fingerprint THEN {key} END"
+    select_query = """SELECT {key} FROM files
+        WHERE path=:path AND algorithm=:algorithm AND size=:size and mtime_ns=:mtime_ns"""
+    select_query_ignore_mtime = "SELECT {key} FROM files WHERE path=:path AND algorithm=:algorithm AND size=:size"
+    select_by_inode_query = """
+        SELECT path, {key} FROM files
+        WHERE dev=:dev AND ino=:ino AND algorithm=:algorithm AND size=:size AND mtime_ns=:mtime_ns
+            AND {key} IS NOT NULL LIMIT 1
+    """
+    create_lookup_table_query = "CREATE TEMP TABLE IF NOT EXISTS lookup (path TEXT PRIMARY KEY)"
+    select_many_query = """SELECT path, size, mtime_ns, {keys} FROM files JOIN temp.lookup USING (path)
+        WHERE algorithm=:algorithm"""
     insert_query = """
-        INSERT INTO files (path, size, mtime_ns, entry_dt, {key})
-        VALUES (:path, :size, :mtime_ns, datetime('now'), :value)
-        ON CONFLICT(path) DO UPDATE SET size=:size, mtime_ns=:mtime_ns, entry_dt=datetime('now'), {key}=:value;
+        INSERT INTO files (path, algorithm, size, mtime_ns, dev, ino, entry_dt, {key})
+        VALUES (:path, :algorithm, :size, :mtime_ns, :dev, :ino, datetime('now'), :value)
+        ON CONFLICT(path, algorithm) DO UPDATE SET {reset}, size=:size, mtime_ns=:mtime_ns, dev=:dev, ino=:ino,
+            entry_dt=datetime('now'), {key}=:value;
     """
+    # When the file has changed since it was cached, its other digests are outdated.
+    reset_query = "{key}=CASE WHEN size=:size AND mtime_ns=:mtime_ns THEN {key} END"
+    move_query = "UPDATE OR REPLACE files SET path=:new_path WHERE path=:path"
 
     ignore_mtime = False
+    # Puts are queued and written in a single transaction when the queue reaches this size, or when
+    # the oldest queued put is this many seconds old, whichever comes first.
+    write_batch_size = 1000
+    write_interval = 2.0
 
     def __init__(self):
         self.conn = None
         self.lock = None
+        # {(path, algorithm, key): (size, mtime_ns, dev, ino, value)}
+        self._pending = {}
+        # {old_path: new_path} for files found under a new path by get_by_inode().
+        self._pending_moves = {}
+        # {(path, algorithm, key): (fingerprint, value)}, same as the above for folders.
+        self._pending_folders = {}
+        # [(pending, pending_folders)] batches that are being written by flush(), still visible to
+        # get() until they're committed. Protected by _pending_lock.
+        self._flushing = []
+        self._pending_lock = Lock()
+        # Serializes flushes, so that batches are written in the order they were queued.
+        self._flush_lock = Lock()
+        self._flush_timer = None
 
     def connect(self, path: Union[AnyStr, os.PathLike]) -> None:
         self.conn = sqlite3.connect(path, check_same_thread=False)
         self.lock = Lock()
+        # With WAL, a commit doesn't have to rewrite the main database file, which makes frequent
+        # small transactions cheap. The cache can afford losing the last transactions on power loss.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self._check_upgrade()
 
     def _check_upgrade(self) -> None:
@@ -132,33 +298,116 @@ class FilesDB:
                 version = conn.execute("SELECT version FROM schema_version ORDER BY version DESC").fetchone()[0]
             else:
                 conn.execute("CREATE TABLE schema_version (version int PRIMARY KEY, description TEXT)")
+            while version != self.schema_version and version in self.upgrade_queries:
+                for query in self.upgrade_queries[version]:
+                    conn.execute(query, {"algorithm": DEFAULT_HASHER})
+                version += 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_version VALUES (:version, :description)",
+                    {"version": version, "description": self.schema_version_description},
+                )
             if version != self.schema_version:
                 conn.execute(self.drop_table_query)
+                conn.execute(self.drop_folders_table_query)
                 conn.execute(
                     "INSERT OR REPLACE INTO schema_version VALUES (:version, :description)",
                     {"version": self.schema_version, "description": self.schema_version_description},
                 )
             conn.execute(self.create_table_query)
+            conn.execute(self.create_index_query)
+            conn.execute(self.create_folders_table_query)
+
+    def _insert_query(self, key: str) -> str:
+        reset = ", ".join(self.reset_query.format(key=other) for other in DIGEST_FIELDS if other != key)
+        return self.insert_query.format(key=key, reset=reset)
+
+    def _insert_folder_query(self, key: str) -> str:
+        reset = ", ".join(self.reset_folder_query.format(key=other) for other in DIGEST_FIELDS if other != key)
+        return self.insert_folder_query.format(key=key, reset=reset)
+
+    def _get_pending(self, path: Path, key: str, size: int, mtime_ns: int) -> Union[bytes, None]:
+        with self._pending_lock:
+            pending_key = (str(path), hasher_name, key)
+            entry = self._pending.get(pending_key)
+            if entry is None:
+                # The latest batch has the latest value
+                for files, _ in reversed(self._flushing):
+                    if pending_key in files:
+                        entry = files[pending_key]
+                        break
+        if entry is None:
+            return None
+        entry_size, entry_mtime_ns, _, _, value = entry
+        if entry_size != size or (not self.ignore_mtime and entry_mtime_ns != mtime_ns):
+            return None
+        return value
+
+    def _schedule_flush(self) -> bool:
+        # Must be called with _pending_lock acquired. Returns whether the batch is full. Nothing can be
+        # written before connect(), puts are only queued until then.
+        if self.conn is None:
+            return False
+        if len(self._pending) + len(self._pending_folders) >= self.write_batch_size:
+            return True
+        if self._flush_timer is None:
+            self._flush_timer = Timer(self.write_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+        return False
+
+    def _queue(self, path: Path, key: str, stat: os.stat_result, value: Any) -> None:
+        with self._pending_lock:
+            entry = (stat.st_size, stat.st_mtime_ns, stat.st_dev, stat.st_ino, value)
+            self._pending[(str(path), hasher_name, key)] = entry
+            batch_full = self._schedule_flush()
+        if batch_full:
+            self.flush()
+
+    def _queue_move(self, old_path: str, new_path: Path) -> None:
+        with self._pending_lock:
+            self._pending_moves[old_path] = str(new_path)
+            batch_full = self._schedule_flush()
+        if batch_full:
+            self.flush()
 
     def clear(self) -> None:
-        with self.lock, self.conn as conn:
-            conn.execute(self.drop_table_query)
-            conn.execute(self.create_table_query)
-
-    def get(self, path: Path, key: str) -> Union[bytes, None]:
-        stat = path.stat()
+        # A flush that's already writing is done before tables are dropped, and nothing is left to
+        # write afterwards.
+        with self._flush_lock:
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                self._pending = {}
+                self._pending_moves = {}
+                self._pending_folders = {}
+                self._flushing = []
+            with self.lock, self.conn as conn:
+                conn.execute(self.drop_table_query)
+                conn.execute(self.drop_folders_table_query)
+                conn.execute(self.create_table_query)
+                conn.execute(self.create_index_query)
+                conn.execute(self.create_folders_table_query)
+
+    def get(self, path: Path, key: str, stat: Union[os.stat_result, None] = None) -> Union[bytes, None]:
+        if stat is None:
+            stat = path.stat()
         size = stat.st_size
         mtime_ns = stat.st_mtime_ns
+        value = self._get_pending(path, key, size, mtime_ns)
+        if value is not None:
+            return value
         try:
-            with self.conn as conn:
+            with self.lock, self.conn as conn:
                 if self.ignore_mtime:
                     cursor = conn.execute(
-                        self.select_query_ignore_mtime.format(key=key), {"path": str(path), "size": size}
+                        self.select_query_ignore_mtime.format(key=key),
+                        {"path": str(path), "algorithm": hasher_name, "size": size},
                     )
                 else:
                     cursor = conn.execute(
                         self.select_query.format(key=key),
-                        {"path": str(path), "size": size, "mtime_ns": mtime_ns},
+                        {"path": str(path), "algorithm": hasher_name, "size": size, "mtime_ns": mtime_ns},
                     )
                 result = cursor.fetchone()
                 cursor.close()
@@ -168,26 +417,177 @@ class FilesDB:
         except Exception as ex:
             logging.warning(f"Couldn't get {key} for {path} w/{size}, {mtime_ns}: {ex}")
 
-        return None
+        return self.get_by_inode(path, key, stat)
 
-    def put(self, path: Path, key: str, value: Any) -> None:
-        stat = path.stat()
-        size = stat.st_size
-        mtime_ns = stat.st_mtime_ns
+    def get_by_inode(self, path: Path, key: str, stat: os.stat_result) -> Union[bytes, None]:
+        """Returns ``key`` if it's been cached under another path for the same file.
+
+        The file is identified by its device, inode, size and mtime, which don't change when it's
+        renamed or moved within the same filesystem. When the old path doesn't exist anymore, its
+        cache entry is moved to ``path``. Otherwise (hardlinks), ``value`` is copied under ``path``.
+        """
+        if not stat.st_ino:
+            return None  # Some filesystems don't have inode numbers
+        params = {
+            "dev": stat.st_dev,
+            "ino": stat.st_ino,
+            "algorithm": hasher_name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
         try:
             with self.lock, self.conn as conn:
-                conn.execute(
-                    self.insert_query.format(key=key),
-                    {"path": str(path), "size": size, "mtime_ns": mtime_ns, "value": value},
-                )
+                result = conn.execute(self.select_by_inode_query.format(key=key), params).fetchone()
+        except Exception as ex:
+            logging.warning(f"Couldn't get {key} for inode {stat.st_ino} of {path}: {ex}")
+            return None
+        if result is None:
+            return None
+        old_path, value = result
+        if old_path != str(path):
+            if os.path.lexists(old_path):
+                self._queue(path, key, stat, value)
+            else:
+                self._queue_move(old_path, path)
+        return value
+
+    def get_many(self, files: Sequence["File"], keys: Sequence[str]) -> Dict["File", Dict[str, bytes]]:
+        """Returns cached ``keys`` for all ``files`` with a single query.
+
+        Unlike :meth:`get`, the cache validity is checked against the ``size`` and ``mtime``
+        attributes of ``files`` rather than against a fresh stat result.
+
+        The result maps each file that has at least one cached value to a ``{key: value}`` dict.
+        """
+        self.flush()
+        path2file = {str(f.path): f for f in files}
+        result = {}
+        try:
+            with self.lock, self.conn as conn:
+                conn.execute(self.create_lookup_table_query)
+                conn.execute("DELETE FROM temp.lookup")
+                conn.executemany("INSERT OR IGNORE INTO temp.lookup VALUES (?)", ((path,) for path in path2file))
+                cursor = conn.execute(self.select_many_query.format(keys=", ".join(keys)), {"algorithm": hasher_name})
+                for path, size, mtime_ns, *values in cursor:
+                    file = path2file[path]
+                    if size != file.size:
+                        continue
+                    if not self.ignore_mtime and timestamp_from_ns(mtime_ns) != file.mtime:
+                        continue
+                    found = {key: value for key, value in zip(keys, values) if value is not None}
+                    if found:
+                        result[file] = found
+                conn.execute("DELETE FROM temp.lookup")
+        except Exception as ex:
+            logging.warning(f"Couldn't get {keys} for {len(path2file)} files: {ex}")
+        return result
+
+    def put(self, path: Path, key: str, value: Any, stat: Union[os.stat_result, None] = None) -> None:
+        """Queues ``value`` to be written as ``key`` for ``path``.
+
+        Queued values are written in batches (see :meth:`flush`), but are immediately visible to
+        :meth:`get`.
+        """
+        if stat is None:
+            stat = path.stat()
+        self._queue(path, key, stat, value)
+
+    def put_many(self, key: str, entries: Iterable[Tuple[Path, os.stat_result, Any]]) -> None:
+        """Queues ``key`` for many files.
+
+        ``entries`` is an iterable of ``(path, stat, value)`` tuples, ``stat`` being the stat result
+        of ``path`` at the time ``value`` was computed.
+        """
+        for path, stat, value in entries:
+            self._queue(path, key, stat, value)
+
+    def get_folder(self, path: Path, key: str, fingerprint: bytes) -> Union[bytes, None]:
+        """Returns ``key`` for the folder at ``path`` if it was cached with the same ``fingerprint``."""
+        pending_key = (str(path), hasher_name, key)
+        with self._pending_lock:
+            entry = self._pending_folders.get(pending_key)
+            if entry is None:
+                for _, folders in reversed(self._flushing):
+                    if pending_key in folders:
+                        entry = folders[pending_key]
+                        break
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+        try:
+            with self.lock, self.conn as conn:
+                params = {"path": str(path), "algorithm": hasher_name, "fingerprint": fingerprint}
+                result = conn.execute(self.select_folder_query.format(key=key), params).fetchone()
+        except Exception as ex:
+            logging.warning(f"Couldn't get {key} for folder {path}: {ex}")
+            return None
+        return result[0] if result else None
+
+    def put_folder(self, path: Path, key: str, fingerprint: bytes, value: Any) -> None:
+        """Queues ``value`` to be written as ``key`` for the folder at ``path``, like :meth:`put`."""
+        with self._pending_lock:
+            self._pending_folders[(str(path), hasher_name, key)] = (fingerprint, value)
+            batch_full = self._schedule_flush()
+        if batch_full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all queued puts in a single transaction.
+
+        Can be called from any thread. Concurrent calls write their batches one after the other.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not (self._pending or self._pending_moves or self._pending_folders):
+                    return
+                batch = (self._pending, self._pending_folders)
+                moves = self._pending_moves
+                self._pending, self._pending_folders, self._pending_moves = {}, {}, {}
+                self._flushing.append(batch)
+            try:
+                self._write(batch, moves)
+            finally:
+                with self._pending_lock:
+                    self._flushing.remove(batch)
+
+    def _write(self, batch, moves) -> None:
+        pending, pending_folders = batch
+        key2params = defaultdict(list)
+        for (path, algorithm, key), (size, mtime_ns, dev, ino, value) in pending.items():
+            params = {
+                "path": path,
+                "algorithm": algorithm,
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "dev": dev,
+                "ino": ino,
+                "value": value,
+            }
+            key2params[key].append(params)
+        key2folder_params = defaultdict(list)
+        for (path, algorithm, key), (fingerprint, value) in pending_folders.items():
+            params = {"path": path, "algorithm": algorithm, "fingerprint": fingerprint, "value": value}
+            key2folder_params[key].append(params)
+        try:
+            with self.lock, self.conn as conn:
+                # Moves go first, so that values put for the new path end up in the moved entry.
+                conn.executemany(self.move_query, ({"path": old, "new_path": new} for old, new in moves.items()))
+                for key, params in key2params.items():
+                    conn.executemany(self._insert_query(key), params)
+                for key, params in key2folder_params.items():
+                    conn.executemany(self._insert_folder_query(key), params)
         except Exception as ex:
-            logging.warning(f"Couldn't put {key} for {path} w/{size}, {mtime_ns}: {ex}")
+            logging.warning(f"Couldn't put {len(pending) + len(pending_folders)} values: {ex}")
 
     def commit(self) -> None:
+        self.flush()
         with self.lock:
             self.conn.commit()
 
     def close(self) -> None:
+        self.flush()
         with self.lock:
             self.conn.close()
 
@@ -198,7 +598,15 @@ filesdb = FilesDB()  # Singleton
 class File:
     """Represents a file and holds metadata to be used for scanning."""
 
-    INITIAL_INFO = {"size": 0, "mtime": 0, "digest": b"", "digest_partial": b"", "digest_samples": b""}
+    INITIAL_INFO = {
+        "size": 0,
+        "mtime": 0,
+        "dev": 0,
+        "inode": 0,
+        "digest": b"",
+        "digest_partial": b"",
+        "digest_samples": b"",
+    }
     # Slots for File make us save quite a bit of memory. In a memory test I've made with a lot of
     # files, I saved 35% memory usage with "unread" files (no _read_info() call) and gains become
     # even greater when we take into account read attributes (70%!). Yeah, it's worth it.
@@ -207,10 +615,14 @@ class File:
     def __init__(self, path):
         for attrname in self.INITIAL_INFO:
             setattr(self, attrname, NOT_SET)
-        if type(path) is os.DirEntry:
+        if isinstance(path, (os.DirEntry, SnapshotEntry)):
             self.path = Path(path.path)
-            self.size = nonone(path.stat().st_size, 0)
-            self.mtime = nonone(path.stat().st_mtime, 0)
+            stats = path.stat()
+            self.size = nonone(stats.st_size, 0)
+            self.mtime = nonone(stats.st_mtime, 0)
+            self.dev = stats.st_dev
+            # On Windows, the stat result of a DirEntry doesn't have the inode, but inode() does.
+            self.inode = path.inode()
         else:
             self.path = path
 
@@ -232,74 +644,77 @@ class File:
     def _calc_digest(self):
         # type: () -> bytes
 
-        with self.path.open("rb") as fp:
+        # Reading into a reused buffer from an unbuffered file avoids allocating (and copying) a new
+        # bytes object for every chunk.
+        with self.path.open("rb", buffering=0) as fp:
             file_hash = hasher()
-            # The goal here is to not run out of memory on really big files. However, the chunk
-            # size has to be large enough so that the python loop isn't too costly in terms of
-            # CPU.
-            CHUNK_SIZE = 1024 * 1024  # 1 mb
-            filedata = fp.read(CHUNK_SIZE)
-            while filedata:
-                file_hash.update(filedata)
-                filedata = fp.read(CHUNK_SIZE)
+            buffer = get_buffer(chunk_size(self.size))
+            count = fp.readinto(buffer)
+            while count:
+                file_hash.update(buffer[:count])
+                count = fp.readinto(buffer)
             return file_hash.digest()
 
     def _calc_digest_partial(self):
         # type: () -> bytes
-        with self.path.open("rb") as fp:
+        with self.path.open("rb", buffering=0) as fp:
             fp.seek(PARTIAL_OFFSET_SIZE[0])
-            partial_data = fp.read(PARTIAL_OFFSET_SIZE[1])
-            return hasher(partial_data).digest()
+            buffer = get_buffer(PARTIAL_OFFSET_SIZE[1])
+            count = readinto(fp, buffer)
+            return hasher(buffer[:count]).digest()
 
     def _calc_digest_samples(self) -> bytes:
         size = self.size
-        with self.path.open("rb") as fp:
-            # Chunk at 25% of the file
-            fp.seek(floor(size * 25 / 100), 0)
-            file_data = fp.read(CHUNK_SIZE)
-            file_hash = hasher(file_data)
-
-            # Chunk at 60% of the file
-            fp.seek(floor(size * 60 / 100), 0)
-            file_data = fp.read(CHUNK_SIZE)
-            file_hash.update(file_data)
-
-            # Last chunk of the file
-            fp.seek(-CHUNK_SIZE, 2)
-            file_data = fp.read(CHUNK_SIZE)
-            file_hash.update(file_data)
+        with self.path.open("rb", buffering=0) as fp:
+            buffer = get_buffer(SAMPLE_SIZE)
+            file_hash = hasher()
+            # Chunks at 25% and 60% of the file, then the last chunk of the file
+            for offset, whence in ((floor(size * 25 / 100), 0), (floor(size * 60 / 100), 0), (-SAMPLE_SIZE, 2)):
+                fp.seek(offset, whence)
+                count = readinto(fp, buffer)
+                file_hash.update(buffer[:count])
             return file_hash.digest()
 
+    def _calc_digest_field(self, field: str) -> bytes:
+        """Computes digest ``field`` from the file's contents without going through :data:`filesdb`.
+
+        Doesn't set any attribute, which makes it safe to call from a worker thread.
+        """
+        if field == "digest_partial":
+            return self._calc_digest_partial()
+        elif field == "digest_samples":
+            return self._calc_digest_samples()
+        return self._calc_digest()
+
+    def _digest_source(self, field: str) -> str:
+        """Returns the digest field from which ``field`` is actually computed.
+
+        Files that are too small to be partially hashed or sampled are hashed entirely.
+        """
+        if field == "digest_partial" and self.size < PARTIAL_OFFSET_SIZE[0] + PARTIAL_OFFSET_SIZE[1]:
+            return "digest"
+        if field == "digest_samples" and self.size <= MIN_FILE_SIZE:
+            return "digest"
+        return field
+
     def _read_info(self, field):
         # print(f"_read_info({field}) for {self}")
-        if field in ("size", "mtime"):
+        if field in ("size", "mtime", "dev", "inode"):
             stats = self.path.stat()
             self.size = nonone(stats.st_size, 0)
             self.mtime = nonone(stats.st_mtime, 0)
-        elif field == "digest_partial":
-            self.digest_partial = filesdb.get(self.path, "digest_partial")
-            if self.digest_partial is None:
-                # If file is smaller than partial requirements just use the full digest
-                if self.size < PARTIAL_OFFSET_SIZE[0] + PARTIAL_OFFSET_SIZE[1]:
-                    self.digest_partial = self.digest
-                else:
-                    self.digest_partial = self._calc_digest_partial()
-                filesdb.put(self.path, "digest_partial", self.digest_partial)
-        elif field == "digest":
-            self.digest = filesdb.get(self.path, "digest")
-            if self.digest is None:
-                self.digest = self._calc_digest()
-                filesdb.put(self.path, "digest", self.digest)
-        elif field == "digest_samples":
-            size = self.size
-            # Might as well hash such small files entirely.
-            if size <= MIN_FILE_SIZE:
-                self.digest_samples = self.digest
+            self.dev = stats.st_dev
+            self.inode = stats.st_ino
+        elif field in DIGEST_FIELDS:
+            source = self._digest_source(field)
+            if source != field:
+                setattr(self, field, getattr(self, source))
                 return
-            self.digest_samples = filesdb.get(self.path, "digest_samples")
-            if self.digest_samples is None:
-                self.digest_samples = self._calc_digest_samples()
-                filesdb.put(self.path, "digest_samples", self.digest_samples)
+            value = filesdb.get(self.path, field)
+            if value is None:
+                value = self._calc_digest_field(field)
+                filesdb.put(self.path, field, value)
+            setattr(self, field, value)
 
     def _read_all_info(self, attrnames=None):
         """Cache all possible info.
@@ -361,47 +776,91 @@ class Folder(File):
     """A wrapper around a folder path.
 
     It has the size/digest info of a File, but its value is the sum of its subitems.
+
+    The folder is listed only once, the first time its content is needed, and its subfolders and
+    files are kept along with whatever info was read from them. Each item of a tree is thus
+    listed, stat'ed and hashed at most once, no matter how many of its ancestors need it.
     """
 
-    __slots__ = File.__slots__ + ("_subfolders",)
+    __slots__ = File.__slots__ + ("_subfolders", "_files", "_fingerprint")
 
     def __init__(self, path):
         File.__init__(self, path)
         self.size = NOT_SET
         self._subfolders = None
+        self._files = None
+        self._fingerprint = None
+
+    def _list(self):
+        if self._subfolders is None:
+            subfolders = []
+            files = []
+            with os.scandir(self.path) as iter:
+                for entry in iter:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir():
+                        subfolders.append(self.__class__(entry))
+                    elif entry.is_file():
+                        files.append(File(entry))
+            self._subfolders = subfolders
+            self._files = files
 
     def _all_items(self):
-        folders = self.subfolders
-        files = get_files(self.path)
-        return folders + files
+        self._list()
+        return self._subfolders + self._files
 
     def _read_info(self, field):
         # print(f"_read_info({field}) for Folder {self}")
-        if field in {"size", "mtime"}:
-            size = sum((f.size for f in self._all_items()), 0)
-            self.size = size
+        if field == "size":
+            self.size = sum((f.size for f in self._all_items()), 0)
+        elif field in {"mtime", "dev", "inode"}:
             stats = self.path.stat()
             self.mtime = nonone(stats.st_mtime, 0)
+            self.dev = stats.st_dev
+            self.inode = stats.st_ino
         elif field in {"digest", "digest_partial", "digest_samples"}:
-            # What's sensitive here is that we must make sure that subfiles'
-            # digest are always added up in the same order, but we also want a
-            # different digest if a file gets moved in a different subdirectory.
+            # If nothing changed in the folder since its digest was cached, we don't even have to
+            # look at the digests of its children.
+            fingerprint = self.fingerprint
+            digest = filesdb.get_folder(self.path, field, fingerprint)
+            if digest is None:
+                # What's sensitive here is that we must make sure that subfiles'
+                # digest are always added up in the same order, but we also want a
+                # different digest if a file gets moved in a different subdirectory.
+
+                def get_dir_digest_concat():
+                    items = self._all_items()
+                    items.sort(key=lambda f: f.path)
+                    digests = [getattr(f, field) for f in items]
+                    return b"".join(digests)
+
+                digest = hasher(get_dir_digest_concat()).digest()
+                filesdb.put_folder(self.path, field, fingerprint, digest)
+            setattr(self, field, digest)
 
-            def get_dir_digest_concat():
-                items = self._all_items()
-                items.sort(key=lambda f: f.path)
-                digests = [getattr(f, field) for f in items]
-                return b"".join(digests)
+    @property
+    def fingerprint(self) -> bytes:
+        """A digest of the names, sizes and modification times of everything under this folder.
 
-            digest = hasher(get_dir_digest_concat()).digest()
-            setattr(self, field, digest)
+        It's computed from the names, sizes and mtimes of the folder's files and the names and
+        fingerprints of its subfolders, without reading any file. If it's the same as when the
+        folder's digests were cached, they're still valid.
+        """
+        if self._fingerprint is None:
+            fingerprint = hasher()
+            for item in sorted(self._all_items(), key=lambda f: f.name):
+                fingerprint.update(item.name.encode("utf-8", "surrogateescape") + b"\0")
+                if isinstance(item, Folder):
+                    fingerprint.update(b"/" + item.fingerprint)
+                else:
+                    fingerprint.update(struct.pack("<qd", item.size, item.mtime))
+            self._fingerprint = fingerprint.digest()
+        return self._fingerprint
 
     @property
     def subfolders(self):
-        if self._subfolders is None:
-            with os.scandir(self.path) as iter:
-                subfolders = [p for p in iter if not p.is_symlink() and p.is_dir()]
-            self._subfolders = [self.__class__(p) for p in subfolders]
+        self._list()
         return self._subfolders
 
     @classmethod
@@ -409,8 +868,8 @@ class Folder(File):
         return not path.is_symlink() and path.is_dir()
 
 
-def get_file(path, fileclasses=[File]):
-    """Wraps ``path`` around its appropriate :class:`File` class.
+def get_fileclass(path, fileclasses=[File]):
+    """Returns the appropriate :class:`File` class for ``path``, or ``None``.
 
     Whether a class is "appropriate" is decided by :meth:`File.can_handle`
 
@@ -419,7 +878,20 @@ def get_file(path, fileclasses=[File]):
     """
     for fileclass in fileclasses:
         if fileclass.can_handle(path):
-            return fileclass(path)
+            return fileclass
+
+
+def get_file(path, fileclasses=[File]):
+    """Wraps ``path`` around its appropriate :class:`File` class.
+
+    See :func:`get_fileclass`.
+
+    :param Path path: path to wrap
+    :param fileclasses: List of candidate :class:`File` classes
+    """
+    fileclass = get_fileclass(path, fileclasses=fileclasses)
+    if fileclass is not None:
+        return fileclass(path)
 
 
 def get_files(path, fileclasses=[File]):
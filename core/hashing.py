@@ -0,0 +1,334 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import logging
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+
+from hscommon.jobprogress import job
+
+from core import fs
+
+# Groups of at most this many files are verified by comparing their contents side by side rather than
+# by computing their full digests.
+SPLIT_BY_CONTENTS_MAX_FILES = 3
+
+# Maximum number of DigestPool.warm() tasks queued or running at once. Past that, warm() blocks until
+# some are done, which keeps the queue (and the files it holds onto) from growing without bounds.
+MAX_WARMING_TASKS = 1000
+
+# Default number of worker threads per device. A few concurrent reads keep an SSD or a network mount
+# busy, more only make a spinning disk seek back and forth.
+DEFAULT_WORKERS = 4
+
+
+def _load_digest(file, field, lookup):
+    # Runs in a worker thread. Returns the stat result used to validate the cache and the digest,
+    # computed from the file's contents if it wasn't in the cache (in which case, the third element
+    # of the result is True). If ``lookup`` is false, we already know that the cache doesn't have it
+    # under the file's path.
+    stat = file.path.stat()
+    if lookup:
+        value = fs.filesdb.get(file.path, field, stat=stat)
+    else:
+        # The file isn't cached under its path, but it might have been renamed or moved.
+        value = fs.filesdb.get_by_inode(file.path, field, stat)
+    if value is not None:
+        return stat, value, False
+    return stat, file._calc_digest_field(field), True
+
+
+def _warm_digest(file, field):
+    # Runs in a worker thread. Makes sure that the hash cache has ``field`` for ``file``.
+    stat, value, computed = _load_digest(file, field, True)
+    if computed:
+        fs.filesdb.put(file.path, field, value, stat=stat)
+
+
+def _split_by_contents(files):
+    # Runs in a worker thread. Returns a list of (files, stats, digest) for groups of files having
+    # the same contents. As identical files are read to the end anyway, they're hashed along the way.
+    fps = []
+    stats = []
+    try:
+        for file in files:
+            try:
+                fp = file.path.open("rb", buffering=0)
+            except OSError as e:
+                logging.warning("An error '%s' was raised while opening '%s'", e, repr(file.path))
+                fp = None
+            fps.append(fp)
+            stats.append(os.fstat(fp.fileno()) if fp is not None else None)
+        # Each file is read into its own buffer, allocated once. Chunks are compared as bytearrays,
+        # comparing memoryviews is a lot slower.
+        buffers = [bytearray(fs.CHUNK_SIZE) if fp is not None else None for fp in fps]
+        result = []
+        # [([index], hasher)]. Files of a group have had the same contents so far, so a group only
+        # needs one hasher, which is copied when the group splits.
+        groups = [([i for i, fp in enumerate(fps) if fp is not None], fs.hasher())]
+        while groups:
+            next_groups = []
+            for group, file_hash in groups:
+                # [(chunk, [index])], small enough to not bother with a dict
+                chunk_groups = []
+                for i in group:
+                    try:
+                        count = fs.readinto(fps[i], memoryview(buffers[i]))
+                    except OSError as e:
+                        # Only this file is left out, the others are still compared.
+                        logging.warning("An error '%s' was raised while reading '%s'", e, repr(files[i].path))
+                        continue
+                    # Only the last chunk of a file is short, and only then is it copied.
+                    chunk = buffers[i] if count == fs.CHUNK_SIZE else buffers[i][:count]
+                    for chunk_group in chunk_groups:
+                        if chunk_group[0] == chunk:
+                            chunk_group[1].append(i)
+                            break
+                    else:
+                        chunk_groups.append((chunk, [i]))
+                chunk_groups = [(chunk, indexes) for chunk, indexes in chunk_groups if len(indexes) >= 2]
+                for chunk, indexes in chunk_groups:
+                    if not chunk:  # all reached EOF together
+                        result.append(([files[i] for i in indexes], [stats[i] for i in indexes], file_hash.digest()))
+                        continue
+                    group_hash = file_hash.copy() if len(chunk_groups) > 1 else file_hash
+                    group_hash.update(chunk)
+                    next_groups.append((indexes, group_hash))
+            groups = next_groups
+        return result
+    finally:
+        for fp in fps:
+            if fp is not None:
+                fp.close()
+
+
+def can_split_by_contents(files):
+    """Returns whether :meth:`DigestPool.split_by_contents` should be used to verify ``files``.
+
+    That's the case for small groups of files (at most :data:`SPLIT_BY_CONTENTS_MAX_FILES`) for
+    which no digest is known yet. The larger the group, the more likely it is to be read to the end.
+    """
+    return len(files) <= SPLIT_BY_CONTENTS_MAX_FILES and all(
+        DigestPool._is_hashable(f) and object.__getattribute__(f, "digest") is fs.NOT_SET for f in files
+    )
+
+
+class DigestPool:
+    """Computes file digests concurrently in pools of worker threads, one pool per device.
+
+    Reading files is what bottlenecks a Contents scan, and a single thread is far from enough to
+    saturate a modern disk (or a network mount). Workers only read files and compute digests,
+    everything else (setting the digest on the :class:`~core.fs.File` and queuing it for
+    :data:`~core.fs.filesdb`) happens in the calling thread.
+
+    Work is queued per device (``st_dev``), each device having its own workers, so that a slow disk
+    doesn't hold back the others and each disk only serves as many concurrent reads as it's allowed
+    to. Within a device, files are read in inode order, which roughly follows their position on
+    disk and saves seeks on spinning disks.
+
+    Objects that aren't :class:`~core.fs.File` instances, as well as :class:`~core.fs.Folder`
+    instances (which digests are aggregated from their content), are left alone: their digests will
+    be read lazily, as usual.
+
+    :param int max_workers: Number of worker threads per device. If ``None``,
+                            :data:`DEFAULT_WORKERS`.
+    :param dict device_workers: ``{st_dev: max_workers}`` for devices needing a different number
+                                of worker threads than ``max_workers``.
+    """
+
+    def __init__(self, max_workers=None, device_workers=None):
+        self.max_workers = max_workers
+        self.device_workers = device_workers or {}
+        # {st_dev: ThreadPoolExecutor}
+        self._executors = {}
+        # Files for which the hash cache has already been looked up by prefetch()
+        self._prefetched = set()
+        # Futures of warm() tasks that aren't done yet
+        self._warming = set()
+        self._warming_lock = threading.Lock()
+        self._warming_slots = threading.BoundedSemaphore(MAX_WARMING_TASKS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is not None:
+            # Most likely a cancelled job, digests that aren't being computed yet won't be needed.
+            with self._warming_lock:
+                warming = list(self._warming)
+            for future in warming:
+                future.cancel()
+        self.close()
+
+    # ---Private
+    @staticmethod
+    def _is_hashable(file):
+        return isinstance(file, fs.File) and not isinstance(file, fs.Folder)
+
+    def _warm_done(self, file, future):
+        # Called when the warm() task of ``file`` is done (or cancelled), possibly from a worker thread.
+        with self._warming_lock:
+            self._warming.discard(future)
+        self._warming_slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            # Nobody waits for the result, the digest will be computed (and the error logged) again
+            # if it's needed.
+            logging.warning("An error '%s' was raised while hashing '%s'", future.exception(), repr(file.path))
+
+    def _split_by_digest(self, files, j):
+        # What split_by_contents() does, by computing full digests. Files that couldn't be hashed
+        # (compute() logged them) are left out.
+        self.compute(files, "digest", j)
+        digest2files = defaultdict(list)
+        for file in files:
+            value = object.__getattribute__(file, "digest")
+            if value is not fs.NOT_SET:
+                digest2files[value].append(file)
+        return [same_files for same_files in digest2files.values() if len(same_files) > 1]
+
+    def _get_executor(self, dev):
+        if dev not in self._executors:
+            max_workers = self.device_workers.get(dev, self.max_workers or DEFAULT_WORKERS)
+            self._executors[dev] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"DigestPool-{dev}")
+        return self._executors[dev]
+
+    def _run(self, tasks, j):
+        # Runs ``tasks``, a list of (key, file, func, args), in the worker threads of ``file``'s device
+        # and yields (key, result) as they complete. If a task raised an exception, the exception is
+        # its result.
+        tasks = sorted(tasks, key=lambda task: (task[1].dev, task[1].inode))
+        future2key = {}
+        for key, file, func, args in tasks:
+            future2key[self._get_executor(file.dev).submit(func, *args)] = key
+        pending = set(future2key)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                j.check_if_cancelled()
+                for future in done:
+                    key = future2key.pop(future)
+                    try:
+                        yield key, future.result()
+                    except Exception as e:
+                        yield key, e
+        finally:
+            for future in pending:
+                future.cancel()
+
+    # ---Public
+    def close(self):
+        """Stops worker threads and writes computed digests to the hash cache.
+
+        Waits for :meth:`warm` tasks to be done.
+        """
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        self._executors = {}
+        fs.filesdb.flush()
+
+    def compute(self, files, field, j=job.nulljob):
+        """Makes sure that ``field`` is read for every file of ``files``.
+
+        Files for which ``field`` is already known are skipped. This call blocks until all digests
+        are computed.
+
+        :param files: Collection of :class:`~core.fs.File`.
+        :param str field: One of :data:`~core.fs.DIGEST_FIELDS`.
+        :param j: A :ref:`job progress instance <jobs>`, only used for cancellation.
+        """
+        # {(source_field, dev, inode): [file]}. Hardlinks to the same inode are only read once.
+        todo = defaultdict(list)
+        for file in files:
+            if not self._is_hashable(file) or object.__getattribute__(file, field) is not fs.NOT_SET:
+                continue
+            source = file._digest_source(field)
+            if object.__getattribute__(file, source) is fs.NOT_SET:
+                # Without an inode number, we can't tell hardlinks apart
+                key = (source, file.dev, file.inode) if file.inode else (source, file)
+                todo[key].append(file)
+        tasks = []
+        for key, same_files in todo.items():
+            file = same_files[0]
+            tasks.append((key, file, _load_digest, (file, key[0], file not in self._prefetched)))
+        for key, result in self._run(tasks, j):
+            source = key[0]
+            if isinstance(result, Exception):
+                # Leave the field unset, it will be read again (and the error logged) lazily.
+                logging.warning("An error '%s' was raised while hashing '%s'", result, repr(todo[key][0].path))
+                continue
+            stat, value, computed = result
+            for i, file in enumerate(todo[key]):
+                setattr(file, source, value)
+                # Other links get their own cache entry, which get_by_inode() would have copied anyway.
+                if computed or i > 0:
+                    fs.filesdb.put(file.path, source, value, stat=stat)
+        # Derived fields (small files hashed entirely) are now trivially readable.
+        for file in files:
+            if self._is_hashable(file):
+                getattr(file, field)
+
+    def warm(self, files, field):
+        """Starts computing ``field`` of ``files`` into the hash cache, without waiting for it.
+
+        Unlike :meth:`compute`, digests aren't set on ``files``, they're only written to
+        :data:`~core.fs.filesdb` (unless they were already there), where they'll be found when
+        they're needed. This lets files be hashed while the work that finds out which files need
+        to be hashed is still going on.
+
+        Blocks while :data:`MAX_WARMING_TASKS` tasks are already pending.
+        """
+        for file in files:
+            if self._is_hashable(file):
+                self._warming_slots.acquire()
+                future = self._get_executor(file.dev).submit(_warm_digest, file, file._digest_source(field))
+                with self._warming_lock:
+                    self._warming.add(future)
+                future.add_done_callback(partial(self._warm_done, file))
+
+    def split_by_contents(self, buckets, j=job.nulljob):
+        """Splits each bucket of ``buckets`` in groups of files having exactly the same contents.
+
+        Files of a bucket, which must all have the same size, are read side by side, chunk by
+        chunk, and the bucket is split as soon as contents diverge. Unlike hashing, reading stops
+        as soon as a file is known to be unique, which makes this much cheaper for files sharing a
+        size but not contents. Files that end up alone are dropped. Files found identical have been
+        read entirely, so their ``digest`` is set (and cached) on the way. Files that can't be read are
+        dropped as well. If comparing a bucket fails for another reason, it's split by full digests.
+
+        :param buckets: List of lists of :class:`~core.fs.File`, see :func:`can_split_by_contents`.
+        :param j: A :ref:`job progress instance <jobs>`, only used for cancellation.
+        :returns: List of lists of :class:`~core.fs.File`.
+        """
+        result = []
+        # Files of a bucket are usually on the same device, and reading them side by side can only go
+        # as fast as the slowest of them anyway.
+        tasks = [(i, bucket[0], _split_by_contents, (bucket,)) for i, bucket in enumerate(buckets)]
+        for i, groups in self._run(tasks, j):
+            if isinstance(groups, Exception):
+                logging.warning("An error '%s' was raised while comparing %r, hashing them instead", groups, buckets[i])
+                result += self._split_by_digest(buckets[i], j)
+                continue
+            for files, stats, value in groups:
+                for file, stat in zip(files, stats):
+                    setattr(file, "digest", value)
+                    fs.filesdb.put(file.path, "digest", value, stat=stat)
+                result.append(files)
+        return result
+
+    def prefetch(self, files):
+        """Reads all digests of ``files`` that are in the hash cache in one go.
+
+        This is much faster than looking up each digest of each file individually. Files that end up
+        being hashed afterwards in :meth:`compute` don't go through the hash cache again.
+        """
+        files = [f for f in files if self._is_hashable(f)]
+        cached = fs.filesdb.get_many(files, fs.DIGEST_FIELDS)
+        for file, values in cached.items():
+            for field, value in values.items():
+                if object.__getattribute__(file, field) is fs.NOT_SET:
+                    setattr(file, field, value)
+        self._prefetched.update(files)
@@ -41,6 +41,14 @@ class IgnoreList:
 
         return do_check(first, second) or do_check(second, first)
 
+    def any_ignored(self, items):
+        """Returns whether any two of ``items`` are ignored together.
+
+        This is much faster than calling :meth:`are_ignored` on every pair of ``items``.
+        """
+        items = set(items)
+        return any(not self._ignored[item].isdisjoint(items) for item in items if item in self._ignored)
+
     def clear(self):
         self._ignored = {}
         self._count = 0
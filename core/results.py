@@ -257,7 +257,11 @@ class Results(Markable):
                 except (IndexError, KeyError, ValueError):
                     # Covers missing attr, non-int values and indexes out of bounds
                     pass
-            if (not group.matches) and (len(dupes) >= 2):
+            if group_elem.get("exact") == "y":
+                # Matches aren't recorded for groups of identical files
+                if len(dupes) >= 2:
+                    group = engine.ExactGroup(dupes)
+            elif (not group.matches) and (len(dupes) >= 2):
                 do_match(dupes[0], dupes[1:], group)
             group.prioritize(lambda x: dupes.index(x))
             if len(group):
@@ -346,6 +350,9 @@ class Results(Markable):
         root = ET.Element("results")
         for g in self.groups:
             group_elem = ET.SubElement(root, "group")
+            if isinstance(g, engine.ExactGroup):
+                # Matches aren't recorded, all files match each other at 100%
+                group_elem.set("exact", "y")
             dupe2index = {}
             for index, d in enumerate(g):
                 dupe2index[d] = index
@@ -4,16 +4,18 @@
 # which should be included with this package. The terms are also available at
 # http://www.gnu.org/licenses/gpl-3.0.html
 
+import itertools
 import logging
 import re
 import os.path as op
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 
 from hscommon.jobprogress import job
 from hscommon.util import dedupe, rem_file_ext, get_file_ext
 from hscommon.trans import tr
 
 from core import engine
+from core.filetable import FileTable
 
 # It's quite ugly to have scan types from all editions all put in the same class, but because there's
 # there will be some nasty bugs popping up (ScanType is used in core when in should exclusively be
@@ -72,49 +74,70 @@ def remove_dupe_paths(files):
     return result
 
 
+def get_nested_paths(paths):
+    # Returns the subset of ``paths`` having one of their parent in ``paths``.
+    sortedpaths = sorted(paths)
+    result = set()
+    last_parent_path = sortedpaths[0]
+    for p in sortedpaths[1:]:
+        if last_parent_path in p.parents:
+            result.add(p)
+        else:
+            last_parent_path = p
+    return result
+
+
 class Scanner:
     def __init__(self):
         self.discarded_file_count = 0
 
+    def _filter_by_size(self, files):
+        if self.size_threshold:
+            files = [f for f in files if f.size >= self.size_threshold]
+        if self.large_size_threshold:
+            files = [f for f in files if f.size <= self.large_size_threshold]
+        return files
+
+    def _getgroups(self, files, j):
+        # Only for exact scan types, see _get_exact_dupe_groups()
+        j = j.start_subjob([2, 8])
+        files = self._filter_by_size(files)
+        return engine.getgroups_by_contents(
+            files,
+            bigsize=self.big_file_size_threshold,
+            hash_workers=self.hash_workers or None,
+            device_hash_workers=self.device_hash_workers,
+            prune_nested=self.scan_type == ScanType.FOLDERS,
+            j=j,
+        )
+
     def _getmatches(self, files, j):
-        if (
-            self.size_threshold
-            or self.large_size_threshold
-            or self.scan_type
-            in {
-                ScanType.CONTENTS,
-                ScanType.FOLDERS,
-            }
-        ):
+        if self.size_threshold or self.large_size_threshold:
             j = j.start_subjob([2, 8])
-            if self.size_threshold:
-                files = [f for f in files if f.size >= self.size_threshold]
-            if self.large_size_threshold:
-                files = [f for f in files if f.size <= self.large_size_threshold]
-        if self.scan_type in {ScanType.CONTENTS, ScanType.FOLDERS}:
-            return engine.getmatches_by_contents(files, bigsize=self.big_file_size_threshold, j=j)
-        else:
-            j = j.start_subjob([2, 8])
-            kw = {}
-            kw["match_similar_words"] = self.match_similar_words
-            kw["weight_words"] = self.word_weighting
-            kw["min_match_percentage"] = self.min_match_percentage
-            if self.scan_type == ScanType.FIELDSNOORDER:
-                self.scan_type = ScanType.FIELDS
-                kw["no_field_order"] = True
-            func = {
-                ScanType.FILENAME: lambda f: engine.getwords(rem_file_ext(f.name)),
-                ScanType.FIELDS: lambda f: engine.getfields(rem_file_ext(f.name)),
-                ScanType.TAG: lambda f: [
-                    engine.getwords(str(getattr(f, attrname)))
-                    for attrname in SCANNABLE_TAGS
-                    if attrname in self.scanned_tags
-                ],
-            }[self.scan_type]
-            for f in j.iter_with_progress(files, tr("Read metadata of %d/%d files")):
-                logging.debug("Reading metadata of %s", f.path)
-                f.words = func(f)
-            return engine.getmatches(files, j=j, **kw)
+            files = self._filter_by_size(files)
+        j = j.start_subjob([2, 8])
+        kw = {}
+        kw["match_similar_words"] = self.match_similar_words
+        kw["weight_words"] = self.word_weighting
+        kw["min_match_percentage"] = self.min_match_percentage
+        kw["lsh_bands"] = self.lsh_bands
+        kw["lsh_rows"] = self.lsh_rows
+        if self.scan_type == ScanType.FIELDSNOORDER:
+            self.scan_type = ScanType.FIELDS
+            kw["no_field_order"] = True
+        func = {
+            ScanType.FILENAME: lambda f: engine.getwords(rem_file_ext(f.name)),
+            ScanType.FIELDS: lambda f: engine.getfields(rem_file_ext(f.name)),
+            ScanType.TAG: lambda f: [
+                engine.getwords(str(getattr(f, attrname)))
+                for attrname in SCANNABLE_TAGS
+                if attrname in self.scanned_tags
+            ],
+        }[self.scan_type]
+        for f in j.iter_with_progress(files, tr("Read metadata of %d/%d files")):
+            logging.debug("Reading metadata of %s", f.path)
+            f.words = func(f)
+        return engine.getmatches(files, j=j, **kw)
 
     @staticmethod
     def _key_func(dupe):
@@ -142,38 +165,100 @@ class Scanner:
         """
         raise NotImplementedError()
 
+    def _get_exact_dupe_groups(self, files, ignore_list, j):
+        # Exact scans (Contents and Folders) get groups of identical files directly from the engine,
+        # instead of every match pair between them. This applies the same filters as for matches in
+        # get_dupe_groups() on these groups. When some pairs of a group don't pass those filters
+        # (nested folders, ignored pairs), that group's matches go through get_groups() as usual.
+        groups = self._getgroups(files, j)
+        logging.info("Found %d groups of identical files" % len(groups))
+        j.set_progress(100, tr("Almost done! Fiddling with results..."))
+        nested_paths = set()
+        if self.scan_type == ScanType.FOLDERS and groups:
+            nested_paths = get_nested_paths({f.path for g in groups for f in g})
+        result = []
+        fallback_matches = []
+        for group in groups:
+            if self.mix_file_kind:
+                parts = [list(group)]
+            else:
+                ext2files = defaultdict(list)
+                for f in group:
+                    ext2files[get_file_ext(f.name)].append(f)
+                parts = list(ext2files.values())
+            for part in parts:
+                if self.include_exists_check:
+                    part = [f for f in part if f.exists()]
+                if len(part) < 2:
+                    continue
+                has_nested_pairs = sum(1 for f in part if f.path in nested_paths) > 1
+                if has_nested_pairs or (ignore_list and ignore_list.any_ignored(str(f.path) for f in part)):
+                    for first, second in itertools.combinations(part, 2):
+                        if first.is_ref and second.is_ref:
+                            continue
+                        if first.path in nested_paths and second.path in nested_paths:
+                            continue
+                        if ignore_list and ignore_list.are_ignored(str(first.path), str(second.path)):
+                            continue
+                        fallback_matches.append(engine.Match(first, second, 100))
+                else:
+                    # Ref files aren't matched with each other, which makes get_groups() keep only
+                    # the first of them.
+                    first_ref = next((f for f in part if f.is_ref), None)
+                    result.append(engine.ExactGroup(f for f in part if not f.is_ref or f is first_ref))
+        if fallback_matches:
+            result += engine.get_groups(fallback_matches)
+        return result
+
     def get_dupe_groups(self, files, ignore_list=None, j=job.nulljob):
+        if isinstance(files, FileTable):
+            if self.scan_type == ScanType.CONTENTS:
+                # Files that no other file has the size of are never turned into File instances.
+                files = files.get_candidates(self.size_threshold, self.large_size_threshold)
+            else:
+                files = files.get_files()
         for f in (f for f in files if not hasattr(f, "is_ref")):
             f.is_ref = False
         files = remove_dupe_paths(files)
         logging.info("Getting matches. Scan type: %d", self.scan_type)
+        if self.scan_type in {ScanType.CONTENTS, ScanType.FOLDERS}:
+            groups = self._get_exact_dupe_groups(files, ignore_list, j)
+            # Ticket #195
+            # To speed up the scan, we don't bother comparing contents of files that are both ref
+            # files. However, this messes up "discarded" counting because there's a missing match
+            # in cases where we end up with a dupe group anyway (with a non-ref file). Because it's
+            # impossible to have discarded matches in exact dupe scans, we simply set it at 0, thus
+            # bypassing our tricky problem.
+            self.discarded_file_count = 0
+        else:
+            groups = self._get_fuzzy_dupe_groups(files, ignore_list, j)
+        groups = self.prepare_groups(groups)
+        logging.info("Created %d groups" % len(groups))
+        return groups
+
+    def prepare_groups(self, groups):
+        """Drops groups of ``groups`` made of ref files only and prioritizes the others.
+
+        This is the last step of :meth:`get_dupe_groups`, which is applied to groups coming from
+        somewhere else (see :class:`~core.watch.DirectoryWatcher`) with this method.
+        """
+        groups = [g for g in groups if any(not f.is_ref for f in g)]
+        for g in groups:
+            g.prioritize(self._key_func, self._tie_breaker)
+        return groups
+
+    def _get_fuzzy_dupe_groups(self, files, ignore_list, j):
         matches = self._getmatches(files, j)
         logging.info("Found %d matches" % len(matches))
         j.set_progress(100, tr("Almost done! Fiddling with results..."))
-        # In removing what we call here "false matches", we first want to remove, if we scan by
-        # folders, we want to remove folder matches for which the parent is also in a match (they're
-        # "duplicated duplicates if you will). Then, we also don't want mixed file kinds if the
+        # In removing what we call here "false matches", we don't want mixed file kinds if the
         # option isn't enabled, we want matches for which both files exist and, lastly, we don't
         # want matches with both files as ref.
-        if self.scan_type == ScanType.FOLDERS and matches:
-            allpath = {m.first.path for m in matches}
-            allpath |= {m.second.path for m in matches}
-            sortedpaths = sorted(allpath)
-            toremove = set()
-            last_parent_path = sortedpaths[0]
-            for p in sortedpaths[1:]:
-                if last_parent_path in p.parents:
-                    toremove.add(p)
-                else:
-                    last_parent_path = p
-            matches = [m for m in matches if m.first.path not in toremove or m.second.path not in toremove]
         if not self.mix_file_kind:
             matches = [m for m in matches if get_file_ext(m.first.name) == get_file_ext(m.second.name)]
         if self.include_exists_check:
             matches = [m for m in matches if m.first.exists() and m.second.exists()]
-        # Contents already handles ref checks, other scan types might not catch during scan
-        if self.scan_type != ScanType.CONTENTS:
-            matches = [m for m in matches if not (m.first.is_ref and m.second.is_ref)]
+        matches = [m for m in matches if not (m.first.is_ref and m.second.is_ref)]
         if ignore_list:
             matches = [m for m in matches if not ignore_list.are_ignored(str(m.first.path), str(m.second.path))]
         logging.info("Grouping matches")
@@ -187,21 +272,11 @@ class Scanner:
             matched_files = dedupe([m.first for m in matches] + [m.second for m in matches])
             self.discarded_file_count = len(matched_files) - sum(len(g) for g in groups)
         else:
-            # Ticket #195
-            # To speed up the scan, we don't bother comparing contents of files that are both ref
-            # files. However, this messes up "discarded" counting because there's a missing match
-            # in cases where we end up with a dupe group anyway (with a non-ref file). Because it's
-            # impossible to have discarded matches in exact dupe scans, we simply set it at 0, thus
-            # bypassing our tricky problem.
-            # Also, although ScanType.FuzzyBlock is not always doing exact comparisons, we also
-            # bypass ref comparison, thus messing up with our "discarded" count. So we're
-            # effectively disabling the "discarded" feature in PE, but it's better than falsely
-            # reporting discarded matches.
+            # Although ScanType.FuzzyBlock is not always doing exact comparisons, we also bypass ref
+            # comparison, thus messing up with our "discarded" count (see ticket #195 in
+            # get_dupe_groups()). So we're effectively disabling the "discarded" feature in PE, but
+            # it's better than falsely reporting discarded matches.
             self.discarded_file_count = 0
-        groups = [g for g in groups if any(not f.is_ref for f in g)]
-        logging.info("Created %d groups" % len(groups))
-        for g in groups:
-            g.prioritize(self._key_func, self._tie_breaker)
         return groups
 
     match_similar_words = False
@@ -212,5 +287,12 @@ class Scanner:
     size_threshold = 0
     large_size_threshold = 0
     big_file_size_threshold = 0
+    # Threads hashing files on each device, 0 for the default. See hashing.DigestPool.
+    hash_workers = 0
+    # {st_dev: hash_workers} for devices needing a different number of threads
+    device_hash_workers = {}
+    # If not 0, fuzzy scans only compare files found similar by MinHash LSH, see engine.getmatches().
+    lsh_bands = 0
+    lsh_rows = 4
     word_weighting = False
     include_exists_check = True
@@ -0,0 +1,226 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import logging
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import AnyStr, List, Union
+
+# A listing isn't saved if its folder was modified less than this many seconds before being listed:
+# the folder could change again without its mtime changing, and we would keep the outdated listing.
+RACY_DELAY = 2
+
+
+class SnapshotEntry:
+    """Stands for the :class:`os.DirEntry` of a listing read from a :class:`DirectorySnapshot`.
+
+    Whether the entry is a folder, a file or a symlink comes from the snapshot, but its stat is
+    read from the filesystem: a file can be modified without its folder's mtime changing.
+    """
+
+    IS_DIR = 1
+    IS_FILE = 2
+    IS_SYMLINK = 4
+
+    __slots__ = ("name", "path", "_flags", "_stat")
+
+    def __init__(self, folder, name, flags):
+        self.name = name
+        self.path = os.path.join(folder, name)
+        self._flags = flags
+        self._stat = None
+
+    def __repr__(self):
+        return f"<SnapshotEntry {self.name!r}>"
+
+    def __fspath__(self):
+        return self.path
+
+    @classmethod
+    def get_flags(cls, entry) -> int:
+        """Returns the flags describing ``entry``, an :class:`os.DirEntry`."""
+        flags = 0
+        try:
+            if entry.is_dir():
+                flags |= cls.IS_DIR
+            if entry.is_file():
+                flags |= cls.IS_FILE
+            if entry.is_symlink():
+                flags |= cls.IS_SYMLINK
+        except OSError:
+            pass
+        return flags
+
+    def is_dir(self, *, follow_symlinks=True) -> bool:
+        if not follow_symlinks and self.is_symlink():
+            return False
+        return bool(self._flags & self.IS_DIR)
+
+    def is_file(self, *, follow_symlinks=True) -> bool:
+        if not follow_symlinks and self.is_symlink():
+            return False
+        return bool(self._flags & self.IS_FILE)
+
+    def is_symlink(self) -> bool:
+        return bool(self._flags & self.IS_SYMLINK)
+
+    def stat(self, *, follow_symlinks=True) -> os.stat_result:
+        if not follow_symlinks and self.is_symlink():
+            return os.stat(self.path, follow_symlinks=False)
+        if self._stat is None:
+            self._stat = os.stat(self.path)
+        return self._stat
+
+    def inode(self) -> int:
+        return self.stat(follow_symlinks=False).st_ino
+
+
+class DirectorySnapshot:
+    """Keeps the listings of scanned folders so that they don't have to be listed again.
+
+    A folder's mtime changes whenever an entry is added to it, removed from it or renamed. As long
+    as its mtime is the same as when it was listed, so is its listing, which can then be read from
+    the snapshot (as :class:`SnapshotEntry`) instead of listing the folder again. Listings are
+    only saved when :meth:`flush` is called.
+
+    Reads can happen from multiple threads at once. When the database can't be read (it's locked or
+    corrupt), folders are listed again.
+    """
+
+    schema_version = 2
+    schema_version_description = "Added flags marker to encoded entries."
+    # {version: queries upgrading the schema from that version to the next one}. Listings of any other
+    # version are dropped.
+    upgrade_queries = {}
+    create_table_query = "CREATE TABLE IF NOT EXISTS listings (path TEXT PRIMARY KEY, mtime_ns INTEGER, entries BLOB)"
+    drop_table_query = "DROP TABLE IF EXISTS listings"
+    select_query = "SELECT entries FROM listings WHERE path=:path AND mtime_ns=:mtime_ns"
+    insert_query = "INSERT OR REPLACE INTO listings (path, mtime_ns, entries) VALUES (:path, :mtime_ns, :entries)"
+
+    def __init__(self):
+        self.conn = None
+        self.lock = None
+        # {path: (mtime_ns, encoded entries)}
+        self._pending = {}
+        self._pending_lock = Lock()
+        # Number of folders read from the snapshot and listed since the last reset_counts() call
+        self.reused_count = 0
+        self.listed_count = 0
+
+    # Set in the flags byte of encoded entries, so that it's never NUL (flags are 0 for a FIFO or
+    # a socket, for example).
+    FLAGS_MARKER = 0x80
+
+    @classmethod
+    def _encode(cls, entries) -> bytes:
+        # Each entry is its flags, as a byte, followed by its name and a NUL. Names can't contain NUL.
+        return b"".join(
+            bytes([SnapshotEntry.get_flags(entry) | cls.FLAGS_MARKER])
+            + entry.name.encode("utf-8", "surrogatepass")
+            + b"\0"
+            for entry in entries
+        )
+
+    @classmethod
+    def _decode(cls, path: str, data: bytes) -> List[SnapshotEntry]:
+        items = data.split(b"\0")[:-1]
+        return [
+            SnapshotEntry(path, item[1:].decode("utf-8", "surrogatepass"), item[0] & ~cls.FLAGS_MARKER)
+            for item in items
+        ]
+
+    def connect(self, path: Union[AnyStr, os.PathLike]) -> None:
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = Lock()
+        self._check_upgrade()
+
+    def _check_upgrade(self) -> None:
+        with self.lock, self.conn as conn:
+            has_schema = conn.execute(
+                "SELECT NAME FROM sqlite_master WHERE type='table' AND name='schema_version'"
+            ).fetchall()
+            version = None
+            if has_schema:
+                version = conn.execute("SELECT version FROM schema_version ORDER BY version DESC").fetchone()[0]
+            else:
+                conn.execute("CREATE TABLE schema_version (version int PRIMARY KEY, description TEXT)")
+            while version != self.schema_version and version in self.upgrade_queries:
+                for query in self.upgrade_queries[version]:
+                    conn.execute(query)
+                version += 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_version VALUES (:version, :description)",
+                    {"version": version, "description": self.schema_version_description},
+                )
+            if version != self.schema_version:
+                conn.execute(self.drop_table_query)
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_version VALUES (:version, :description)",
+                    {"version": self.schema_version, "description": self.schema_version_description},
+                )
+            conn.execute(self.create_table_query)
+
+    def clear(self) -> None:
+        with self._pending_lock:
+            self._pending = {}
+        with self.lock, self.conn as conn:
+            conn.execute(self.drop_table_query)
+            conn.execute(self.create_table_query)
+
+    def close(self) -> None:
+        self.flush()
+        with self.lock:
+            self.conn.close()
+
+    def flush(self) -> None:
+        """Writes listings made since the last flush to the database."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            with self.lock, self.conn as conn:
+                conn.executemany(
+                    self.insert_query,
+                    (
+                        {"path": path, "mtime_ns": mtime_ns, "entries": entries}
+                        for path, (mtime_ns, entries) in pending.items()
+                    ),
+                )
+        except sqlite3.Error as ex:
+            logging.warning(f"Couldn't put {len(pending)} listings: {ex}")
+
+    def reset_counts(self) -> None:
+        with self._pending_lock:
+            self.reused_count = self.listed_count = 0
+
+    def scandir(self, path: Union[str, os.PathLike]) -> list:
+        """Returns the entries of folder ``path``, from the snapshot if it's still valid.
+
+        Raises :class:`OSError` if ``path`` can't be listed.
+        """
+        path = os.fspath(path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        try:
+            with self.lock:
+                row = self.conn.execute(self.select_query, {"path": path, "mtime_ns": mtime_ns}).fetchone()
+        except sqlite3.Error as ex:
+            logging.warning(f"Couldn't get the listing of {path}: {ex}")
+            row = None
+        if row is not None:
+            with self._pending_lock:
+                self.reused_count += 1
+            return self._decode(path, row[0])
+        # The mtime was read before listing: if the folder changes in between, the listing is
+        # saved with an outdated mtime and will be made again next time.
+        with os.scandir(path) as iter:
+            entries = list(iter)
+        data = self._encode(entries)
+        with self._pending_lock:
+            self.listed_count += 1
+            if time.time_ns() - mtime_ns > RACY_DELAY * 1_000_000_000:
+                self._pending[path] = (mtime_ns, data)
+        return entries
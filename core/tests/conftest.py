@@ -1 +1,16 @@
+from pathlib import Path
+
+import pytest
 from hscommon.testutil import app  # noqa
+
+from core import fs
+
+
+@pytest.fixture
+def filesdb(tmpdir, monkeypatch):
+    # A hash cache of its own for the test, which becomes the fs.filesdb singleton.
+    db = fs.FilesDB()
+    db.connect(str(Path(str(tmpdir), "hash_cache.db")))
+    monkeypatch.setattr(fs, "filesdb", db)
+    yield db
+    db.close()
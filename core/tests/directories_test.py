@@ -11,9 +11,11 @@ import shutil
 
 from pytest import raises
 from pathlib import Path
+from hscommon.jobprogress import job
 from hscommon.testutil import eq_
 from hscommon.plat import ISWINDOWS
 
+from core import directories
 from core.fs import File
 from core.directories import (
     Directories,
@@ -178,6 +180,75 @@ def test_get_files():
             assert not f.is_ref
 
 
+def test_get_files_yields_in_walk_order(tmpdir):
+    # Folders are listed in walker threads, but the order in which files are yielded is the same as
+    # a sequential walk.
+    root = Path(str(tmpdir))
+    for i in range(5):
+        for j in range(5):
+            root.joinpath(f"dir{i}", f"sub{j}").mkdir(parents=True)
+            root.joinpath(f"dir{i}", f"sub{j}", "file").touch()
+        root.joinpath(f"file{i}").touch()
+    expected = [os.path.join(p, name) for p, _, filenames in os.walk(str(root)) for name in filenames]
+    d = Directories()
+    d.add_path(root)
+    eq_(sorted(str(f.path) for f in d.get_files()), sorted(expected))
+    d.walker_threads = 1
+    sequential = [f.path for f in d.get_files()]
+    d.walker_threads = 8
+    eq_([f.path for f in d.get_files()], sequential)
+
+
+def test_get_files_when_is_dir_fails_once(tmpdir, monkeypatch):
+    # A subfolder that couldn't be told apart from a file when subfolders were submitted to walker
+    # threads is still walked.
+    root = Path(str(tmpdir))
+    root.joinpath("sub").mkdir()
+    root.joinpath("sub", "subfile").touch()
+    root.joinpath("file").touch()
+
+    class FlakyEntry:
+        def __init__(self, entry):
+            self.entry = entry
+            self.failed = False
+
+        def __getattr__(self, name):
+            return getattr(self.entry, name)
+
+        def is_dir(self):
+            if not self.failed:
+                self.failed = True
+                raise OSError()
+            return self.entry.is_dir()
+
+    scandir = directories._scandir
+
+    def flaky_scandir(path, snapshot=None):
+        entries = scandir(path, snapshot)
+        if str(path) != str(root):
+            return entries
+        return [FlakyEntry(entry) if entry.is_dir() else entry for entry in entries]
+
+    monkeypatch.setattr(directories, "_scandir", flaky_scandir)
+    d = Directories()
+    d.add_path(root)
+    eq_(sorted(f.name for f in d.get_files()), ["file", "subfile"])
+
+
+def test_get_files_cancellation(tmpdir):
+    root = Path(str(tmpdir))
+    for i in range(10):
+        root.joinpath(f"dir{i}").mkdir()
+        root.joinpath(f"dir{i}", "file").touch()
+    d = Directories()
+    d.add_path(root)
+    calls = []
+    j = job.Job(1, lambda progress, desc="": len(calls) < 5 and not calls.append(progress))
+    j.start_job(1)
+    with raises(job.JobCancelled):
+        list(d.get_files(j=j))
+
+
 def test_get_files_with_folders():
     # When fileclasses handle folders, return them and stop recursing!
     class FakeFile(File):
@@ -209,6 +280,20 @@ def test_get_folders():
     eq_(ref[0].size, 1)
 
 
+def test_get_folders_lists_each_folder_once(monkeypatch):
+    d = Directories()
+    p = testpath.joinpath("fs")
+    d.add_path(p)
+    listed = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: listed.append(str(path)) or scandir(path))
+    folders = list(d.get_folders())
+    for folder in folders:
+        folder.digest
+    eq_(sorted(listed), sorted(str(f.path) for f in folders))
+    eq_({f.name: f.size for f in folders}, {"fs": 12, "dir1": 1, "dir2": 2, "dir3": 3})
+
+
 def test_get_files_with_inherited_exclusion():
     d = Directories()
     p = testpath.joinpath("onefile")
@@ -4,7 +4,10 @@
 # which should be included with this package. The terms are also available at
 # http://www.gnu.org/licenses/gpl-3.0.html
 
+import difflib
+import random
 import sys
+from array import array
 
 from hscommon.jobprogress import job
 from hscommon.util import first
@@ -28,8 +31,15 @@ from core.engine import (
     getmatches,
     Match,
     getmatches_by_contents,
+    getgroups_by_contents,
+    ExactGroup,
     merge_similar_words,
     reduce_common_words,
+    Vocabulary,
+    WordMultiset,
+    SimilarWords,
+    similarity_join,
+    minhash_candidates,
 )
 
 no = NamedObject
@@ -165,7 +175,7 @@ class TestCaseWordCompare:
         eq_(67, compare([["a", "b"], ["c", "d", "e"]], [["a", "b"], ["c", "d", "f"]]))
 
     def test_propagate_flags_with_fields(self, monkeypatch):
-        def mock_compare(first, second, flags):
+        def mock_compare(first, second, flags, vocabulary):
             eq_((0, 1, 2, 3, 5), flags)
 
         monkeypatch.setattr(engine, "compare_fields", mock_compare)
@@ -217,42 +227,182 @@ class TestCaseWordCompareWithFields:
         eq_([["c", "d", "f"], ["a", "b"]], second)
 
 
+def encode_words(objects, vocabulary=None):
+    if vocabulary is None:
+        vocabulary = Vocabulary()
+    return [vocabulary.encode(o.words) for o in objects]
+
+
+class TestCaseVocabulary:
+    def test_encode(self):
+        v = Vocabulary()
+        eq_(v.encode(["foo", "bar", "foo"]), array("I", [0, 1, 0]))
+        eq_(v.encode(["bar", "baz"]), array("I", [1, 2]))
+        eq_(v.words, ["foo", "bar", "baz"])
+        eq_(list(v.lengths), [3, 3, 3])
+        eq_(len(v), 3)
+
+    def test_encode_fields(self):
+        v = Vocabulary()
+        encoded = v.encode([["foo", "bar"], ["baz"]])
+        eq_(encoded, [array("I", [0, 1]), array("I", [2])])
+        eq_(v.decode(encoded), [["foo", "bar"], ["baz"]])
+
+    def test_compare_ids(self):
+        # Comparing word ids gives the same result as comparing words.
+        v = Vocabulary()
+        first, second = ["foo", "bar", "bleh"], ["bar", "foobar", "blehh"]
+        for flags in [(), (WEIGHT_WORDS,), (MATCH_SIMILAR_WORDS,), (WEIGHT_WORDS, MATCH_SIMILAR_WORDS)]:
+            eq_(compare(v.encode(first), v.encode(second), flags, v), compare(first, second, flags))
+        first, second = [["a", "b"], ["c", "d", "e"]], [["c", "d", "f"], ["a", "b"]]
+        for flags in [(), (NO_FIELD_ORDER,)]:
+            eq_(compare(v.encode(first), v.encode(second), flags, v), compare(first, second, flags))
+
+
+class TestCaseWordMultiset:
+    def test_same_results_as_compare(self):
+        v = Vocabulary()
+        word_lists = [
+            ["foo", "bar"],
+            ["bar", "foo"],
+            ["foo", "bar", "foo"],
+            ["foo", "foo", "bar"],
+            ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m"],
+            ["bleh", "longerword", "bar"],
+            ["foo"],
+            [],
+        ]
+        for flags in [(), (WEIGHT_WORDS,)]:
+            lengths = v.lengths if flags else None
+            for words1 in word_lists:
+                for words2 in word_lists:
+                    expected = compare(words1, words2, flags)
+                    m1 = WordMultiset(v.encode(words1), lengths)
+                    m2 = WordMultiset(v.encode(words2), lengths)
+                    eq_(m1.compare(m2, lengths), expected, (words1, words2, flags))
+
+    def test_order_matters_for_exact_matches(self):
+        v = Vocabulary()
+        eq_(WordMultiset(v.encode(["foo", "bar"])).compare(WordMultiset(v.encode(["foo", "bar"]))), 100)
+        eq_(WordMultiset(v.encode(["foo", "bar"])).compare(WordMultiset(v.encode(["bar", "foo"]))), 99)
+
+
+class TestCaseSimilarWords:
+    def get_vocabulary(self):
+        # Words from a small alphabet, so that many of them are similar.
+        r = random.Random(42)
+        v = Vocabulary()
+        for _ in range(400):
+            v.get_id("".join(r.choice("abcd") for _ in range(r.randint(1, 12))))
+        return v
+
+    def test_same_as_difflib(self):
+        v = self.get_vocabulary()
+        similar_words = SimilarWords(v)
+        for id, word in enumerate(v.words):
+            others = v.words[:id] + v.words[id + 1 :]
+            expected = difflib.get_close_matches(word, others, len(others), 0.8)
+            eq_([v.words[i] for i in similar_words.get_similar(id)], expected, word)
+
+    def test_get_close_match(self):
+        v = Vocabulary()
+        v.encode(["foobar", "foobar1", "foobar12", "bleh"])
+        similar_words = SimilarWords(v)
+        eq_(similar_words.get_close_match(0, array("I", [2, 1, 3])), 1)
+        eq_(similar_words.get_close_match(0, array("I", [3])), None)
+
+    def test_compare_with_similar_words(self):
+        v = self.get_vocabulary()
+        word_lists = [v.words[i : i + 3] for i in range(0, 60, 3)]
+        expected = [compare(w1, w2, (MATCH_SIMILAR_WORDS,)) for w1 in word_lists for w2 in word_lists]
+        v.similar_words = SimilarWords(v)
+        encoded = [v.encode(words) for words in word_lists]
+        eq_([compare(w1, w2, (MATCH_SIMILAR_WORDS,), v) for w1 in encoded for w2 in encoded], expected)
+
+
+class TestCaseSimilarityJoin:
+    def test_same_as_comparing_all_pairs(self):
+        r = random.Random(42)
+        v = Vocabulary()
+        words = ["".join(r.choice("abcdef") for _ in range(r.randint(1, 6))) for _ in range(30)]
+        word_lists = [v.encode([r.choice(words) for _ in range(r.randint(0, 6))]) for _ in range(100)]
+        for lengths in [None, v.lengths]:
+            multisets = [WordMultiset(words, lengths) for words in word_lists]
+            for min_match_percentage in [0, 33, 50, 80, 100]:
+                expected = []
+                for i, m1 in enumerate(multisets):
+                    for k, m2 in enumerate(multisets[i + 1 :], start=i + 1):
+                        percentage = m1.compare(m2, lengths)
+                        if m1.items & m2.items and percentage >= min_match_percentage:
+                            expected.append((i, k, percentage))
+                result = similarity_join(multisets, min_match_percentage, lengths)
+                eq_(sorted((min(i, k), max(i, k), p) for i, k, p in result), expected)
+
+    def test_pairs_below_threshold_arent_compared(self, monkeypatch):
+        v = Vocabulary()
+        multisets = [WordMultiset(v.encode(getwords(name))) for name in ["a b c d", "a e f g", "a b c e"]]
+        compare_calls = []
+        original_compare = WordMultiset.compare
+
+        def mocked_compare(self, other, lengths):
+            compare_calls.append(other)
+            return original_compare(self, other, lengths)
+
+        monkeypatch.setattr(WordMultiset, "compare", mocked_compare)
+        eq_([p for _, _, p in similarity_join(multisets, 75)], [75])
+        eq_(len(compare_calls), 1)
+
+
+class TestCaseMinhashCandidates:
+    def test_identical_and_disjoint_sets(self):
+        word_sets = [array("I", [0, 1, 2]), array("I", [3, 4]), array("I", [2, 1, 0]), array("I"), array("I", [5])]
+        eq_(sorted(minhash_candidates(word_sets, 4, 3)), [(0, 2)])
+
+    def test_each_pair_once(self):
+        r = random.Random(42)
+        word_sets = [array("I", r.sample(range(12), 3)) for _ in range(100)]
+        candidates = [tuple(sorted(pair)) for pair in minhash_candidates(word_sets, 20, 1)]
+        eq_(len(candidates), len(set(candidates)))
+        assert all(set(word_sets[first]) & set(word_sets[second]) for first, second in candidates)
+
+    def test_more_bands_find_more_candidates(self):
+        r = random.Random(42)
+        word_sets = [array("I", r.sample(range(20), 5)) for _ in range(100)]
+        counts = [len(list(minhash_candidates(word_sets, bands, 3))) for bands in [1, 4, 16]]
+        eq_(counts, sorted(counts))
+        assert counts[0] < counts[2]
+
+
 class TestCaseBuildWordDict:
     def test_with_standard_words(self):
         item_list = [NamedObject("foo bar", True)]
         item_list.append(NamedObject("bar baz", True))
         item_list.append(NamedObject("baz bleh foo", True))
-        d = build_word_dict(item_list)
+        v = Vocabulary()
+        d = build_word_dict(encode_words(item_list, v))
         eq_(4, len(d))
-        eq_(2, len(d["foo"]))
-        assert item_list[0] in d["foo"]
-        assert item_list[2] in d["foo"]
-        eq_(2, len(d["bar"]))
-        assert item_list[0] in d["bar"]
-        assert item_list[1] in d["bar"]
-        eq_(2, len(d["baz"]))
-        assert item_list[1] in d["baz"]
-        assert item_list[2] in d["baz"]
-        eq_(1, len(d["bleh"]))
-        assert item_list[2] in d["bleh"]
+        eq_(list(d[v.get_id("foo")]), [0, 2])
+        eq_(list(d[v.get_id("bar")]), [0, 1])
+        eq_(list(d[v.get_id("baz")]), [1, 2])
+        eq_(list(d[v.get_id("bleh")]), [2])
 
     def test_unpack_fields(self):
         o = NamedObject("")
         o.words = [["foo", "bar"], ["baz"]]
-        d = build_word_dict([o])
+        d = build_word_dict(encode_words([o]))
         eq_(3, len(d))
-        eq_(1, len(d["foo"]))
+        eq_(1, len(d[0]))
 
     def test_words_are_unaltered(self):
         o = NamedObject("")
         o.words = [["foo", "bar"], ["baz"]]
-        build_word_dict([o])
+        build_word_dict(encode_words([o]))
         eq_([["foo", "bar"], ["baz"]], o.words)
 
     def test_object_instances_can_only_be_once_in_words_object_list(self):
         o = NamedObject("foo foo", True)
-        d = build_word_dict([o])
-        eq_(1, len(d["foo"]))
+        d = build_word_dict(encode_words([o]))
+        eq_(1, len(d[0]))
 
     def test_job(self):
         def do_progress(p, d=""):
@@ -262,7 +412,7 @@ class TestCaseBuildWordDict:
         j = job.Job(1, do_progress)
         self.log = []
         s = "foo bar"
-        build_word_dict([NamedObject(s, True), NamedObject(s, True), NamedObject(s, True)], j)
+        build_word_dict(encode_words([NamedObject(s, True), NamedObject(s, True), NamedObject(s, True)]), j)
         # We don't have intermediate log because iter_with_progress is called with every > 1
         eq_(0, self.log[0])
         eq_(100, self.log[1])
@@ -270,54 +420,55 @@ class TestCaseBuildWordDict:
 
 class TestCaseMergeSimilarWords:
     def test_some_similar_words(self):
+        v = Vocabulary()
         d = {
-            "foobar": {1},
-            "foobar1": {2},
-            "foobar2": {3},
+            v.get_id("foobar"): array("I", [1]),
+            v.get_id("foobar1"): array("I", [2]),
+            v.get_id("foobar2"): array("I", [3]),
         }
-        merge_similar_words(d)
+        merge_similar_words(d, v)
         eq_(1, len(d))
-        eq_(3, len(d["foobar"]))
+        eq_(list(d[v.get_id("foobar")]), [1, 2, 3])
 
 
 class TestCaseReduceCommonWords:
+    def get_word_dict(self, objects):
+        # Returns a word dict built from ``objects`` and its word lists, keyed by words rather than ids.
+        v = Vocabulary()
+        word_lists = encode_words(objects, v)
+        d = build_word_dict(word_lists)
+        return d, word_lists, v
+
     def test_typical(self):
-        d = {
-            "foo": {NamedObject("foo bar", True) for _ in range(50)},
-            "bar": {NamedObject("foo bar", True) for _ in range(49)},
-        }
-        reduce_common_words(d, 50)
-        assert "foo" not in d
-        eq_(49, len(d["bar"]))
+        d, word_lists, v = self.get_word_dict(
+            [NamedObject("foo bar", True) for _ in range(49)] + [NamedObject("foo baz", True)]
+        )
+        reduce_common_words(d, word_lists, 50)
+        assert v.get_id("foo") not in d
+        eq_(49, len(d[v.get_id("bar")]))
 
     def test_dont_remove_objects_with_only_common_words(self):
-        d = {
-            "common": set([NamedObject("common uncommon", True) for _ in range(50)] + [NamedObject("common", True)]),
-            "uncommon": {NamedObject("common uncommon", True)},
-        }
-        reduce_common_words(d, 50)
-        eq_(1, len(d["common"]))
-        eq_(1, len(d["uncommon"]))
+        d, word_lists, v = self.get_word_dict(
+            [NamedObject("common uncommon", True)] + [NamedObject("common", True) for _ in range(50)]
+        )
+        reduce_common_words(d, word_lists, 50)
+        eq_(50, len(d[v.get_id("common")]))
+        eq_(1, len(d[v.get_id("uncommon")]))
 
-    def test_values_still_are_set_instances(self):
-        d = {
-            "common": set([NamedObject("common uncommon", True) for _ in range(50)] + [NamedObject("common", True)]),
-            "uncommon": {NamedObject("common uncommon", True)},
-        }
-        reduce_common_words(d, 50)
-        assert isinstance(d["common"], set)
-        assert isinstance(d["uncommon"], set)
+    def test_values_still_are_arrays(self):
+        d, word_lists, v = self.get_word_dict(
+            [NamedObject("common uncommon", True)] + [NamedObject("common", True) for _ in range(50)]
+        )
+        reduce_common_words(d, word_lists, 50)
+        assert isinstance(d[v.get_id("common")], array)
+        assert isinstance(d[v.get_id("uncommon")], array)
 
     def test_dont_raise_keyerror_when_a_word_has_been_removed(self):
         # If a word has been removed by the reduce, an object in a subsequent common word that
         # contains the word that has been removed would cause a KeyError.
-        d = {
-            "foo": {NamedObject("foo bar baz", True) for _ in range(50)},
-            "bar": {NamedObject("foo bar baz", True) for _ in range(50)},
-            "baz": {NamedObject("foo bar baz", True) for _ in range(49)},
-        }
+        d, word_lists, v = self.get_word_dict([NamedObject("foo bar baz", True) for _ in range(50)])
         try:
-            reduce_common_words(d, 50)
+            reduce_common_words(d, word_lists, 50)
         except KeyError:
             self.fail()
 
@@ -328,9 +479,9 @@ class TestCaseReduceCommonWords:
             o.words = [["foo", "bar"], ["baz"]]
             return o
 
-        d = {"foo": {create_it() for _ in range(50)}}
+        d, word_lists, v = self.get_word_dict([create_it() for _ in range(50)])
         try:
-            reduce_common_words(d, 50)
+            reduce_common_words(d, word_lists, 50)
         except TypeError:
             self.fail("must support fields.")
 
@@ -339,16 +490,12 @@ class TestCaseReduceCommonWords:
         # be counted as a common word for subsequent words. For example, if 'foo' is processed
         # as a common word, keeping a "foo bar" file in it, and the 'bar' is processed, "foo bar"
         # would not stay in 'bar' because 'foo' is not a common word anymore.
-        only_common = NamedObject("foo bar", True)
-        d = {
-            "foo": set([NamedObject("foo bar baz", True) for _ in range(49)] + [only_common]),
-            "bar": set([NamedObject("foo bar baz", True) for _ in range(49)] + [only_common]),
-            "baz": {NamedObject("foo bar baz", True) for _ in range(49)},
-        }
-        reduce_common_words(d, 50)
-        eq_(1, len(d["foo"]))
-        eq_(1, len(d["bar"]))
-        eq_(49, len(d["baz"]))
+        objects = [NamedObject("foo bar baz", True) for _ in range(49)] + [NamedObject("foo bar", True)]
+        d, word_lists, v = self.get_word_dict(objects)
+        reduce_common_words(d, word_lists, 50)
+        eq_(1, len(d[v.get_id("foo")]))
+        eq_(1, len(d[v.get_id("bar")]))
+        eq_(49, len(d[v.get_id("baz")]))
 
 
 class TestCaseGetMatch:
@@ -429,6 +576,31 @@ class TestCaseGetMatches:
         r = getmatches(item_list)
         eq_(1225, len(r))
 
+    def test_match_files_sharing_only_common_words(self):
+        # Files sharing a common word are matched, even if they also have uncommon words.
+        item_list = [NamedObject("foo bar%d" % i) for i in range(50)] + [NamedObject("foo")]
+        r = getmatches(item_list, min_match_percentage=50)
+        eq_(len(r), 1275)
+
+    def test_lsh(self):
+        r = random.Random(42)
+        words = ["foo", "bar", "baz", "bleh", "meh", "qux", "quux", "spam", "eggs", "ham"]
+        item_list = [NamedObject(" ".join(r.sample(words, 4))) for _ in range(60)]
+        exact = {(id(m.first), id(m.second), m.percentage) for m in getmatches(item_list, 50)}
+        exact |= {(second, first, p) for first, second, p in exact}
+        r = getmatches(item_list, 50, lsh_bands=4, lsh_rows=2)
+        assert r
+        assert all((id(m.first), id(m.second), m.percentage) in exact for m in r)
+        eq_(len(getmatches(item_list, 50, lsh_bands=64, lsh_rows=1)), len(exact) // 2)
+
+    def test_lsh_with_fields(self):
+        o1 = NamedObject("foo bar - foo bleh")
+        o2 = NamedObject("foo bar - bleh bar")
+        o1.words = getfields(o1.name)
+        o2.words = getfields(o2.name)
+        m = getmatches([o1, o2], lsh_bands=32, lsh_rows=1)[0]
+        eq_(50, m.percentage)
+
     def test_use_words_already_there_if_there(self):
         o1 = NamedObject("foo")
         o2 = NamedObject("bar")
@@ -515,13 +687,13 @@ class TestCaseGetMatches:
 
     def test_memory_error(self, monkeypatch):
         @log_calls
-        def mocked_match(first, second, flags):
-            if len(mocked_match.calls) > 42:
+        def mocked_compare(self, other, lengths):
+            if len(mocked_compare.calls) > 42:
                 raise MemoryError()
-            return Match(first, second, 0)
+            return 0
 
         objects = [NamedObject() for _ in range(10)]  # results in 45 matches
-        monkeypatch.setattr(engine, "get_match", mocked_match)
+        monkeypatch.setattr(engine.WordMultiset, "compare", mocked_compare)
         try:
             r = getmatches(objects)
         except MemoryError:
@@ -556,6 +728,75 @@ class TestCaseGetMatchesByContents:
         r = getmatches_by_contents(f, bigsize=0)
         eq_(len(r), 1)
 
+    def test_dont_hash_further_files_alone_after_partial_digest(self):
+        class NoFullDigest(NamedObject):
+            @property
+            def digest(self):
+                raise AssertionError()
+
+            @digest.setter
+            def digest(self, value):
+                pass
+
+        f = [NoFullDigest("foo"), NoFullDigest("bar"), no("baz"), no("baz")]
+        f[1].digest_partial = "different"
+        # foo and bar have different partial digests, we never ask for their full digest
+        [m] = getmatches_by_contents(f)
+        assert_match(m, "baz", "baz")
+
+    def test_bucket_of_identical_files(self):
+        f = [no("foo") for _ in range(10)] + [no("bar") for _ in range(5)]
+        f[0].is_ref = f[1].is_ref = True
+        r = getmatches_by_contents(f)
+        # all pairs except the ref-ref one
+        eq_(len(r), 45 - 1 + 10)
+
+    def test_zero_sized_files_match_without_hashing(self):
+        class NoDigest(NamedObject):
+            @property
+            def digest_partial(self):
+                raise AssertionError()
+
+            @digest_partial.setter
+            def digest_partial(self, value):
+                pass
+
+        f = [NoDigest("foo", size=0), NoDigest("bar", size=0)]
+        eq_(len(getmatches_by_contents(f)), 1)
+
+    def test_getgroups_by_contents(self):
+        f = [no("foo") for _ in range(10)] + [no("bar") for _ in range(5)] + [no("baz")]
+        f[0].is_ref = f[1].is_ref = True
+        groups = getgroups_by_contents(f)
+        eq_(sorted(len(g) for g in groups), [5, 10])
+        for g in groups:
+            assert isinstance(g, ExactGroup)
+            eq_(len({o.name for o in g}), 1)
+
+
+class TestCaseExactGroup:
+    def test_matches_are_synthesized(self):
+        f = [no("foo") for _ in range(3)]
+        g = ExactGroup(f)
+        eq_(g.ordered, f)
+        eq_(g.percentage, 100)
+        eq_(g.get_match_of(f[0]), None)
+        eq_(g.get_match_of(f[2]), Match(f[0], f[2], 100))
+        eq_(g.get_match_of(no("bar")), None)
+        eq_(g.matches, set())
+        eq_(g.discard_matches(), set())
+
+    def test_switch_ref_and_remove_dupe(self):
+        f = [no("foo") for _ in range(3)]
+        g = ExactGroup(f)
+        g.switch_ref(f[2])
+        eq_(g.get_match_of(f[0]), Match(f[2], f[0], 100))
+        g.remove_dupe(f[0])
+        eq_(g.ordered, [f[2], f[1]])
+        g.remove_dupe(f[1])
+        eq_(len(g), 0)
+        eq_(g.percentage, 0)
+
 
 class TestCaseGroup:
     def test_empty(self):
@@ -0,0 +1,150 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import os
+from pathlib import Path
+
+import pytest
+from hscommon.testutil import eq_
+
+from core import fs, hashing
+from core.directories import Directories, DirectoryState
+from core.filetable import FileTable, PathStore
+from core.scanner import Scanner, ScanType
+
+
+def create_table(rootpath, contents, fileclasses=[fs.File], **kwargs):
+    table = FileTable(fileclasses, **kwargs)
+    for i, data in enumerate(contents):
+        Path(str(rootpath), f"file{i}").write_bytes(data)
+    with os.scandir(str(rootpath)) as iter:
+        for entry in sorted(iter, key=lambda entry: entry.name):
+            table.append(entry, fs.File)
+    return table
+
+
+def test_path_store():
+    store = PathStore()
+    foo = store.add(Path("/foo/bar/foo"))
+    bar = store.add("/foo/bar/bar")
+    baz = store.add("/foo/baz")
+    eq_(len(store), 2)
+    eq_(foo[0], bar[0])
+    eq_(store.get_path(*foo), Path("/foo/bar/foo"))
+    eq_(store.get_str(*bar), os.path.join("/foo/bar", "bar"))
+    eq_(store.get_path(*baz), Path("/foo/baz"))
+
+
+def test_table_paths(tmpdir):
+    table = create_table(tmpdir, [b"foo", b"bar"])
+    eq_(len(table.store), 1)
+    eq_(table.get_str(1), str(Path(str(tmpdir), "file1")))
+    eq_(table.get_path(0), Path(str(tmpdir), "file0"))
+    eq_(table.take([1]).get_path(0), Path(str(tmpdir), "file1"))
+
+
+def test_get_file(tmpdir):
+    table = create_table(tmpdir, [b"foobar"])
+    table.is_ref[0] = True
+    f = table.get_file(0)
+    stats = Path(str(tmpdir), "file0").stat()
+    eq_(f.path, Path(str(tmpdir), "file0"))
+    eq_((f.size, f.mtime, f.dev, f.inode), (6, stats.st_mtime, stats.st_dev, stats.st_ino))
+    assert f.is_ref
+    # Nothing else was read
+    assert object.__getattribute__(f, "digest") is fs.NOT_SET
+
+
+def test_get_candidates(tmpdir):
+    table = create_table(tmpdir, [b"foo", b"bar", b"baz", b"foobar", b"barbaz", b"foobarbaz"])
+    eq_(sorted(f.name for f in table.get_candidates()), ["file0", "file1", "file2", "file3", "file4"])
+    eq_(sorted(f.name for f in table.get_candidates(min_size=4)), ["file3", "file4"])
+    eq_(sorted(f.name for f in table.get_candidates(max_size=4)), ["file0", "file1", "file2"])
+    # Files only sharing their size with ref files can't be dupes.
+    table.is_ref[3] = table.is_ref[4] = True
+    eq_(sorted(f.name for f in table.get_candidates()), ["file0", "file1", "file2"])
+
+
+@pytest.mark.skipif("not hasattr(os, 'link')")
+def test_remove_hardlink_dupes(tmpdir):
+    Path(str(tmpdir), "file0").write_bytes(b"foo")
+    os.link(str(Path(str(tmpdir), "file0")), str(Path(str(tmpdir), "link")))
+    table = create_table(tmpdir, [b"foo", b"bar"])
+    eq_(len(table), 3)
+    result = table.remove_hardlink_dupes()
+    eq_(sorted(result.names), ["file0", "file1"])
+
+
+def test_get_file_table(tmpdir):
+    Path(str(tmpdir), "foo").write_bytes(b"foo")
+    Path(str(tmpdir), "sub").mkdir()
+    Path(str(tmpdir), "sub", "bar").write_bytes(b"bar")
+    d = Directories()
+    d.add_path(Path(str(tmpdir)))
+    d.set_state(Path(str(tmpdir), "sub"), DirectoryState.REFERENCE)
+    table = d.get_file_table()
+    files = {f.name: f for f in table.get_files()}
+    eq_(set(files), {"foo", "bar"})
+    assert files["bar"].is_ref
+    assert not files["foo"].is_ref
+
+
+def test_contents_scan_from_table(tmpdir):
+    table = create_table(tmpdir, [b"foo", b"foo", b"bar", b"foobar"])
+    s = Scanner()
+    s.scan_type = ScanType.CONTENTS
+    [group] = s.get_dupe_groups(table)
+    eq_(sorted(f.name for f in group), ["file0", "file1"])
+
+
+class FakePool:
+    def __init__(self):
+        self.warmed = []
+
+    def warm(self, files, field):
+        self.warmed += [f.name for f in files]
+
+
+def test_hash_buckets_while_filling(tmpdir):
+    contents = [b"foo", b"foobar", b"bar", b"barbaz", b"baz", b"foobarbaz", b"", b""]
+    pool = FakePool()
+    table = create_table(tmpdir, contents, pool=pool)
+    # Files are hashed as soon as another file has their size, empty files aren't hashed.
+    eq_(pool.warmed, ["file0", "file2", "file1", "file3", "file4"])
+    pool = FakePool()
+    create_table(tmpdir, contents, pool=pool, min_size=4, max_size=6)
+    eq_(pool.warmed, ["file1", "file3"])
+    eq_(len(table), len(contents))
+
+
+def test_dont_hash_ref_buckets_while_filling(tmpdir):
+    for i, data in enumerate([b"foo", b"bar", b"baz"]):
+        Path(str(tmpdir), f"file{i}").write_bytes(data)
+    pool = FakePool()
+    table = FileTable([fs.File], pool=pool)
+    with os.scandir(str(tmpdir)) as iter:
+        entries = sorted(iter, key=lambda entry: entry.name)
+    table.append(entries[0], fs.File, is_ref=True)
+    table.append(entries[1], fs.File, is_ref=True)
+    eq_(pool.warmed, [])
+    table.append(entries[2], fs.File)
+    eq_(pool.warmed, ["file0", "file1", "file2"])
+
+
+def test_same_results_when_hashing_while_filling(tmpdir, filesdb):
+    root = Path(str(tmpdir), "root")
+    root.mkdir()
+    data = os.urandom(300 * 1024)
+    other = bytearray(data)
+    other[-1] ^= 0xFF
+    contents = [data, bytes(other), data, os.urandom(len(data)), b"foo", b"foo"]
+    s = Scanner()
+    s.scan_type = ScanType.CONTENTS
+    expected = [sorted(f.name for f in g) for g in s.get_dupe_groups(create_table(root, contents))]
+    filesdb.clear()
+    with hashing.DigestPool() as pool:
+        table = create_table(root, contents, pool=pool)
+    for name in ["file0", "file1", "file2", "file3"]:
+        assert filesdb.get(root.joinpath(name), "digest_partial") is not None
+    eq_([sorted(f.name for f in g) for g in s.get_dupe_groups(table)], expected)
@@ -6,24 +6,21 @@
 # which should be included with this package. The terms are also available at
 # http://www.gnu.org/licenses/gpl-3.0.html
 
+import hashlib
+import os
+import sqlite3
+import threading
 import typing
 from os import urandom
 
 from pathlib import Path
+import pytest
 from hscommon.testutil import eq_
 from core.tests.directories_test import create_fake_fs
 
 from core import fs
 
-hasher: typing.Callable
-try:
-    import xxhash
-
-    hasher = xxhash.xxh128
-except ImportError:
-    import hashlib
-
-    hasher = hashlib.md5
+hasher: typing.Callable = fs.HASHERS[fs.DEFAULT_HASHER]
 
 
 def create_fake_fs_with_random_data(rootpath):
@@ -111,3 +108,302 @@ def test_has_file_attrs(tmpdir):
     b = fs.Folder(Path(str(tmpdir)))
     assert b.mtime > 0
     eq_(b.extension, "")
+
+
+def test_dev_and_inode(tmpdir):
+    p = Path(str(tmpdir), "foo")
+    p.write_bytes(b"foo")
+    stat = p.stat()
+    [entry] = os.scandir(str(tmpdir))
+    for f in [fs.File(p), fs.File(entry)]:
+        eq_((f.dev, f.inode), (stat.st_dev, stat.st_ino))
+
+
+def test_chunk_size():
+    eq_(fs.chunk_size(0), 1)
+    eq_(fs.chunk_size(1000), 1000)
+    eq_(fs.chunk_size(fs.CHUNK_SIZE), fs.CHUNK_SIZE)
+    eq_(fs.chunk_size(512 * fs.CHUNK_SIZE), 2 * fs.CHUNK_SIZE)
+    eq_(fs.chunk_size(2**50), fs.MAX_CHUNK_SIZE)
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 1024 * 1024])
+def test_digests_dont_depend_on_chunk_size(tmpdir, monkeypatch, chunk_size):
+    monkeypatch.setattr(fs, "CHUNK_SIZE", chunk_size)
+    p = Path(str(tmpdir), "foo")
+    data = urandom(5 * 1024 * 1024 + 42)
+    p.write_bytes(data)
+    f = fs.File(p)
+    eq_(f.digest, hasher(data).digest())
+    eq_(f.digest_partial, hasher(data[0x4000:0x8000]).digest())
+    samples = [data[len(data) * 25 // 100 :][: 1024 * 1024], data[len(data) * 60 // 100 :][: 1024 * 1024]]
+    eq_(f.digest_samples, hasher(b"".join(samples) + data[-1024 * 1024 :]).digest())
+
+
+def test_timestamp_from_ns_matches_stat(tmpdir):
+    p = Path(str(tmpdir), "foo")
+    p.touch()
+    stat = p.stat()
+    eq_(fs.timestamp_from_ns(stat.st_mtime_ns), stat.st_mtime)
+
+
+def test_filesdb_get_many(tmpdir, filesdb):
+    root = Path(str(tmpdir))
+    files = []
+    for name in ["foo", "bar", "baz"]:
+        root.joinpath(name).write_bytes(name.encode())
+        files.append(fs.File(root.joinpath(name)))
+    filesdb.put(files[0].path, "digest", b"foo_digest")
+    filesdb.put(files[0].path, "digest_partial", b"foo_partial")
+    filesdb.put(files[1].path, "digest", b"bar_digest")
+    files[1].size = 42  # outdated entry
+    result = filesdb.get_many(files, fs.DIGEST_FIELDS)
+    eq_(result, {files[0]: {"digest": b"foo_digest", "digest_partial": b"foo_partial"}})
+
+
+def test_filesdb_put_is_visible_before_flush(tmpdir, filesdb):
+    p = Path(str(tmpdir), "foo")
+    p.write_bytes(b"foo")
+    filesdb.put(p, "digest", b"foo_digest")
+    eq_(filesdb.get(p, "digest"), b"foo_digest")
+    eq_(filesdb.conn.execute("SELECT count(*) FROM files").fetchone()[0], 0)
+    filesdb.flush()
+    eq_(filesdb.conn.execute("SELECT digest FROM files").fetchone()[0], b"foo_digest")
+
+
+def test_filesdb_flushes_when_batch_is_full(tmpdir, filesdb, monkeypatch):
+    monkeypatch.setattr(filesdb, "write_batch_size", 3)
+    for name in ["foo", "bar", "baz"]:
+        p = Path(str(tmpdir), name)
+        p.write_bytes(name.encode())
+        filesdb.put(p, "digest", name.encode())
+    eq_(filesdb.conn.execute("SELECT count(*) FROM files").fetchone()[0], 3)
+
+
+def test_filesdb_concurrent_puts_and_flushes(tmpdir, filesdb, monkeypatch):
+    monkeypatch.setattr(filesdb, "write_batch_size", 7)
+    p = Path(str(tmpdir), "foo")
+    p.touch()
+    stat = p.stat()
+    missing = []
+
+    def put(thread_index):
+        for i in range(300):
+            path = Path(str(tmpdir), f"file{thread_index}_{i}")
+            filesdb.put(path, "digest", path.name.encode(), stat=stat)
+            # Values are visible to get() from the moment they're put, even while they're being flushed.
+            if filesdb.get(path, "digest", stat=stat) != path.name.encode():
+                missing.append(path)
+
+    def flush():
+        while any(t.is_alive() for t in putters):
+            filesdb.flush()
+
+    putters = [threading.Thread(target=put, args=(i,)) for i in range(4)]
+    threads = putters + [threading.Thread(target=flush)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    filesdb.flush()
+    eq_(missing, [])
+    eq_(filesdb.conn.execute("SELECT count(*) FROM files").fetchone()[0], 4 * 300)
+
+
+def test_filesdb_put_during_flush(tmpdir, filesdb, monkeypatch):
+    p = Path(str(tmpdir), "foo")
+    p.touch()
+    stat = p.stat()
+    filesdb.put(Path("first"), "digest", b"first", stat=stat)
+    writing = threading.Event()
+    resume = threading.Event()
+    write = filesdb._write
+
+    def slow_write(*args):
+        writing.set()
+        resume.wait()
+        write(*args)
+
+    monkeypatch.setattr(filesdb, "_write", slow_write)
+    flushers = [threading.Thread(target=filesdb.flush)]
+    flushers[0].start()
+    writing.wait()
+    filesdb.put(Path("second"), "digest", b"second", stat=stat)
+    flushers.append(threading.Thread(target=filesdb.flush))
+    flushers[1].start()
+    # Both values are visible, whether they're being written or waiting to be
+    eq_(filesdb.get(Path("first"), "digest", stat=stat), b"first")
+    eq_(filesdb.get(Path("second"), "digest", stat=stat), b"second")
+    resume.set()
+    for t in flushers:
+        t.join()
+    eq_(
+        filesdb.conn.execute("SELECT path, digest FROM files ORDER BY path").fetchall(),
+        [("first", b"first"), ("second", b"second")],
+    )
+
+
+def test_filesdb_clear_during_flush(tmpdir, filesdb, monkeypatch):
+    p = Path(str(tmpdir), "foo")
+    p.touch()
+    filesdb.put(p, "digest", b"foo_digest")
+    writing = threading.Event()
+    resume = threading.Event()
+    write = filesdb._write
+
+    def slow_write(*args):
+        writing.set()
+        resume.wait()
+        write(*args)
+
+    monkeypatch.setattr(filesdb, "_write", slow_write)
+    flusher = threading.Thread(target=filesdb.flush)
+    flusher.start()
+    writing.wait()
+    filesdb.put(p, "digest_partial", b"foo_partial")
+    clearer = threading.Thread(target=filesdb.clear)
+    clearer.start()
+    resume.set()
+    flusher.join()
+    clearer.join()
+    # The flush was done before clearing, which left nothing to write or to get.
+    eq_(filesdb.conn.execute("SELECT count(*) FROM files").fetchone()[0], 0)
+    assert filesdb.get(p, "digest") is None
+    assert filesdb.get(p, "digest_partial") is None
+    assert filesdb._flush_timer is None
+
+
+def test_filesdb_doesnt_schedule_flushes_before_connecting(tmpdir):
+    db = fs.FilesDB()
+    p = Path(str(tmpdir), "foo")
+    p.touch()
+    db.put(p, "digest", b"foo_digest")
+    assert db._flush_timer is None
+    eq_(db.get(p, "digest"), b"foo_digest")
+
+
+def test_filesdb_uses_wal(filesdb):
+    eq_(filesdb.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+
+def test_filesdb_finds_renamed_file(tmpdir, filesdb):
+    p = Path(str(tmpdir), "foo")
+    p.write_bytes(b"foo")
+    filesdb.put(p, "digest", b"foo_digest")
+    filesdb.flush()
+    newpath = p.rename(Path(str(tmpdir), "bar"))
+    eq_(filesdb.get(newpath, "digest"), b"foo_digest")
+    filesdb.flush()
+    eq_(filesdb.conn.execute("SELECT path FROM files").fetchall(), [(str(newpath),)])
+
+
+def test_filesdb_copies_entry_for_hardlinks(tmpdir, filesdb):
+    p = Path(str(tmpdir), "foo")
+    p.write_bytes(b"foo")
+    filesdb.put(p, "digest", b"foo_digest")
+    filesdb.flush()
+    link = Path(str(tmpdir), "bar")
+    os.link(str(p), str(link))
+    eq_(filesdb.get(link, "digest"), b"foo_digest")
+    filesdb.flush()
+    eq_(filesdb.conn.execute("SELECT count(*) FROM files").fetchone()[0], 2)
+
+
+def test_filesdb_put_on_changed_file_resets_other_digests(tmpdir, filesdb):
+    p = Path(str(tmpdir), "foo")
+    p.write_bytes(b"foo")
+    filesdb.put(p, "digest", b"foo_digest")
+    filesdb.flush()
+    p.write_bytes(b"foobar")
+    filesdb.put(p, "digest_partial", b"foobar_partial")
+    filesdb.flush()
+    eq_(filesdb.get(p, "digest_partial"), b"foobar_partial")
+    eq_(filesdb.get(p, "digest"), None)
+
+
+def test_filesdb_upgrade_keeps_entries(tmpdir):
+    dbpath = str(Path(str(tmpdir), "hash_cache.db"))
+    conn = sqlite3.connect(dbpath)
+    conn.execute("CREATE TABLE schema_version (version int PRIMARY KEY, description TEXT)")
+    conn.execute("INSERT INTO schema_version VALUES (1, 'v1')")
+    conn.execute(
+        """CREATE TABLE files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, entry_dt DATETIME,
+        digest BLOB, digest_partial BLOB, digest_samples BLOB)"""
+    )
+    conn.execute("INSERT INTO files (path, size, mtime_ns, digest) VALUES ('foo', 1, 2, 'digest')")
+    conn.commit()
+    conn.close()
+    db = fs.FilesDB()
+    db.connect(dbpath)
+    eq_(
+        db.conn.execute("SELECT path, algorithm, digest, dev, ino FROM files").fetchall(),
+        [("foo", fs.DEFAULT_HASHER, "digest", None, None)],
+    )
+    db.close()
+
+
+@pytest.fixture
+def restore_hasher(monkeypatch):
+    # set_hasher() changes module globals, have monkeypatch restore them.
+    monkeypatch.setattr(fs, "hasher", fs.hasher)
+    monkeypatch.setattr(fs, "hasher_name", fs.hasher_name)
+
+
+@pytest.mark.parametrize("name", sorted(fs.HASHERS))
+def test_hashers_have_hashlib_interface(name):
+    h = fs.HASHERS[name](b"foo")
+    h.update(b"bar")
+    eq_(h.digest(), fs.HASHERS[name](b"foobar").digest())
+
+
+def test_set_hasher(tmpdir, restore_hasher):
+    p = Path(str(tmpdir), "foo")
+    p.write_bytes(b"foobar")
+    fs.set_hasher("md5")
+    eq_(fs.File(p).digest, hashlib.md5(b"foobar").digest())
+    with pytest.raises(ValueError):
+        fs.set_hasher("foobar")
+    eq_(fs.hasher_name, "md5")
+
+
+def test_filesdb_keeps_digests_per_algorithm(tmpdir, filesdb, restore_hasher):
+    p = Path(str(tmpdir), "foo")
+    p.write_bytes(b"foo")
+    fs.set_hasher("md5")
+    filesdb.put(p, "digest", b"md5_digest")
+    fs.set_hasher("blake2b")
+    eq_(filesdb.get(p, "digest"), None)
+    filesdb.put(p, "digest", b"blake2b_digest")
+    filesdb.flush()
+    eq_(filesdb.get(p, "digest"), b"blake2b_digest")
+    fs.set_hasher("md5")
+    eq_(filesdb.get(p, "digest"), b"md5_digest")
+    f = fs.File(p)
+    eq_(filesdb.get_many([f], ["digest"]), {f: {"digest": b"md5_digest"}})
+    eq_(filesdb.conn.execute("SELECT count(*) FROM files").fetchone()[0], 2)
+
+
+def test_folder_digest_is_cached(tmpdir, filesdb, monkeypatch):
+    monkeypatch.setattr(fs, "filesdb", filesdb)
+    p = create_fake_fs_with_random_data(Path(str(tmpdir)))
+    digest = fs.Folder(p).digest
+    monkeypatch.setattr(fs.File, "_calc_digest_field", lambda *args: pytest.fail("unexpected read"))
+    monkeypatch.setattr(filesdb, "get", lambda *args, **kwargs: pytest.fail("unexpected lookup"))
+    eq_(fs.Folder(p).digest, digest)
+    filesdb.flush()
+    eq_(fs.Folder(p).digest, digest)
+
+
+def test_folder_digest_cache_is_invalidated_by_nested_changes(tmpdir, filesdb, monkeypatch):
+    monkeypatch.setattr(fs, "filesdb", filesdb)
+    p = create_fake_fs_with_random_data(Path(str(tmpdir)))
+    folder = fs.Folder(p)
+    digest = folder.digest
+    fingerprint = folder.fingerprint
+    filesdb.flush()
+    p.joinpath("dir1", "file1.test").write_bytes(b"changed")
+    folder = fs.Folder(p)
+    assert folder.fingerprint != fingerprint
+    assert folder.digest != digest
+    [dir2] = [f for f in folder.subfolders if f.name == "dir2"]
+    eq_(dir2.digest, fs.Folder(p.joinpath("dir2")).digest)
@@ -0,0 +1,237 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import os
+import sqlite3
+import threading
+import time
+from os import urandom
+from pathlib import Path
+
+import pytest
+from hscommon.testutil import eq_
+
+from core import fs, hashing
+from core.engine import getmatches_by_contents
+
+
+def create_files(rootpath, contents):
+    result = []
+    for i, data in enumerate(contents):
+        path = Path(str(rootpath), f"file{i}")
+        path.write_bytes(data)
+        result.append(fs.File(path))
+    return result
+
+
+def test_compute_same_digests_as_lazy_read(tmpdir, filesdb):
+    data = urandom(200 * 1024)
+    files = create_files(tmpdir, [data, data, urandom(4 * 1024 * 1024), b"small"])
+    with hashing.DigestPool(max_workers=2) as pool:
+        pool.compute(files, "digest_partial")
+        pool.compute(files, "digest")
+    for f in files:
+        other = fs.File(f.path)
+        eq_(f.digest, other._calc_digest())
+        eq_(f.digest_partial, other.digest_partial)
+    eq_(files[0].digest, files[1].digest)
+
+
+def test_compute_writes_to_filesdb(tmpdir, filesdb):
+    files = create_files(tmpdir, [urandom(1024) for _ in range(3)])
+    with hashing.DigestPool() as pool:
+        pool.compute(files, "digest")
+    for f in files:
+        eq_(filesdb.get(f.path, "digest"), f.digest)
+
+
+def test_compute_uses_filesdb(tmpdir, filesdb):
+    [f] = create_files(tmpdir, [b"foobar"])
+    filesdb.put(f.path, "digest", b"cached")
+    with hashing.DigestPool() as pool:
+        pool.compute([f], "digest")
+    eq_(f.digest, b"cached")
+
+
+def test_compute_ignores_other_objects(tmpdir, filesdb):
+    class NotAFile:
+        digest = "foo"
+
+    o = NotAFile()
+    with hashing.DigestPool() as pool:
+        pool.compute([o], "digest")
+    eq_(o.digest, "foo")
+
+
+def test_getmatches_by_contents_on_real_files(tmpdir, filesdb):
+    data = urandom(100 * 1024)
+    other = bytearray(data)
+    other[-1] ^= 0xFF  # same size, same partial digest, different contents
+    files = create_files(tmpdir, [data, data, bytes(other)])
+    for f in files:
+        f.is_ref = False
+    [match] = getmatches_by_contents(files, hash_workers=2)
+    eq_({match.first, match.second}, set(files[:2]))
+
+
+def test_prefetch_seeds_digests(tmpdir, filesdb, monkeypatch):
+    files = create_files(tmpdir, [b"foo", b"bar"])
+    filesdb.put(files[0].path, "digest", b"cached")
+    with hashing.DigestPool() as pool:
+        pool.prefetch(files)
+        eq_(files[0].digest, b"cached")
+        # The second file is known not to be cached, the pool doesn't look it up again.
+        monkeypatch.setattr(filesdb, "get", lambda *a, **kw: pytest.fail("unexpected lookup"))
+        pool.compute(files, "digest")
+    eq_(files[1].digest, files[1]._calc_digest())
+
+
+def test_split_by_contents(tmpdir, filesdb):
+    data = urandom(3 * 1024 * 1024 + 42)
+    other = bytearray(data)
+    other[-1] ^= 0xFF
+    files = create_files(tmpdir, [data, bytes(other), data, bytes(other), urandom(len(data))])
+    with hashing.DigestPool() as pool:
+        result = pool.split_by_contents([files[:4], files[3:]])
+    eq_(sorted(sorted(f.name for f in group) for group in result), [["file0", "file2"], ["file1", "file3"]])
+    # Identical files were read entirely, their digest is known and cached
+    for f in files[:4]:
+        eq_(object.__getattribute__(f, "digest"), fs.File(f.path)._calc_digest())
+        eq_(filesdb.get(f.path, "digest"), f.digest)
+    assert object.__getattribute__(files[4], "digest") is fs.NOT_SET
+
+
+def test_split_by_contents_leaves_unreadable_files_out(tmpdir, filesdb, monkeypatch):
+    data = urandom(3 * 1024 * 1024)
+    files = create_files(tmpdir, [data] * 3)
+    readinto = fs.readinto
+
+    def failing_readinto(fp, view):
+        if fp.name == str(files[1].path) and fp.tell() > 0:
+            raise OSError("I/O error")
+        return readinto(fp, view)
+
+    monkeypatch.setattr(fs, "readinto", failing_readinto)
+    with hashing.DigestPool() as pool:
+        [group] = pool.split_by_contents([files])
+    eq_([f.name for f in group], ["file0", "file2"])
+
+
+def test_split_by_digest_when_comparing_fails(tmpdir, filesdb, monkeypatch):
+    data = urandom(1024)
+    files = create_files(tmpdir, [data, urandom(1024), data])
+    files.append(fs.File(Path(str(tmpdir), "missing")))
+    files[3].size = len(data)
+
+    def fail(files):
+        raise MemoryError()
+
+    monkeypatch.setattr(hashing, "_split_by_contents", fail)
+    with hashing.DigestPool() as pool:
+        [group] = pool.split_by_contents([files])
+    eq_([f.name for f in group], ["file0", "file2"])
+    eq_(files[0].digest, fs.File(files[0].path)._calc_digest())
+
+
+def test_can_split_by_contents(tmpdir):
+    files = create_files(tmpdir, [b"foo"] * 4)
+    assert hashing.can_split_by_contents(files[:3])
+    assert not hashing.can_split_by_contents(files)
+    files[0].digest = b"known"
+    assert not hashing.can_split_by_contents(files[:3])
+
+
+def test_work_is_queued_per_device_in_inode_order(tmpdir, filesdb, monkeypatch):
+    files = create_files(tmpdir, [urandom(1024) for _ in range(6)])
+    for i, f in enumerate(files):
+        f.dev = i % 2
+        f.inode = 10 - i
+    order = []
+    monkeypatch.setattr(hashing, "_load_digest", lambda file, *args: order.append(file) or (None, b"", False))
+    with hashing.DigestPool(max_workers=1, device_workers={1: 2}) as pool:
+        pool.compute(files, "digest")
+        eq_(set(pool._executors), {0, 1})
+        eq_(pool._executors[1]._max_workers, 2)
+    eq_([f for f in order if f.dev == 0], [files[4], files[2], files[0]])
+
+
+def test_few_workers_per_device_by_default():
+    with hashing.DigestPool(device_workers={1: 1}) as pool:
+        eq_(pool._get_executor(0)._max_workers, hashing.DEFAULT_WORKERS)
+        eq_(pool._get_executor(1)._max_workers, 1)
+
+
+@pytest.mark.skipif("not hasattr(os, 'link')")
+def test_hardlinks_are_hashed_once(tmpdir, filesdb, monkeypatch):
+    [f] = create_files(tmpdir, [urandom(1024)])
+    link = Path(str(tmpdir), "link")
+    os.link(str(f.path), str(link))
+    files = [fs.File(f.path), fs.File(link)]
+    calls = []
+    load_digest = hashing._load_digest
+    monkeypatch.setattr(hashing, "_load_digest", lambda *args: calls.append(args) or load_digest(*args))
+    with hashing.DigestPool() as pool:
+        pool.compute(files, "digest")
+    eq_(len(calls), 1)
+    eq_(files[0].digest, files[1].digest)
+    eq_(filesdb.get(link, "digest"), files[1].digest)
+
+
+def test_warm_writes_to_filesdb_only(tmpdir, filesdb):
+    files = create_files(tmpdir, [urandom(1024), b"small"])
+    filesdb.put(files[1].path, "digest", b"cached")
+    with hashing.DigestPool() as pool:
+        pool.warm(files, "digest_partial")
+    # Small files are hashed entirely
+    eq_(filesdb.get(files[0].path, "digest"), fs.File(files[0].path)._calc_digest())
+    eq_(filesdb.get(files[1].path, "digest"), b"cached")
+    assert all(object.__getattribute__(f, "digest") is fs.NOT_SET for f in files)
+
+
+def test_warm_tasks_are_cancelled_on_error(tmpdir, filesdb, monkeypatch):
+    files = create_files(tmpdir, [urandom(1024) for _ in range(10)])
+    calls = []
+    monkeypatch.setattr(hashing, "_warm_digest", lambda *args: calls.append(args))
+    with pytest.raises(ZeroDivisionError):
+        with hashing.DigestPool(max_workers=1) as pool:
+            # The only worker is kept busy until we're out of the with block.
+            blocker = pool._get_executor(files[0].dev).submit(lambda: time.sleep(0.1))
+            pool.warm(files, "digest")
+            1 / 0
+    assert blocker.done()
+    eq_(calls, [])
+
+
+def test_warm_blocks_when_too_many_tasks_are_pending(tmpdir, filesdb, monkeypatch):
+    files = create_files(tmpdir, [urandom(1024) for _ in range(5)])
+    monkeypatch.setattr(hashing, "MAX_WARMING_TASKS", 2)
+    unblock = threading.Event()
+    calls = []
+    monkeypatch.setattr(hashing, "_warm_digest", lambda *args: unblock.wait() and calls.append(args))
+    with hashing.DigestPool(max_workers=1) as pool:
+        warmer = threading.Thread(target=pool.warm, args=(files, "digest"))
+        warmer.start()
+        time.sleep(0.1)
+        # The worker is stuck on the first file and the second one is queued, the rest has to wait.
+        assert warmer.is_alive()
+        eq_(len(pool._warming), 2)
+        unblock.set()
+        warmer.join(1)
+        assert not warmer.is_alive()
+    eq_(len(calls), 5)
+    # Done tasks don't pile up
+    eq_(pool._warming, set())
+
+
+def test_warm_errors_are_logged(tmpdir, filesdb, monkeypatch, caplog):
+    [f] = create_files(tmpdir, [urandom(1024)])
+
+    def fail(file, field):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(hashing, "_warm_digest", fail)
+    with hashing.DigestPool() as pool:
+        pool.warm([f], "digest")
+    assert "database is locked" in caplog.text
+    assert str(f.path) in caplog.text
@@ -43,6 +43,15 @@ def test_multiple():
     eq_(4, len(il))
 
 
+def test_any_ignored():
+    il = IgnoreList()
+    il.ignore("foo", "bar")
+    assert il.any_ignored(["bar", "baz", "foo"])
+    assert il.any_ignored(["foo", "bar"])
+    assert not il.any_ignored(["foo", "baz"])
+    assert not il.any_ignored([])
+
+
 def test_clear():
     il = IgnoreList()
     il.ignore("foo", "bar")
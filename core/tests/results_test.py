@@ -516,6 +516,22 @@ class TestCaseResultsXML:
         eq_(["ibabtu"], g2[0].words)
         eq_(["ibabtu"], g2[1].words)
 
+    def test_save_and_load_exact_groups(self):
+        self.results.groups = [engine.ExactGroup(self.objects[:3])]
+        f = io.BytesIO()
+        self.results.save_to_xml(f)
+        f.seek(0)
+        [group_elem] = ET.parse(f).getroot()
+        eq_(group_elem.get("exact"), "y")
+        eq_(len([c for c in group_elem if c.tag == "match"]), 0)
+        f.seek(0)
+        r = Results(DupeGuru())
+        r.load_from_xml(f, self.get_file)
+        [g] = r.groups
+        assert isinstance(g, engine.ExactGroup)
+        eq_(g.ordered, self.objects[:3])
+        eq_(g.percentage, 100)
+
     def test_load_xml_with_filename(self, tmpdir):
         def get_file(path):
             return [f for f in self.objects if str(f.path) == path][0]
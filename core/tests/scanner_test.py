@@ -10,8 +10,8 @@ from hscommon.jobprogress import job
 from pathlib import Path
 from hscommon.testutil import eq_
 
-from core import fs
-from core.engine import getwords, Match
+from core import fs, hashing
+from core.engine import getwords, ExactGroup
 from core.ignore import IgnoreList
 from core.scanner import Scanner, ScanType
 from core.me.scanner import ScannerME
@@ -221,6 +221,26 @@ def test_big_file_partial_hashes(fake_fileexists):
     eq_(len(r), 1)
 
 
+def test_hash_workers_are_passed_to_digest_pool(fake_fileexists, monkeypatch):
+    pools = []
+
+    class DigestPool(hashing.DigestPool):
+        def __init__(self, *args):
+            pools.append(args)
+            super().__init__(*args)
+
+    monkeypatch.setattr(hashing, "DigestPool", DigestPool)
+    s = Scanner()
+    s.scan_type = ScanType.CONTENTS
+    s.hash_workers = 2
+    s.device_hash_workers = {42: 1}
+    f = [no("foo"), no("bar")]
+    f[0].digest = f[0].digest_partial = f[0].digest_samples = "foobar"
+    f[1].digest = f[1].digest_partial = f[1].digest_samples = "foobar"
+    eq_(len(s.get_dupe_groups(f)), 1)
+    eq_(pools, [(2, {42: 1})])
+
+
 def test_min_match_perc_doesnt_matter_for_content_scan(fake_fileexists):
     s = Scanner()
     s.scan_type = ScanType.CONTENTS
@@ -295,6 +315,16 @@ def test_word_weighting(fake_fileexists):
     eq_(m.percentage, 75)  # 16 letters, 12 matching
 
 
+def test_lsh_bands(fake_fileexists):
+    s = Scanner()
+    s.lsh_bands = 8
+    s.lsh_rows = 2
+    f = [no("foo bar baz"), no("baz bar foo"), no("bleh")]
+    r = s.get_dupe_groups(f)
+    eq_(len(r), 1)
+    eq_(len(r[0]), 2)
+
+
 def test_similar_words(fake_fileexists):
     s = Scanner()
     s.match_similar_words = True
@@ -571,8 +601,8 @@ def test_partial_group_match(fake_fileexists):
 def test_dont_group_files_that_dont_exist(tmpdir):
     # when creating groups, check that files exist first. It's possible that these files have
     # been moved during the scan by the user.
-    # In this test, we have to delete one of the files between the get_matches() part and the
-    # get_groups() part.
+    # In this test, we have to delete one of the files between the get_groups() part and the
+    # filtering part.
     s = Scanner()
     s.scan_type = ScanType.CONTENTS
     p = Path(str(tmpdir))
@@ -582,11 +612,11 @@ def test_dont_group_files_that_dont_exist(tmpdir):
         fp.write("foo")
     file1, file2 = fs.get_files(p)
 
-    def getmatches(*args, **kw):
+    def getgroups(*args, **kw):
         file2.path.unlink()
-        return [Match(file1, file2, 100)]
+        return [ExactGroup([file1, file2])]
 
-    s._getmatches = getmatches
+    s._getgroups = getgroups
 
     assert not s.get_dupe_groups([file1, file2])
 
@@ -616,6 +646,48 @@ def test_folder_scan_exclude_subfolder_matches(fake_fileexists):
     eq_(len(s.get_dupe_groups([topf1, topf2, subf1, subf2, otherf])), 2)
 
 
+def test_content_scan_keeps_a_single_ref(fake_fileexists):
+    # Ref files aren't matched together, only the first of them ends up in the group.
+    s = Scanner()
+    s.scan_type = ScanType.CONTENTS
+    f = [no("foo", path=p) for p in ["p1", "p2", "p3", "p4"]]
+    for o in f:
+        o.digest = o.digest_partial = o.digest_samples = b"foobar"
+    f[1].is_ref = f[3].is_ref = True
+    [group] = s.get_dupe_groups(f)
+    eq_(group.ordered, [f[1], f[0], f[2]])
+
+
+def test_content_scan_with_ignored_pair_in_group(fake_fileexists):
+    s = Scanner()
+    s.scan_type = ScanType.CONTENTS
+    f = [no("foo", path=p) for p in ["p1", "p2", "p3"]]
+    for o in f:
+        o.digest = o.digest_partial = o.digest_samples = b"foobar"
+    ignore_list = IgnoreList()
+    ignore_list.ignore(str(f[0].path), str(f[1].path))
+    [group] = s.get_dupe_groups(f, ignore_list=ignore_list)
+    eq_(len(group), 2)
+    assert not isinstance(group, ExactGroup)
+    assert not ignore_list.are_ignored(str(group[0].path), str(group[1].path))
+
+
+def test_folder_scan_doesnt_hash_subfolders_of_matches(fake_fileexists):
+    class UnreadableFolder(NamedObject):
+        @property
+        def digest_partial(self):
+            raise AssertionError("subfolders of matched folders shouldn't be hashed")
+
+    s = Scanner()
+    s.scan_type = ScanType.FOLDERS
+    topf = [no("top folder", size=42, path=p) for p in ["/topf1", "/topf2"]]
+    subf = [UnreadableFolder("sub", size=41, path=p) for p in ["/topf1/top folder", "/topf2/top folder"]]
+    for f in topf:
+        f.digest = f.digest_partial = f.digest_samples = b"some_digest__1"
+    [group] = s.get_dupe_groups(topf + subf)
+    eq_(set(group), set(topf))
+
+
 def test_ignore_files_with_same_path(fake_fileexists):
     # It's possible that the scanner is fed with two file instances pointing to the same path. One
     # of these files has to be ignored
@@ -0,0 +1,140 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+from hscommon.testutil import eq_
+
+from core import fs
+from core.directories import Directories
+from core.snapshot import DirectorySnapshot, SnapshotEntry
+
+OLD_MTIME = 1_000_000_000
+
+
+@pytest.fixture
+def snapshot(tmpdir):
+    result = DirectorySnapshot()
+    result.connect(str(Path(str(tmpdir), "directory_snapshot.db")))
+    yield result
+    result.close()
+
+
+@pytest.fixture
+def folder(tmpdir):
+    path = Path(str(tmpdir), "folder")
+    path.mkdir()
+    path.joinpath("foo").write_bytes(b"foo")
+    path.joinpath("sub").mkdir()
+    os.symlink(str(path.joinpath("foo")), str(path.joinpath("link")))
+    os.utime(str(path), (OLD_MTIME, OLD_MTIME))
+    return path
+
+
+def listing(entries):
+    return sorted((e.name, e.is_dir(), e.is_file(), e.is_symlink()) for e in entries)
+
+
+@pytest.mark.skipif("not hasattr(os, 'symlink')")
+def test_reuse_listing(snapshot, folder):
+    entries = snapshot.scandir(folder)
+    snapshot.flush()
+    reused = snapshot.scandir(folder)
+    assert all(isinstance(e, SnapshotEntry) for e in reused)
+    eq_(listing(reused), listing(entries))
+    eq_((snapshot.listed_count, snapshot.reused_count), (1, 1))
+    foo = next(e for e in reused if e.name == "foo")
+    eq_(foo.path, str(folder.joinpath("foo")))
+    # Files aren't in the snapshot, only their names.
+    folder.joinpath("foo").write_bytes(b"foobar")
+    eq_(fs.File(foo).size, 6)
+    eq_(foo.inode(), folder.joinpath("foo").stat().st_ino)
+
+
+@pytest.mark.skipif("not hasattr(os, 'symlink')")
+def test_list_modified_folder_again(snapshot, folder):
+    snapshot.scandir(folder)
+    snapshot.flush()
+    folder.joinpath("bar").touch()
+    os.utime(str(folder), (OLD_MTIME + 1, OLD_MTIME + 1))
+    entries = snapshot.scandir(folder)
+    assert "bar" in {e.name for e in entries}
+    eq_((snapshot.listed_count, snapshot.reused_count), (2, 0))
+
+
+@pytest.mark.skipif("not hasattr(os, 'symlink')")
+def test_dont_save_racy_listing(snapshot, folder):
+    # The folder was just modified, it could be modified again without its mtime changing.
+    folder.joinpath("bar").touch()
+    snapshot.scandir(folder)
+    snapshot.flush()
+    snapshot.scandir(folder)
+    eq_(snapshot.reused_count, 0)
+
+
+@pytest.mark.skipif("not hasattr(os, 'symlink')")
+def test_get_files_with_snapshot(snapshot, folder):
+    folder.joinpath("sub", "bar").write_bytes(b"bar")
+    os.utime(str(folder.joinpath("sub")), (OLD_MTIME, OLD_MTIME))
+    d = Directories()
+    d.add_path(folder)
+    expected = sorted((str(f.path), f.size) for f in d.get_files())
+    d.snapshot = snapshot
+    eq_(sorted((str(f.path), f.size) for f in d.get_files()), expected)
+    eq_(sorted((str(f.path), f.size) for f in d.get_files()), expected)
+    eq_((snapshot.listed_count, snapshot.reused_count), (0, 2))
+
+
+def test_encode_entries_without_flags():
+    entries = [SnapshotEntry("/folder", "afifo", 0), SnapshotEntry("/folder", "sub", SnapshotEntry.IS_DIR)]
+    decoded = DirectorySnapshot._decode("/folder", DirectorySnapshot._encode(entries))
+    eq_(listing(decoded), listing(entries))
+
+
+@pytest.mark.skipif("not hasattr(os, 'mkfifo')")
+def test_reuse_listing_with_fifo(snapshot, folder):
+    os.mkfifo(str(folder.joinpath("afifo")))
+    os.utime(str(folder), (OLD_MTIME, OLD_MTIME))
+    entries = snapshot.scandir(folder)
+    snapshot.flush()
+    reused = snapshot.scandir(folder)
+    eq_(snapshot.reused_count, 1)
+    eq_(listing(reused), listing(entries))
+    assert ("afifo", False, False, False) in listing(reused)
+
+
+@pytest.mark.skipif("not hasattr(os, 'symlink')")
+def test_listings_of_unknown_schema_are_dropped(tmpdir, folder):
+    dbpath = str(Path(str(tmpdir), "directory_snapshot.db"))
+    snapshot = DirectorySnapshot()
+    snapshot.connect(dbpath)
+    snapshot.scandir(folder)
+    snapshot.close()
+    with sqlite3.connect(dbpath) as conn:
+        conn.execute("UPDATE schema_version SET version=1")
+    snapshot = DirectorySnapshot()
+    snapshot.connect(dbpath)
+    snapshot.scandir(folder)
+    eq_((snapshot.listed_count, snapshot.reused_count), (1, 0))
+    snapshot.close()
+    with sqlite3.connect(dbpath) as conn:
+        version = conn.execute("SELECT version FROM schema_version ORDER BY version DESC").fetchone()[0]
+    eq_(version, DirectorySnapshot.schema_version)
+
+
+@pytest.mark.skipif("not hasattr(os, 'symlink')")
+def test_list_folders_when_the_database_fails(snapshot, folder, caplog):
+    # A locked or corrupt database doesn't stop the scan, folders are listed instead.
+    d = Directories()
+    d.add_path(folder)
+    expected = sorted((str(f.path), f.size) for f in d.get_files())
+    d.snapshot = snapshot
+    snapshot.conn.close()
+    eq_(sorted((str(f.path), f.size) for f in d.get_files()), expected)
+    eq_((snapshot.listed_count, snapshot.reused_count), (2, 0))
+    assert "Couldn't get the listing of" in caplog.text
+    assert "Couldn't put" in caplog.text
@@ -0,0 +1,147 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import time
+from pathlib import Path
+
+import pytest
+from hscommon.testutil import eq_
+
+from core import watch
+from core.directories import Directories, DirectoryState
+from core.scanner import Scanner, ScanType
+from core.tests.base import TestApp
+
+pytestmark = pytest.mark.skipif("not watch.is_available()")
+
+
+@pytest.fixture
+def root(tmpdir):
+    path = Path(str(tmpdir), "root")
+    path.mkdir()
+    path.joinpath("foo").write_bytes(b"foo")
+    path.joinpath("bar").write_bytes(b"foo")
+    path.joinpath("sub").mkdir()
+    path.joinpath("sub", "baz").write_bytes(b"bazbaz")
+    return path
+
+
+@pytest.fixture
+def watcher(root, filesdb):
+    d = Directories()
+    d.add_path(root)
+    result = watch.DirectoryWatcher(d)
+    result.settle_delay = 0.05
+    result.start()
+    yield result
+    result.stop()
+
+
+def wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def contents_scanner():
+    s = Scanner()
+    s.scan_type = ScanType.CONTENTS
+    return s
+
+
+def group_names(groups):
+    return sorted(sorted(f.name for f in g) for g in groups)
+
+
+def test_initial_walk(watcher, root):
+    eq_(set(watcher.files), {str(root.joinpath(name)) for name in ["foo", "bar", "sub/baz"]})
+    eq_(group_names(watcher.get_dupe_groups(contents_scanner())), [["bar", "foo"]])
+
+
+def test_new_files_are_hashed(watcher, root, filesdb):
+    path = root.joinpath("sub", "new")
+    path.write_bytes(b"bazbaz")
+    wait_for(lambda: filesdb.get(path, "digest") is not None)
+    assert str(path) in watcher.files
+    eq_(group_names(watcher.get_dupe_groups(contents_scanner())), [["bar", "foo"], ["baz", "new"]])
+
+
+def test_only_changed_sizes_are_matched_again(watcher, root):
+    s = contents_scanner()
+    get_dupe_groups = s.get_dupe_groups
+    matched = []
+    s.get_dupe_groups = lambda files, *args: matched.append(files) or get_dupe_groups(files, *args)
+    [foo_group] = watcher.get_dupe_groups(s)
+    root.joinpath("other").write_bytes(b"bazbaz")
+    wait_for(lambda: str(root.joinpath("other")) in watcher.files)
+    groups = watcher.get_dupe_groups(s)
+    eq_(group_names(groups), [["bar", "foo"], ["baz", "other"]])
+    eq_(sorted(f.name for f in matched[-1]), ["baz", "other"])
+    # Groups of sizes that didn't change aren't matched again, but they're new instances.
+    assert all(g is not foo_group for g in groups)
+    root.joinpath("bar").write_bytes(b"bar")
+    wait_for(lambda: watcher._dirty_sizes == {3})
+    eq_(group_names(watcher.get_dupe_groups(s)), [["baz", "other"]])
+    eq_(sorted(f.name for f in matched[-1]), ["bar", "foo"])
+
+
+def test_reused_groups_arent_affected_by_results_changes(watcher, root):
+    s = contents_scanner()
+    [foo_group] = watcher.get_dupe_groups(s)
+    foo_group.remove_dupe(foo_group.dupes[0])
+    root.joinpath("sub", "other").write_bytes(b"bazbaz")
+    wait_for(lambda: str(root.joinpath("sub", "other")) in watcher.files)
+    groups = watcher.get_dupe_groups(s)
+    eq_(group_names(groups), [["bar", "foo"], ["baz", "other"]])
+    assert all(g.ref is not None for g in groups)
+
+
+def test_folder_changes(watcher, root):
+    root.joinpath("sub").rename(root.joinpath("moved"))
+    wait_for(lambda: str(root.joinpath("moved", "baz")) in watcher.files)
+    assert str(root.joinpath("sub", "baz")) not in watcher.files
+    # The moved folder is still watched
+    root.joinpath("moved", "new").write_bytes(b"new")
+    wait_for(lambda: str(root.joinpath("moved", "new")) in watcher.files)
+    root.joinpath("foo").unlink()
+    eq_(group_names(watcher.get_dupe_groups(contents_scanner())), [])
+
+
+def test_excluded_files(root, filesdb):
+    d = Directories()
+    d.add_path(root)
+    d.set_state(root.joinpath("sub"), DirectoryState.EXCLUDED)
+    with watch.DirectoryWatcher(d) as watcher:
+        watcher.start()
+        eq_(set(watcher.files), {str(root.joinpath("foo")), str(root.joinpath("bar"))})
+        root.joinpath("sub", "new").write_bytes(b"foo")
+        watcher._apply_changes()
+        assert str(root.joinpath("sub", "new")) not in watcher.files
+
+
+def test_app_rescans_watched_folders(root, monkeypatch):
+    app = TestApp().app
+    monkeypatch.setattr(app.progress_window, "run_threaded", lambda target, args: target(*args))
+    app.directories.add_path(root)
+    app.options["scan_type"] = ScanType.CONTENTS
+    app.options["watch_folders"] = True
+    app.start_scanning()
+    watcher = app.watcher
+    watcher.settle_delay = 0.05
+    eq_(group_names(app.results.groups), [["bar", "foo"]])
+    root.joinpath("new").write_bytes(b"bazbaz")
+    wait_for(lambda: str(root.joinpath("new")) in watcher.files)
+    app.start_scanning()
+    assert app.watcher is watcher
+    eq_(group_names(app.results.groups), [["bar", "foo"], ["baz", "new"]])
+    # Results are matched again when the ignore list changes
+    app.ignore_list.ignore(str(root.joinpath("bar")), str(root.joinpath("foo")))
+    app.start_scanning()
+    assert app.watcher is watcher
+    eq_(group_names(app.results.groups), [["baz", "new"]])
+    app.options["watch_folders"] = False
+    app.start_scanning()
+    assert app.watcher is None
+    assert watcher._thread is None
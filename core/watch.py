@@ -0,0 +1,441 @@
+# This software is licensed under the "GPLv3" License as described in the "LICENSE" file,
+# which should be included with this package. The terms are also available at
+# http://www.gnu.org/licenses/gpl-3.0.html
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from threading import Event, RLock, Thread
+
+from hscommon.jobprogress import job
+
+from core import engine, fs, hashing
+from core.directories import DirectoryState
+from core.scanner import ScanType
+
+# From <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+# Files are looked at again once they've been written (not on every write), and whenever they
+# appear, disappear or have their mtime changed.
+WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+# struct inotify_event {int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[];}
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc()
+
+
+def is_available():
+    """Returns whether inotify, and thus :class:`DirectoryWatcher`, can be used on this system."""
+    return _libc is not None
+
+
+def _group_source(group):
+    # Returns what ``group`` can be built again from, as (files, matches). Results modify the groups
+    # they're given, so groups themselves can't be kept from one call to get_dupe_groups() to another.
+    if isinstance(group, engine.ExactGroup):
+        return list(group), None
+    return None, list(group.matches)
+
+
+def _build_groups(sources):
+    for files, matches in sources:
+        if matches is None:
+            yield engine.ExactGroup(files)
+        else:
+            yield from engine.get_groups(list(matches))
+
+
+def _raise_errno(path=None):
+    code = ctypes.get_errno()
+    raise OSError(code, os.strerror(code), path)
+
+
+class Inotify:
+    """A minimal wrapper around Linux's inotify API.
+
+    Raises :class:`OSError` if inotify isn't available.
+    """
+
+    def __init__(self):
+        if _libc is None:
+            raise OSError(errno.ENOSYS, "inotify isn't available on this system")
+        self.fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            _raise_errno()
+
+    def add_watch(self, path, mask=WATCH_MASK):
+        """Watches folder ``path`` and returns the watch descriptor for its events."""
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            _raise_errno(path)
+        return wd
+
+    def rm_watch(self, wd):
+        # Fails if the watch was already removed by the kernel (its folder was deleted), that's fine.
+        _libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout=None):
+        """Returns a list of ``(wd, mask, cookie, name)`` events.
+
+        Waits at most ``timeout`` seconds for events, returns an empty list if none came.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        result = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            result.append((wd, mask, cookie, name))
+        return result
+
+    def close(self):
+        os.close(self.fd)
+
+
+class DirectoryWatcher:
+    """Keeps the files under the folders of a :class:`~core.directories.Directories` up to date.
+
+    :meth:`start` walks the folders once, and from then on, inotify tells us what changed. Changes
+    are applied in a background thread, which also hashes new and modified files into
+    :data:`~core.fs.filesdb` (and computes the blocks of pictures into the picture cache) as soon
+    as they're written, so that they're ready when results are needed.
+
+    :meth:`get_dupe_groups` returns up to date results without walking the folders again. For
+    Contents scans, only files of a size that was touched by a change since the previous call are
+    matched again, groups of other sizes are built again from the previous ones. Changes to the
+    scan options, the ignore list or the folder selection aren't tracked, call :meth:`invalidate`
+    or :meth:`start` again after making them.
+
+    Only available on Linux, see :func:`is_available`.
+
+    :param directories: :class:`~core.directories.Directories` to watch.
+    :param fileclasses: List of candidate :class:`~core.fs.File` classes.
+    :param picture_cache_path: Path of the picture cache to keep up to date, if any.
+    :param hash_workers: Number of threads used to hash files on each device, see
+                         :class:`~core.hashing.DigestPool`.
+    :param device_hash_workers: ``{st_dev: hash_workers}`` for devices needing a different number of
+                                threads than ``hash_workers``.
+    """
+
+    # Changes are applied once no event came for this many seconds, files often get several events in
+    # a row, or after max_delay seconds if events keep coming.
+    settle_delay = 1.0
+    max_delay = 10.0
+
+    def __init__(
+        self, directories, fileclasses=None, picture_cache_path=None, hash_workers=None, device_hash_workers=None
+    ):
+        self.directories = directories
+        self.fileclasses = fileclasses if fileclasses is not None else [fs.File]
+        self.picture_cache_path = picture_cache_path
+        self.hash_workers = hash_workers
+        self.device_hash_workers = device_hash_workers
+        # {path: File}, guarded by _lock like everything below
+        self.files = {}
+        self._size_counts = Counter()
+        # {size: [(files, matches)]} of the last Contents results (see _group_source()), None if
+        # everything has to be matched again
+        self._size_groups = None
+        self._generation = 0
+        self._dirty_sizes = set()
+        # Changed file paths and removed folder paths, since the last time changes were applied
+        self._changed = set()
+        self._removed_folders = set()
+        self._changed_since = None
+        self._needs_walk = False
+        self._lock = RLock()
+        # {wd: folder path} and {folder path: wd}
+        self._wd2path = {}
+        self._path2wd = {}
+        self._inotify = None
+        self._thread = None
+        self._stop_event = Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    # ---Private
+    def _watch_tree(self, path, mark_files=False):
+        # Watches folder ``path`` and its subfolders, like Directories.get_files() walks them.
+        stack = [path]
+        while stack:
+            folder = stack.pop()
+            folder_path = Path(folder)
+            state = self.directories.get_state(folder_path)
+            try:
+                if folder not in self._path2wd:
+                    wd = self._inotify.add_watch(folder)
+                    self._wd2path[wd] = folder
+                    self._path2wd[folder] = wd
+                with os.scandir(folder) as iter:
+                    entries = list(iter)
+            except OSError as e:
+                logging.warning("Could not watch folder '%s': %s", folder, e)
+                continue
+            skip_dirs = self.directories._skip_subfolders(folder_path, state)
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if not skip_dirs:
+                            stack.append(entry.path)
+                    elif mark_files:
+                        self._changed.add(entry.path)
+                except OSError:
+                    pass
+
+    def _unwatch_tree(self, path):
+        prefix = path + os.sep
+        for folder, wd in list(self._path2wd.items()):
+            if folder == path or folder.startswith(prefix):
+                self._inotify.rm_watch(wd)
+                del self._path2wd[folder]
+                del self._wd2path[wd]
+
+    def _walk(self, j=job.nulljob):
+        with self._lock:
+            for wd in self._wd2path:
+                self._inotify.rm_watch(wd)
+            self._wd2path = {}
+            self._path2wd = {}
+            # Watch first, changes made during the walk will be seen.
+            for path in self.directories:
+                self._watch_tree(str(path))
+            files = self.directories.get_files(fileclasses=self.fileclasses, j=j)
+            self.files = {str(f.path): f for f in files}
+            self._size_counts = Counter(f.size for f in self.files.values())
+            self._changed = set()
+            self._removed_folders = set()
+            self._changed_since = None
+            self._needs_walk = False
+            self.invalidate()
+
+    def _handle_events(self, events):
+        with self._lock:
+            for wd, mask, _, name in events:
+                if mask & IN_Q_OVERFLOW:
+                    logging.warning("Too many changes at once in watched folders, they will be walked again")
+                    self._needs_walk = True
+                    continue
+                folder = self._wd2path.get(wd)
+                if folder is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self._wd2path[wd]
+                    if self._path2wd.get(folder) == wd:
+                        del self._path2wd[folder]
+                    continue
+                if not name:
+                    continue
+                path = os.path.join(folder, name)
+                if mask & IN_ISDIR:
+                    if mask & (IN_DELETE | IN_MOVED_FROM):
+                        self._unwatch_tree(path)
+                        self._removed_folders.add(path)
+                    elif mask & (IN_CREATE | IN_MOVED_TO):
+                        # Files may have been created in the folder before we started watching it.
+                        self._watch_tree(path, mark_files=True)
+                else:
+                    self._changed.add(path)
+                if self._changed_since is None:
+                    self._changed_since = time.monotonic()
+
+    def _get_file(self, path):
+        path = Path(path)
+        try:
+            state = self.directories.get_file_state(path)
+            if state == DirectoryState.EXCLUDED:
+                return None
+            fileclass = fs.get_fileclass(path, fileclasses=self.fileclasses)
+            if fileclass is None:
+                return None
+            file = fileclass(path)
+            file.is_ref = state == DirectoryState.REFERENCE
+            file._read_info("size")
+            return file
+        except (OSError, fs.InvalidPath):
+            return None
+
+    def _remove_file(self, path):
+        file = self.files.pop(path, None)
+        if file is not None:
+            self._size_counts[file.size] -= 1
+            self._dirty_sizes.add(file.size)
+
+    def _apply_changes(self):
+        # Returns new and modified files.
+        with self._lock:
+            if self._needs_walk and self._inotify is not None:
+                self._walk()
+                return []
+            removed_folders, self._removed_folders = self._removed_folders, set()
+            changed, self._changed = self._changed, set()
+            self._changed_since = None
+            for folder in removed_folders:
+                prefix = folder + os.sep
+                for path in [p for p in self.files if p.startswith(prefix)]:
+                    self._remove_file(path)
+            result = []
+            for path in changed:
+                self._remove_file(path)
+                file = self._get_file(path)
+                if file is not None:
+                    self.files[path] = file
+                    self._size_counts[file.size] += 1
+                    self._dirty_sizes.add(file.size)
+                    result.append(file)
+            return result
+
+    def _hash(self, files):
+        # Files sharing their size with another file will most likely be fully hashed by the next scan.
+        with hashing.DigestPool(self.hash_workers, self.device_hash_workers) as pool:
+            pool.compute([f for f in files if f.size], "digest_partial")
+            pool.compute([f for f in files if f.size and self._size_counts[f.size] > 1], "digest")
+        if not self.picture_cache_path:
+            return
+        # Only needed in picture mode, which the other modes shouldn't have to load.
+        from core.pe import matchblock
+        from core.pe.photo import Photo
+
+        pictures = [f for f in files if isinstance(f, Photo)]
+        if pictures:
+            cache = matchblock.get_cache(self.picture_cache_path)
+            try:
+                for picture in pictures:
+                    path = str(picture.path)
+                    try:
+                        if path in cache:
+                            del cache[path]
+                        cache[path] = picture.get_blocks(matchblock.BLOCK_COUNT_PER_SIDE)
+                    except (OSError, ValueError) as e:
+                        logging.warning("Could not read picture '%s': %s", path, e)
+            finally:
+                cache.close()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                events = self._inotify.read(timeout=self.settle_delay)
+                if events:
+                    self._handle_events(events)
+                    changed_since = self._changed_since
+                    if changed_since is not None and time.monotonic() - changed_since < self.max_delay:
+                        continue
+                if self._changed or self._removed_folders or self._needs_walk:
+                    self._hash(self._apply_changes())
+            except Exception:
+                logging.exception("Error while watching folders")
+
+    # ---Public
+    def start(self, j=job.nulljob):
+        """Walks the watched folders and starts watching them for changes.
+
+        Raises :class:`OSError` if inotify isn't available.
+        """
+        self.stop()
+        self._inotify = Inotify()
+        self._walk(j)
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, name="DirectoryWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops watching folders. Files and results are kept, but won't be updated anymore."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._wd2path = {}
+            self._path2wd = {}
+
+    def invalidate(self):
+        """Makes the next :meth:`get_dupe_groups` call match all files again."""
+        with self._lock:
+            self._size_groups = None
+            self._dirty_sizes = set()
+            self._generation += 1
+
+    def get_dupe_groups(self, scanner, ignore_list=None, j=job.nulljob):
+        """Returns the groups :meth:`~core.scanner.Scanner.get_dupe_groups` would for watched files.
+
+        Changes that weren't applied yet are applied first.
+        """
+        self._apply_changes()
+        with self._lock:
+            files = list(self.files.values())
+            size_groups = self._size_groups
+            dirty_sizes, self._dirty_sizes = self._dirty_sizes, set()
+            generation = self._generation
+        if scanner.scan_type != ScanType.CONTENTS:
+            return scanner.get_dupe_groups(files, ignore_list, j)
+        if size_groups is None:
+            size_groups = {}
+        else:
+            size_groups = dict(size_groups)
+            files = [f for f in files if f.size in dirty_sizes]
+            for size in dirty_sizes:
+                size_groups.pop(size, None)
+        logging.info("Matching %d watched files again", len(files))
+        try:
+            groups = scanner.get_dupe_groups(files, ignore_list, j)
+        except Exception:
+            # The sizes that had to be matched again are forgotten, match everything next time.
+            self.invalidate()
+            raise
+        # Sizes that weren't matched again
+        reused = [source for sources in size_groups.values() for source in sources]
+        for group in groups:
+            size_groups.setdefault(group.ref.size, []).append(_group_source(group))
+        with self._lock:
+            if self._generation == generation:
+                self._size_groups = size_groups
+        # Their groups are built again, and go through the same last step as new ones
+        return groups + scanner.prepare_groups(list(_build_groups(reused)))
@@ -194,6 +194,9 @@ class DupeGuru(QObject):
         self.model.options["match_scaled"] = self.prefs.match_scaled
         self.model.options["include_exists_check"] = self.prefs.include_exists_check
         self.model.options["rehash_ignore_mtime"] = self.prefs.rehash_ignore_mtime
+        self.model.options["hash_algorithm"] = self.prefs.hash_algorithm
+        self.model.options["hash_workers"] = self.prefs.hash_workers
+        self.model.options["watch_folders"] = self.prefs.watch_folders
 
         if self.details_dialog:
             self.details_dialog.update_options()
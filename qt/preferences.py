@@ -11,6 +11,7 @@ from PyQt5.QtGui import QColor
 from hscommon import trans
 from hscommon.plat import ISLINUX
 from core.app import AppMode
+from core.fs import DEFAULT_HASHER
 from core.scanner import ScanType
 from hscommon.util import tryint
 from qt.util import create_qsettings
@@ -162,6 +163,9 @@ class Preferences(PreferencesBase):
         self.use_regexp = get("UseRegexp", self.use_regexp)
         self.remove_empty_folders = get("RemoveEmptyFolders", self.remove_empty_folders)
         self.rehash_ignore_mtime = get("RehashIgnoreMTime", self.rehash_ignore_mtime)
+        self.hash_algorithm = get("HashAlgorithm", self.hash_algorithm)
+        self.hash_workers = get("HashWorkers", self.hash_workers)
+        self.watch_folders = get("WatchFolders", self.watch_folders)
         self.include_exists_check = get("IncludeExistsCheck", self.include_exists_check)
         self.debug_mode = get("DebugMode", self.debug_mode)
         self.profile_scan = get("ProfileScan", self.profile_scan)
@@ -233,6 +237,9 @@ class Preferences(PreferencesBase):
         self.ignore_hardlink_matches = False
         self.remove_empty_folders = False
         self.rehash_ignore_mtime = False
+        self.hash_algorithm = DEFAULT_HASHER
+        self.hash_workers = 0
+        self.watch_folders = False
         self.include_exists_check = True
         self.debug_mode = False
         self.profile_scan = False
@@ -286,6 +293,9 @@ class Preferences(PreferencesBase):
         set_("UseRegexp", self.use_regexp)
         set_("RemoveEmptyFolders", self.remove_empty_folders)
         set_("RehashIgnoreMTime", self.rehash_ignore_mtime)
+        set_("HashAlgorithm", self.hash_algorithm)
+        set_("HashWorkers", self.hash_workers)
+        set_("WatchFolders", self.watch_folders)
         set_("IncludeExistsCheck", self.include_exists_check)
         set_("DebugMode", self.debug_mode)
         set_("ProfileScan", self.profile_scan)
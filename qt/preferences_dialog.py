@@ -35,6 +35,7 @@ from hscommon.trans import trget
 from hscommon.plat import ISLINUX
 from qt.util import horizontal_wrap, move_to_screen_center
 from qt.preferences import get_langnames
+from core.fs import HASHERS
 from enum import Flag, auto
 
 from qt.preferences import Preferences
@@ -228,6 +229,22 @@ most users should not have to modify these."
         self.advanced_vlayout.addWidget(self.include_exists_check_box)
         self._setupAddCheckbox("rehash_ignore_mtime_box", tr("Ignore difference in mtime when loading cached digests"))
         self.advanced_vlayout.addWidget(self.rehash_ignore_mtime_box)
+        self.hash_algorithm_label = QLabel(tr("Hash algorithm:"), self)
+        self.hash_algorithm_combobox = QComboBox(self)
+        for name in sorted(HASHERS):
+            self.hash_algorithm_combobox.addItem(name, userData=name)
+        self.advanced_vlayout.addLayout(
+            horizontal_wrap([self.hash_algorithm_label, self.hash_algorithm_combobox, None])
+        )
+        self.hash_workers_label = QLabel(tr("Hashing threads per disk (0 for the default):"), self)
+        self.hash_workers_spinbox = QSpinBox(self)
+        self.hash_workers_spinbox.setRange(0, 64)
+        self.advanced_vlayout.addLayout(horizontal_wrap([self.hash_workers_label, self.hash_workers_spinbox, None]))
+        self._setupAddCheckbox("watch_folders_box", tr("Watch selected folders between scans (Linux only)"))
+        self.watch_folders_box.setToolTip(
+            tr("Rescans then only look at files that changed since the previous scan. Doesn't apply to folder scans.")
+        )
+        self.advanced_vlayout.addWidget(self.watch_folders_box)
 
     def _setupDebugPage(self):
         self._setupAddCheckbox("debugModeBox", tr("Debug mode (restart required)"))
@@ -342,6 +359,10 @@ most users should not have to modify these."
             self.languageComboBox.setCurrentText(selected_lang)
         if section & Sections.ADVANCED:
             setchecked(self.rehash_ignore_mtime_box, prefs.rehash_ignore_mtime)
+            index = self.hash_algorithm_combobox.findData(prefs.hash_algorithm)
+            self.hash_algorithm_combobox.setCurrentIndex(max(index, 0))
+            self.hash_workers_spinbox.setValue(prefs.hash_workers)
+            setchecked(self.watch_folders_box, prefs.watch_folders)
             setchecked(self.include_exists_check_box, prefs.include_exists_check)
         if section & Sections.DEBUG:
             setchecked(self.debugModeBox, prefs.debug_mode)
@@ -360,6 +381,9 @@ most users should not have to modify these."
         prefs.remove_empty_folders = ischecked(self.removeEmptyFoldersBox)
         prefs.ignore_hardlink_matches = ischecked(self.ignoreHardlinkMatches)
         prefs.rehash_ignore_mtime = ischecked(self.rehash_ignore_mtime_box)
+        prefs.hash_algorithm = self.hash_algorithm_combobox.currentData()
+        prefs.hash_workers = self.hash_workers_spinbox.value()
+        prefs.watch_folders = ischecked(self.watch_folders_box)
         prefs.include_exists_check = ischecked(self.include_exists_check_box)
         prefs.debug_mode = ischecked(self.debugModeBox)
         prefs.profile_scan = ischecked(self.profile_scan_box)